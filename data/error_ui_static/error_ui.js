@@ -199,6 +199,95 @@ window.errorUI = (()=>{
     return rows;
   }
 
+  // Prepend the row number to every sample row
+  const createPageRows = (data, index) => {
+    return data.map((sample,i)=>[parseInt(index[i])+1, ...sample]);
+  }
+
+  // Compare two cells for sorting, numbers by value and anything else as text
+  const compareCells = (a, b) => {
+    if (typeof a === 'number' && typeof b === 'number') return a-b;
+    return String(a ?? "").localeCompare(String(b ?? ""));
+  }
+
+  // Loads the pages of sample rows listed in the `manifest` written by
+  // the report, every page is fetched at most once
+  const SamplePages = function (manifest){
+    const loaded = [];
+
+    this.loadPage = (page) => {
+      if(!loaded[page]){
+        loaded[page] = fetch(manifest.pages[page]).then(resp=>{
+          if(!resp.ok) throw new Error(`Failed to load ${manifest.pages[page]}`);
+          return resp.json();
+        });
+      }
+      return loaded[page];
+    };
+
+    // Resolves to the {data, index} of rows `start` up to `end`
+    this.loadRows = (start, end) => {
+      const first = Math.floor(start/manifest.page_size);
+      const last = Math.ceil(end/manifest.page_size);
+      const loads = [];
+      for (let page = first; page < last; page++) {
+        loads.push(this.loadPage(page));
+      }
+      return Promise.all(loads).then(pages=>{
+        const offset = start - first*manifest.page_size;
+        const count = Math.max(end-start, 0);
+        return {
+          data: [].concat(...pages.map(p=>p.data)).slice(offset, offset+count),
+          index: [].concat(...pages.map(p=>p.index)).slice(offset, offset+count)
+        };
+      });
+    };
+
+    this.loadAll = () => this.loadRows(0, manifest.rows);
+
+    // Datatables `ajax` option for server side processing. Only the pages of
+    // the rows shown are loaded, unless the rows are searched or sorted by
+    // another column than the row number.
+    this.ajax = (request, callback) => {
+      const search = request.search.value.toLowerCase();
+      const order = request.order.filter(o=>!(o.column===0 && o.dir==='asc'));
+      const respond = (rows, filtered) => callback({
+        draw: request.draw,
+        recordsTotal: manifest.rows,
+        recordsFiltered: filtered,
+        data: rows
+      });
+      const fail = (err) => {
+        console.error(err);
+        respond([], 0);
+      };
+      if (!search && order.length===0) {
+        const end = request.length<0 ? manifest.rows : Math.min(request.start+request.length, manifest.rows);
+        this.loadRows(request.start, end)
+          .then(({data, index})=>respond(createPageRows(data, index), manifest.rows))
+          .catch(fail);
+        return;
+      }
+      this.loadAll().then(({data, index})=>{
+        let rows = createPageRows(data, index);
+        if (search) {
+          rows = rows.filter(row=>row.some(cell=>String(cell ?? "").toLowerCase().includes(search)));
+        }
+        rows.sort((a, b)=>{
+          for (const {column, dir} of request.order) {
+            const cmp = compareCells(a[column], b[column]);
+            if (cmp!==0) return dir==='asc' ? cmp : -cmp;
+          }
+          return 0;
+        });
+        const end = request.length<0 ? rows.length : request.start+request.length;
+        respond(rows.slice(request.start, end), rows.length);
+      }).catch(fail);
+    };
+
+    return this
+  }
+
   // Formats columns for datatables and adds an index column
   const createDatatableColumns = (columns) => {
     const data_cols = columns.map((c,i)=>({data:i+1, title:c}));
@@ -251,5 +340,5 @@ window.errorUI = (()=>{
     });
   }
 
-  return {ErrorHandler, createDatatableRows, createDatatableColumns, addExcelHeader, selectionSetup, indexToLetters}
+  return {ErrorHandler, SamplePages, createDatatableRows, createDatatableColumns, addExcelHeader, selectionSetup, indexToLetters}
 })();
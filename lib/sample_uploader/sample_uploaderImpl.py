@@ -13,19 +13,26 @@ from installed_clients.SampleServiceClient import SampleService
 from installed_clients.sample_search_apiClient import sample_search_api
 from installed_clients.WorkspaceClient import Workspace as workspaceService
 from sample_uploader.utils.exporter import sample_set_to_output
-from sample_uploader.utils.importer import import_samples_from_file, find_header_row
+from sample_uploader.utils.importer import import_samples_from_file
 from sample_uploader.utils.mappings import SESAR_mappings, ENIGMA_mappings, aliases
 from sample_uploader.utils.sample_utils import (
     sample_set_to_OTU_sheet,
-    update_acls,
-    build_links,
-    expire_data_link
+    propagate_acls,
+    build_links
+)
+from sample_uploader.utils.async_sample_service import (
+    create_data_links,
+    expire_data_link,
+    link_objects
 )
 from sample_uploader.utils.sesar_api import igsns_to_csv
 from sample_uploader.utils.ncbi_api import ncbi_samples_to_csv
 from sample_uploader.utils.misc_utils import get_workspace_user_perms
 from sample_uploader.utils.misc_utils import error_ui as _error_ui
 from sample_uploader.utils.parsing_utils import upload_key_format as _upload_key_format
+from sample_uploader.utils.ontology_cache import ontology_cache
+from sample_uploader.utils.stage_timer import StageTimer
+from sample_uploader.utils.client_hooks import install_client_hooks
 #END_HEADER
 
 
@@ -56,6 +63,7 @@ class sample_uploader:
     # be found
     def __init__(self, config):
         #BEGIN_CONSTRUCTOR
+        install_client_hooks()
         self.callback_url = os.environ['SDK_CALLBACK_URL']
         self.token = os.environ['KB_AUTH_TOKEN']
         self.workspace_url = config['workspace-url']
@@ -86,7 +94,9 @@ class sample_uploader:
            "prevalidate" of Long, parameter "incl_input_in_output" of Long,
            parameter "ignore_warnings" of Long, parameter
            "keep_existing_samples" of Long, parameter "propagate_links" of
-           Long
+           Long, parameter "chunk_size" of Long, parameter
+           "prevalidate_max_errors" of Long, parameter "report_context_rows"
+           of Long, parameter "max_errors" of Long
         :returns: instance of type "ImportSampleOutputs" -> structure:
            parameter "report_name" of String, parameter "report_ref" of
            String, parameter "sample_set" of type "SampleSet" -> structure:
@@ -100,6 +110,7 @@ class sample_uploader:
         #BEGIN import_samples
         print(f"Beginning sample import with following parameters:")
         print(f"params -- {params}")
+        timer = StageTimer()
         sample_set = {"samples": []}
         # Check if we have an existing Sample Set as input
         # if so, download
@@ -119,8 +130,8 @@ class sample_uploader:
         if params.get('header_row_index'):
             header_row_index = int(params["header_row_index"]) - 1
         else:
-            header_row_index = find_header_row(params.get('sample_file'),
-                                               params.get('file_format'))
+            # found while loading the file
+            header_row_index = None
 
         username = ctx['user_id']
 
@@ -129,7 +140,8 @@ class sample_uploader:
                              f"File of format {params.get('file_format')} not supported.")
         mappings = {'enigma': ENIGMA_mappings, 'sesar': SESAR_mappings, 'kbase': {}}
 
-        sample_set, has_unignored_errors, errors, sample_data_json = import_samples_from_file(
+        input_samples = sample_set['samples']
+        sample_set, has_unignored_errors, errors, sample_data = import_samples_from_file(
             params,
             self.sample_url,
             self.workspace_url,
@@ -141,7 +153,8 @@ class sample_uploader:
             mappings[str(params.get('file_format')).lower()].get('column_unit_regex', []),
             sample_set,
             header_row_index,
-            aliases.get(params.get('file_format').lower(), {})
+            aliases.get(params.get('file_format').lower(), {}),
+            stage_timer=timer
         )
 
         file_links = []
@@ -149,52 +162,58 @@ class sample_uploader:
         sample_set_ref = None
 
         # create UI to display the errors clearly
-        html_link = _error_ui(errors, sample_data_json, has_unignored_errors, self.scratch)
+        with timer.stage('error_ui'):
+            html_link = _error_ui(errors, sample_data, has_unignored_errors, self.scratch)
 
         if not has_unignored_errors:
             # only save object if there are no errors
-            obj_info = self.dfu.save_objects({
-                'id': save_ws_id,
-                'objects': [{
-                    "name": set_name,
-                    "type": "KBaseSets.SampleSet",
-                    "data": sample_set
-                }]
-            })[0]
+            with timer.stage('save_sample_set'):
+                obj_info = self.dfu.save_objects({
+                    'id': save_ws_id,
+                    'objects': [{
+                        "name": set_name,
+                        "type": "KBaseSets.SampleSet",
+                        "data": sample_set
+                    }]
+                })[0]
 
             sample_set_ref = '/'.join([str(obj_info[6]), str(obj_info[0]), str(obj_info[4])])
             sample_file_name = os.path.basename(params['sample_file']).split('.')[0] + '_OTU'
 
-            # create a data link between each sample and the sampleset
-            ss = SampleService(self.sample_url)
-            for idx, sample_info in enumerate(sample_set['samples']):
-                sample_id = sample_info['id']
-                version = sample_info['version']
-                sample = ss.get_sample({
-                    'id': sample_id,
-                    'version': version,
+            # create a data link between each sample and the sampleset. samples saved
+            # by this import use their name as node id. Unchanged samples of the file,
+            # also those matched by 'kbase_sample_id', are carried over as fetched, with
+            # their node tree. Only the other samples of the input sample set are fetched.
+            input_versions = {(s['id'], s.get('version')) for s in input_samples}
+            link_samples = []
+            for sample_info in sample_set['samples']:
+                sample_key = (sample_info['id'], sample_info['version'])
+                if sample_info.get('node_tree'):
+                    node = sample_info['node_tree'][0]['id']
+                elif sample_key in input_versions:
+                    node = None
+                else:
+                    node = sample_info['name']
+                link_samples.append({
+                    'id': sample_info['id'],
+                    'version': sample_info['version'],
+                    'node': node
                 })
-                ret = ss.create_data_link(
-                    dict(
-                        upa=sample_set_ref,
-                        id=sample_id,
-                        dataid='samples/{}'.format(idx),
-                        version=version,
-                        node=sample['node_tree'][0]['id'],
-                        update=1,
-                    )
-                )
-                new_data_links.append(ret)
+            with timer.stage('create_data_links'):
+                new_data_links = create_data_links(sample_set_ref, link_samples,
+                                                   self.sample_url, ctx['token'])
+            logging.info('ontology cache: {}'.format(ontology_cache.stats()))
 
             # -- Format outputs below --
             # if output file format specified, add one to output
             if params.get('output_format') in ['csv', 'xls']:
-                otu_path = sample_set_to_OTU_sheet(
-                    sample_set,
-                    sample_file_name,
-                    self.scratch,
-                    params
-                )
+                with timer.stage('otu_sheet'):
+                    otu_path = sample_set_to_OTU_sheet(
+                        sample_set,
+                        sample_file_name,
+                        self.scratch,
+                        params
+                    )
                 file_links.append({
                     'path': otu_path,
                     'name': os.path.basename(otu_path),
@@ -228,8 +247,10 @@ class sample_uploader:
         }
         if file_links:
             report_data['file_links'] = file_links
+        report_data['message'] = f"Time per stage:\n{timer.summary()}"
         if sample_set_ref:
-            report_data['message'] = f"SampleSet object named \"{set_name}\" imported."
+            report_data['message'] = (f"SampleSet object named \"{set_name}\" imported.\n\n" +
+                                      report_data['message'])
             report_data['objects_created'] = [{'ref': sample_set_ref}]
 
         if html_link:
@@ -239,14 +260,17 @@ class sample_uploader:
                 'description': 'HTML Report for Sample Uploader'
             }]
             report_data['direct_html_link_index'] = 0
-        report_info = report_client.create_extended_report(report_data)
+        with timer.stage('create_report'):
+            report_info = report_client.create_extended_report(report_data)
+        timer.log('import_samples')
         output = {
             'report_ref': report_info['ref'],
             'report_name': report_info['name'],
             'sample_set': sample_set,
             'sample_set_ref': sample_set_ref,
             'errors': errors,
-            'links': new_data_links
+            'links': new_data_links,
+            'timings': timer.toJSONable()
         }
         #END import_samples
 
@@ -474,9 +498,17 @@ class sample_uploader:
             elif params.get('is_none'):
                 acls['remove'].append(new_user)
 
-        for sample in sample_set['samples']:
-            sample_id = sample['id']
-            status = update_acls(self.sample_url, sample_id, acls, ctx['token'])
+        statuses, failures = propagate_acls(
+            self.sample_url,
+            [(sample['id'], acls) for sample in sample_set['samples']],
+            ctx['token']
+        )
+        if failures:
+            raise RuntimeError(
+                f"Failed to update access control lists of {len(failures)} samples:\n" +
+                "\n".join(f"{sample_id}: {err}" for sample_id, err in failures)
+            )
+        status = statuses[-1] if statuses else None
         output = {"status": status}
         #END update_sample_set_acls
 
@@ -556,8 +588,6 @@ class sample_uploader:
         #BEGIN link_samples
         logging.info(params)
 
-        ss = SampleService(self.sample_url)
-
         sample_set_ref = params.get('sample_set_ref')
         if not sample_set_ref:
             raise ValueError('Missing sample set object')
@@ -579,32 +609,21 @@ class sample_uploader:
                           "KBaseSets.AssemblySet",
                           "KBaseSets.GenomeSet"]
 
-        new_data_links = []
-        for sample_name, obj_ref in links:
-            obj_type = self.wsClient.get_object_info3({
-                'objects': [{"ref": obj_ref}], 'includeMetadata': 0})["infos"][0][2].split('-')[0]
+        obj_infos = self.wsClient.get_object_info3({
+            'objects': [{"ref": obj_ref} for _, obj_ref in links], 'includeMetadata': 0})["infos"]
+        for obj_info in obj_infos:
+            obj_type = obj_info[2].split('-')[0]
             if obj_type not in accepted_types:
                 raise ValueError('Unsupported object type [{}]. Please provide one of {}'.format(
                     obj_type, accepted_types))
-            sample_id = sample_name_2_info[sample_name]['id']
-            version = sample_name_2_info[sample_name]['version']
-            idx = list(sample_name_2_info.keys()).index(sample_name)
 
-            sample = ss.get_sample({
-                'id': sample_id,
-                'version': version,
-            })
-            ret = ss.create_data_link(
-                dict(
-                    upa=obj_ref,
-                    id=sample_id,
-                    dataid='samples/{}'.format(idx),
-                    version=version,
-                    node=sample['node_tree'][0]['id'],
-                    update=1,
-                )
-            )
-            new_data_links.append(ret)
+        sample_name_2_idx = {name: idx for idx, name in enumerate(sample_name_2_info)}
+        new_data_links = link_objects([{
+            'upa': obj_ref,
+            'dataid': 'samples/{}'.format(sample_name_2_idx[sample_name]),
+            'id': sample_name_2_info[sample_name]['id'],
+            'version': sample_name_2_info[sample_name]['version']
+        } for sample_name, obj_ref in links], self.sample_url, ctx['token'])
 
         new_links = [d['new_link'] for d in new_data_links]
         sample_names_out = [link['node'] for link in new_links]
@@ -0,0 +1,312 @@
+import asyncio
+import json
+import uuid
+
+import aiohttp
+
+from sample_uploader.utils.sample_cache import sample_cache
+from sample_uploader.utils.json_utils import dumps as json_dumps
+from sample_uploader.utils.sample_utils import _handle_response, compare_samples
+from sample_uploader.utils.misc_utils import map_concurrently_async
+
+# number of SampleService requests in flight per client
+ASYNC_SAMPLE_REQUESTS = 64
+# seconds before a SampleService request fails, as for the generated clients
+ASYNC_SAMPLE_TIMEOUT = 30 * 60
+
+
+class _Response:
+    """
+    the parts of a requests.Response that `_handle_response` uses
+    """
+    def __init__(self, status, text):
+        self.status_code = status
+        self.ok = status < 400
+        self.text = text
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncSampleService:
+    """
+    asyncio client for the SampleService methods used by this module. Requests
+    are sent from the current event loop, up to `max_requests` at a time, so one
+    worker can fan out many requests without threads. Errors are raised like by
+    the blocking helpers in sample_utils.
+
+        async with AsyncSampleService(sample_url, token) as ss:
+            sample = await ss.get_sample({'id': sample_id})
+    """
+    def __init__(self, sample_url, token, max_requests=ASYNC_SAMPLE_REQUESTS,
+                 timeout=ASYNC_SAMPLE_TIMEOUT):
+        """
+        sample_url   - url of sample service
+        token        - workspace token for Authorization
+        max_requests - maximum number of requests in flight
+        timeout      - seconds before a request fails
+        """
+        self.sample_url = sample_url
+        self.token = token
+        self.max_requests = max_requests
+        self.timeout = timeout
+        # number of requests by SampleService method
+        self.calls = {}
+        self._session = None
+        self._semaphore = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_requests)
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_requests),
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, *args):
+        await self._session.close()
+
+    async def _request(self, method, params):
+        """
+        call SampleService `method` with `params`
+        returns the 'result' of the response and the length of the response
+        """
+        headers = {
+            "Authorization": self.token,
+            "Content-Type": "application/json"
+        }
+        payload = {
+            "method": "SampleService." + method,
+            "id": str(uuid.uuid4()),
+            "params": [params],
+            "version": "1.1"
+        }
+        self.calls[method] = self.calls.get(method, 0) + 1
+        async with self._semaphore:
+            async with self._session.post(self.sample_url, headers=headers,
+                                          data=json_dumps(payload, default=str)) as resp:
+                text = await resp.text()
+        resp_json = _handle_response(_Response(resp.status, text))
+        return resp_json.get('result'), len(text)
+
+    async def _call(self, method, params):
+        """
+        call SampleService `method` with `params`, returns the 'result' of the response
+        """
+        result, _ = await self._request(method, params)
+        return result
+
+    async def get_sample(self, sample_info):
+        """
+        sample_info - dict containing 'id' and optionally 'version' of a sample
+        Versioned lookups are served from the sample cache of the call when possible.
+        """
+        sample = sample_cache.get(sample_info['id'], sample_info.get('version'))
+        if sample is not None:
+            return sample
+        params = {"id": sample_info['id']}
+        if sample_info.get('version'):
+            params['version'] = sample_info['version']
+        result, nbytes = await self._request('get_sample', params)
+        sample = result[0]
+        sample_cache.put(sample, nbytes)
+        return sample
+
+    async def get_samples(self, sample_infos):
+        """
+        sample_infos - list of dicts containing 'id' and optionally 'version' of a sample
+        """
+        samples = []
+        for sample_info in sample_infos:
+            sample_params = {"id": sample_info['id']}
+            if sample_info.get('version'):
+                sample_params['version'] = sample_info['version']
+            samples.append(sample_params)
+        result, nbytes = await self._request('get_samples', {"samples": samples})
+        samples = result[0]
+        for sample in samples:
+            sample_cache.put(sample, nbytes // len(samples))
+        return samples
+
+    async def create_sample(self, sample, prior_version=None):
+        """
+        returns (sample id, sample version) of the saved sample
+        """
+        result = (await self._call('create_sample', {
+            "sample": sample,
+            "prior_version": prior_version
+        }))[0]
+        return result['id'], result['version']
+
+    async def validate_samples(self, samples):
+        """
+        returns the errors SampleService found in the samples
+        """
+        return (await self._call('validate_samples', {"samples": samples}))[0]['errors']
+
+    async def update_sample_acls(self, sample_id, acl_updates):
+        """
+        replace the access control list of a sample, acl_updates as for `sample_utils.update_acls`
+        """
+        await self._call('update_sample_acls', {
+            "id": sample_id,
+            "admin": acl_updates.get("admin", []),
+            "write": acl_updates.get("write", []),
+            "read": acl_updates.get("read", []),
+            "remove": acl_updates.get("remove", []),
+            "at_least": False
+        })
+
+    async def create_data_link(self, params):
+        return (await self._call('create_data_link', params))[0]
+
+    async def get_data_links_from_data(self, upa):
+        """
+        returns the data links of the object with reference `upa`
+        """
+        return (await self._call('get_data_links_from_data', {"upa": upa}))[0].get('links')
+
+    async def expire_data_link(self, upa, dataid):
+        await self._call('expire_data_link', {'upa': upa, 'dataid': dataid})
+
+    async def propagate_data_links(self, params):
+        return (await self._call('propagate_data_links', params))[0]
+
+
+async def save_sample(ss, sample, previous_version=None, propagate_links=0, fingerprint=None):
+    """
+    asyncio version of `sample_utils.save_sample`
+    ss - AsyncSampleService
+    """
+    print('start saving sample')
+    prior_version = None
+    if previous_version:
+        prev_sample = await ss.get_sample({"id": previous_version["id"]})
+        if compare_samples(sample, prev_sample, fingerprint):
+            return None, None
+        sample['id'] = previous_version['id']
+        prior_version = previous_version['version']
+    sample_id, sample_ver = await ss.create_sample(sample, prior_version)
+
+    print('saved sample {} (version: {}'.format(sample_id, sample_ver))
+
+    if previous_version and propagate_links:
+        print('start propagating previous data links')
+
+        await ss.propagate_data_links({'id': sample_id,
+                                       'version': sample_ver,
+                                       'previous_version': previous_version['version'],
+                                       'ignore_types': ['KBaseSets.SampleSet'],
+                                       'update': True,
+                                       'as_user': True})
+
+    return sample_id, sample_ver
+
+
+async def _save_samples(samples, sample_url, token, propagate_links, max_tasks, fail_fast):
+    async with AsyncSampleService(sample_url, token) as ss:
+        async def _save(data):
+            return await save_sample(ss, data['sample'],
+                                     previous_version=data['prev_sample'],
+                                     propagate_links=propagate_links,
+                                     fingerprint=data.get('fingerprint'))
+
+        return await map_concurrently_async(_save, samples, max_tasks, fail_fast=fail_fast)
+
+
+@sample_cache.scope()
+def save_samples(samples, sample_url, token, propagate_links, max_tasks=ASYNC_SAMPLE_REQUESTS,
+                 fail_fast=True):
+    """
+    Save samples, up to `max_tasks` samples are saved concurrently.
+        samples - list of dicts with the 'sample', 'prev_sample' and optionally 'fingerprint'
+                  of each sample, as produced by the importer
+    returns (results, failures) as `misc_utils.map_concurrently`, with the
+    (sample id, sample version) of each sample as result
+    """
+    return asyncio.run(_save_samples(samples, sample_url, token, propagate_links,
+                                     max_tasks, fail_fast))
+
+
+async def _create_data_links(links, sample_url, token, max_tasks):
+    async with AsyncSampleService(sample_url, token) as ss:
+        async def _create_link(link):
+            node = link.get('node')
+            if not node:
+                node = (await ss.get_sample({
+                    'id': link['id'],
+                    'version': link['version']
+                }))['node_tree'][0]['id']
+            return await ss.create_data_link(
+                dict(
+                    upa=link['upa'],
+                    id=link['id'],
+                    dataid=link['dataid'],
+                    version=link['version'],
+                    node=node,
+                    update=1,
+                )
+            )
+
+        results, failures = await map_concurrently_async(_create_link, links, max_tasks)
+    if failures:
+        raise failures[0][1]
+    return results
+
+
+@sample_cache.scope()
+def create_data_links(upa, samples, sample_url, token, max_tasks=ASYNC_SAMPLE_REQUESTS):
+    """
+    Link the samples of a sample set to the sample set object, the n-th sample
+    is linked with data id 'samples/n'. Up to `max_tasks` links are created
+    concurrently.
+        upa     - reference of the sample set object
+        samples - list of dicts with the 'id', 'version' and 'node' of each sample. When
+                  'node' is missing the sample is fetched to find its first node.
+    returns the results of 'create_data_link' in the order of `samples`
+    """
+    links = [{
+        'upa': upa,
+        'dataid': 'samples/{}'.format(idx),
+        'id': sample['id'],
+        'version': sample['version'],
+        'node': sample.get('node')
+    } for idx, sample in enumerate(samples)]
+    return asyncio.run(_create_data_links(links, sample_url, token, max_tasks))
+
+
+@sample_cache.scope()
+def link_objects(links, sample_url, token, max_tasks=ASYNC_SAMPLE_REQUESTS):
+    """
+    Link objects to samples, up to `max_tasks` links are created concurrently.
+        links - list of dicts with the 'upa' and 'dataid' of the linked object and the
+                'id', 'version' and optionally 'node' of the sample. When 'node' is
+                missing the sample is fetched to find its first node.
+    returns the results of 'create_data_link' in the order of `links`
+    """
+    return asyncio.run(_create_data_links(links, sample_url, token, max_tasks))
+
+
+async def _expire_data_links(obj_refs, sample_url, token, max_tasks):
+    async with AsyncSampleService(sample_url, token) as ss:
+        obj_links = await asyncio.gather(*[ss.get_data_links_from_data(upa) for upa in obj_refs])
+        links = [link for links in obj_links for link in links]
+
+        async def _expire_link(link):
+            upa, dataid = link.get('upa'), link.get('dataid')
+            print('start expiring link {}-{}'.format(upa, dataid))
+            await ss.expire_data_link(upa, dataid)
+
+        _, failures = await map_concurrently_async(_expire_link, links, max_tasks)
+    if failures:
+        raise failures[0][1]
+    return len(links)
+
+
+def expire_data_link(obj_refs, sample_url, token, max_tasks=ASYNC_SAMPLE_REQUESTS):
+    """
+    Expire all data links of the objects, up to `max_tasks` links are expired concurrently.
+        obj_refs - references of the linked objects
+    returns the number of expired links
+    """
+    return asyncio.run(_expire_data_links(obj_refs, sample_url, token, max_tasks))
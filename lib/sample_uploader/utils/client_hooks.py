@@ -0,0 +1,63 @@
+"""
+Hooks of the generated KBase clients in lib/installed_clients.
+
+baseclient.py is generated by kb-sdk compile and is rewritten by every
+regeneration, so it is not edited. install_client_hooks() sets its module
+attributes at startup instead, so that all generated clients post with the
+pooled keep-alive sessions, encode with json_utils.dumps and count their calls
+in service_calls.
+"""
+import functools
+import json
+
+import requests
+
+from installed_clients import baseclient
+from sample_uploader.utils.http_session import http_session
+from sample_uploader.utils.json_utils import dumps
+from sample_uploader.utils.stage_timer import service_calls
+
+
+class _PooledRequests:
+    """
+    the parts of the requests module baseclient uses, posting with http_session
+    """
+    utils = requests.utils
+    exceptions = requests.exceptions
+
+    @staticmethod
+    def post(url, **kwargs):
+        return http_session.post(url, **kwargs)
+
+
+class _ClientJSON:
+    """
+    the parts of the json module baseclient uses, encoding with json_utils.dumps
+    """
+    JSONEncoder = json.JSONEncoder
+    loads = staticmethod(json.loads)
+
+    @staticmethod
+    def dumps(obj, cls=json.JSONEncoder, **kwargs):
+        if kwargs:
+            return json.dumps(obj, cls=cls, **kwargs)
+        return dumps(obj, default=cls().default)
+
+
+def _counted(call):
+    @functools.wraps(call)
+    def _call(self, url, method, params, context=None):
+        service_calls.add(method.split('.')[0])
+        return call(self, url, method, params, context)
+    _call.counted = True
+    return _call
+
+
+def install_client_hooks():
+    """
+    set up the generated clients of the process, calling it again has no effect
+    """
+    baseclient._requests = _PooledRequests
+    baseclient._json = _ClientJSON
+    if not getattr(baseclient.BaseClient._call, 'counted', False):
+        baseclient.BaseClient._call = _counted(baseclient.BaseClient._call)
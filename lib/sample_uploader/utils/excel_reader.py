@@ -0,0 +1,206 @@
+import datetime
+import importlib
+
+import numpy as np
+import pandas as pd
+from pandas.errors import EmptyDataError
+from pandas.io.parsers import TextParser
+
+# Excel engines in order of preference, the first installed engine that supports
+# the file extension is used. python-calamine is an optional, faster native reader.
+EXCEL_ENGINES = ['calamine', 'openpyxl', 'xlrd']
+
+# cell values of formulas that failed, read as missing values like pandas does
+EXCEL_ERROR_VALUES = {'#NULL!', '#DIV/0!', '#VALUE!', '#REF!', '#NAME?', '#NUM!', '#N/A'}
+
+
+def _convert_value(val):
+    """
+    convert a cell value the same way as pandas' excel readers
+    """
+    if val is None:
+        return ''
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, float) and val.is_integer():
+        return int(val)
+    if isinstance(val, str) and val in EXCEL_ERROR_VALUES:
+        return np.nan
+    if isinstance(val, datetime.date) and not isinstance(val, datetime.datetime):
+        return datetime.datetime(val.year, val.month, val.day)
+    return val
+
+
+def _calamine_rows(book):
+    sheet = book.get_sheet_by_index(0)
+    # calamine yields all rows, but starts them at the first used column
+    start_col = sheet.start[1] if sheet.start else 0
+    for row in sheet.iter_rows():
+        yield [''] * start_col + [_convert_value(val) for val in row]
+
+
+def _openpyxl_rows(book):
+    for row in book.worksheets[0].iter_rows(values_only=True):
+        yield [_convert_value(val) for val in row]
+
+
+def _xlrd_rows(book):
+    import xlrd
+
+    epoch1904 = book.datemode
+    sheet = book.sheet_by_index(0)
+
+    def parse_cell(val, typ):
+        if typ == xlrd.XL_CELL_DATE:
+            try:
+                val = xlrd.xldate.xldate_as_datetime(val, epoch1904)
+            except OverflowError:
+                return val
+            # Excel doesn't distinguish between dates and times, dates on the epoch are times
+            if (not epoch1904 and val.timetuple()[0:3] == (1899, 12, 31)) or \
+                    (epoch1904 and val.timetuple()[0:3] == (1904, 1, 1)):
+                val = datetime.time(val.hour, val.minute, val.second, val.microsecond)
+        elif typ == xlrd.XL_CELL_ERROR:
+            val = np.nan
+        elif typ == xlrd.XL_CELL_BOOLEAN:
+            val = bool(val)
+        elif typ == xlrd.XL_CELL_NUMBER and int(val) == val:
+            val = int(val)
+        return val
+
+    for i in range(sheet.nrows):
+        yield [parse_cell(val, typ) for val, typ in zip(sheet.row_values(i), sheet.row_types(i))]
+
+
+def _open_calamine(path):
+    from python_calamine import CalamineWorkbook
+    return CalamineWorkbook.from_path(path)
+
+
+def _open_openpyxl(path):
+    from openpyxl import load_workbook
+    return load_workbook(path, read_only=True, data_only=True, keep_links=False)
+
+
+def _open_xlrd(path):
+    import xlrd
+    return xlrd.open_workbook(path, on_demand=True)
+
+
+# engine -> (module, supported extensions, open workbook, iterate rows of the first sheet)
+EXCEL_READERS = {
+    'calamine': ('python_calamine', ('.xls', '.xlsx'), _open_calamine, _calamine_rows),
+    'openpyxl': ('openpyxl', ('.xlsx',), _open_openpyxl, _openpyxl_rows),
+    'xlrd': ('xlrd', ('.xls',), _open_xlrd, _xlrd_rows),
+}
+
+
+def find_excel_engine(path, engines=EXCEL_ENGINES):
+    """
+    return the first of engines that is installed and can read the file at path
+    """
+    for engine in engines:
+        module, extensions, _, _ = EXCEL_READERS[engine]
+        if not path.endswith(extensions):
+            continue
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        return engine
+    raise ValueError(f"None of the excel engines {engines} is installed "
+                     f"and can read {path}")
+
+
+def _is_blank(row):
+    return all(isinstance(val, str) and val == '' for val in row)
+
+
+def _used_width(row):
+    width = len(row)
+    while width and isinstance(row[width - 1], str) and row[width - 1] == '':
+        width -= 1
+    return width
+
+
+class ExcelReader:
+    """
+    Read-only reader of the first sheet of an '.xls' or '.xlsx' file. Rows are
+    streamed from the workbook and only cell values are read, so blank rows are
+    dropped and reading stops after nrows without building the whole sheet as a
+    DataFrame first.
+        path   - path to the file
+        engine - one of EXCEL_ENGINES, by default the first one installed
+    """
+    def __init__(self, path, engine=None):
+        self.path = path
+        self.engine = engine or find_excel_engine(path)
+        if self.engine not in EXCEL_READERS:
+            raise ValueError(f"Unknown excel engine {self.engine}, "
+                             f"engines are {EXCEL_ENGINES}")
+        _, _, open_book, self._rows = EXCEL_READERS[self.engine]
+        self.book = open_book(path)
+
+    def rows(self):
+        """
+        yield the rows of the first sheet as lists of values, empty cells are ''
+        """
+        return self._rows(self.book)
+
+    def read(self, header=0, nrows=None):
+        """
+        Read the first sheet into a DataFrame, like pd.read_excel with the same
+        header and nrows followed by dropping the empty rows. Blank rows count as
+        rows of the sheet, those below the header row are dropped while reading. The
+        index is set so that index + header + 1 is the position of the row in the sheet.
+            header - index of the header row
+            nrows  - number of rows to read below the header (optional)
+        """
+        data = []
+        index = []
+        width = 0
+        blank_rows = 0
+        has_gaps = False
+        for position, row in enumerate(self.rows()):
+            blank = _is_blank(row)
+            if not blank:
+                width = max(width, _used_width(row))
+            if position == header:
+                data.append(row)
+            elif position > header:
+                if blank:
+                    blank_rows += 1
+                else:
+                    has_gaps = has_gaps or blank_rows > 0
+                    blank_rows = 0
+                    index.append(position - header - 1)
+                    data.append(row)
+            if nrows is not None and position >= header + nrows:
+                break
+        if not data:
+            return pd.DataFrame()
+        data = [row[:width] + [''] * (width - len(row)) for row in data]
+        if has_gaps:
+            # pandas reads blank rows between values as missing values, which changes
+            # the inferred column types, so one blank row is parsed and dropped again
+            data.append([''] * width)
+        try:
+            df = TextParser(data, header=0, skip_blank_lines=False).read()
+        except EmptyDataError:
+            return pd.DataFrame()
+        if has_gaps:
+            df = df.iloc[:-1]
+        df.index = pd.Index(index, dtype='int64')
+        return df
+
+    def close(self):
+        for close in ('close', 'release_resources'):
+            if hasattr(self.book, close):
+                getattr(self.book, close)()
+                return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -1,6 +1,7 @@
 import pandas as pd
 import json
 from sample_uploader.utils.sample_utils import get_sample
+from sample_uploader.utils.sample_cache import sample_cache
 from sample_uploader.utils.mappings import SESAR_mappings  #, ENIGMA_mappings
 from sample_uploader.utils.parsing_utils import (
     check_value_in_list,
@@ -8,6 +9,7 @@ from sample_uploader.utils.parsing_utils import (
 )
 
 
+@sample_cache.scope()
 def sample_set_to_output(sample_set, sample_url, token, output_file, output_file_format):
     """"""
     def add_to_output(o, key_metadata, val):
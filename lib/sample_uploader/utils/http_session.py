@@ -0,0 +1,67 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# number of hosts connections are pooled for
+HTTP_POOL_CONNECTIONS = 10
+# connections kept alive per host, enough for the concurrent sample requests
+HTTP_POOL_MAXSIZE = 32
+# when all connections to a host are in use, open extra connections that are
+# closed after their request instead of waiting for a free connection
+HTTP_POOL_BLOCK = False
+
+
+class HTTPSessionPool:
+    """
+    Keep-alive HTTP connections shared by all threads of the server process.
+
+    requests.Session is not thread-safe, so every thread gets its own Session,
+    but all of them are mounted on the same HTTPAdapter, and so share its
+    thread-safe urllib3 connection pools. Requests to the same host reuse open
+    connections instead of opening a new TCP/TLS connection every time.
+    """
+    def __init__(self, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                 pool_block=HTTP_POOL_BLOCK, keep_alive=True):
+        """
+        pool_connections - number of hosts connections are pooled for
+        pool_maxsize     - maximum number of connections kept alive per host
+        pool_block       - if True, at most pool_maxsize connections are open per host
+                           and further requests wait for a free connection
+        keep_alive       - if False, connections are closed after every request
+        """
+        self.keep_alive = keep_alive
+        self._adapter = HTTPAdapter(pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize,
+                                    pool_block=pool_block)
+        self._local = threading.local()
+
+    def session(self):
+        """
+        the requests.Session of the current thread
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            if not self.keep_alive:
+                session.headers['Connection'] = 'close'
+            self._local.session = session
+        return session
+
+    def post(self, url, **kwargs):
+        return self.session().post(url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.session().get(url, **kwargs)
+
+    def close(self):
+        """
+        close all pooled connections, they are opened again by the next requests
+        """
+        self._adapter.close()
+
+
+# shared by the SampleService helpers and the generated clients in the server process
+http_session = HTTPSessionPool()
@@ -1,28 +1,45 @@
 import pandas as pd
-import warnings
 import os
 import copy
+import csv
+import json
+import time
 
 from sample_uploader.utils.sample_utils import (
     get_sample,
-    save_sample,
+    prefetch_samples,
     compare_samples,
-    generate_user_metadata,
-    generate_controlled_metadata,
-    generate_source_meta,
-    update_acls,
-    validate_samples
+    sample_fingerprint,
+    propagate_acls,
+    validate_samples,
+    SAMPLE_FETCH_CHUNK_SIZE,
+    SAMPLE_FETCH_WORKERS
 )
+from sample_uploader.utils.excel_reader import ExcelReader
 from sample_uploader.utils.transformations import FieldTransformer
+from sample_uploader.utils.ontology_cache import ontology_cache
+from sample_uploader.utils.sample_cache import sample_cache
+from sample_uploader.utils.sample_builder import SampleBuilder, ColumnPlan
 from sample_uploader.utils.parsing_utils import upload_key_format
-from sample_uploader.utils.mappings import CORE_FIELDS, NON_PREFIX_TO_PREFIX
+from sample_uploader.utils.mappings import (CORE_FIELDS, NON_PREFIX_TO_PREFIX, SAMP_ONTO_CONFIG,
+                                            SAMP_SERV_CONFIG)
+from sample_uploader.utils.verifiers import MetadataValidator
 from sample_uploader.utils.misc_utils import get_workspace_user_perms
-from sample_uploader.utils.samples_content_warning import SampleContentWarning, SampleContentWarningContext
+from sample_uploader.utils.async_sample_service import save_samples
+from sample_uploader.utils.samples_content_warning import (
+    SampleContentWarning, SampleContentErrors, report_error)
+from sample_uploader.utils.stage_timer import StageTimer
 
 # These columns should all be in lower case.
 REQUIRED_COLS = {'name'}
 REGULATED_COLS = ['name', 'id', 'parent_id']
 NOOP_VALS = ['ND', 'nd', 'NA', 'na', 'None', 'n/a', 'N/A', 'Na', 'N/a', '-']
+# number of samples written to SampleService concurrently
+SAMPLE_SAVE_WORKERS = 8
+# local checks of the controlled metadata, before samples are sent to SampleService
+metadata_validator = MetadataValidator(SAMP_SERV_CONFIG['validators'])
+# number of rows read to detect an extra SESAR header line
+HEADER_SNIFF_ROWS = 10
 
 
 def _has_sesar_header(df):
@@ -40,7 +57,21 @@ def _has_sesar_header(df):
     return has_sesar_header
 
 
-def find_header_row(sample_file, file_format):
+def open_excel_file(sample_file):
+    """
+    open an '.xls' or '.xlsx' file once, so that it can be used both to find the header
+    row and to load the samples. Returns None for other files.
+    """
+    if sample_file.endswith('.xls') or sample_file.endswith('.xlsx'):
+        return ExcelReader(sample_file)
+    return None
+
+
+def find_header_row(sample_file, file_format, excel_file=None):
+    """
+    Only the first lines or rows of the file are read to find the header row.
+        excel_file - ExcelReader of sample_file from open_excel_file (optional)
+    """
     if not os.path.isfile(sample_file):
         # try prepending '/staging/' to file and check then
         if os.path.isfile(os.path.join('/staging', sample_file)):
@@ -52,11 +83,10 @@ def find_header_row(sample_file, file_format):
     if file_format.lower() == "sesar":
 
         if sample_file.endswith('.tsv'):
-            reader = pd.read_csv(sample_file, sep=None, iterator=True)
-            inferred_sep = reader._engine.data.dialect.delimiter
             with open(sample_file) as f:
                 first_line = f.readline()
                 second_line = f.readline()
+            inferred_sep = csv.Sniffer().sniff(first_line).delimiter
 
             # when an extra header presents,
             # the first line (SESAR header line) should have an unequal number of columns than the second line (the real header line).
@@ -69,7 +99,8 @@ def find_header_row(sample_file, file_format):
         elif sample_file.endswith('.csv'):
 
             # assume the file does NOT have the SESAR header line with header=0
-            df = pd.read_csv(sample_file, header=0, skip_blank_lines=False)
+            df = pd.read_csv(sample_file, header=0, skip_blank_lines=False,
+                             nrows=HEADER_SNIFF_ROWS)
 
             if _has_sesar_header(df):
                 header_row_index = 1
@@ -77,7 +108,11 @@ def find_header_row(sample_file, file_format):
         elif sample_file.endswith('.xls') or sample_file.endswith('.xlsx'):
 
             # assume the file does NOT have the SESAR header line with header=0
-            df = pd.read_excel(sample_file, header=0, skip_blank_lines=False)
+            if excel_file is None:
+                with ExcelReader(sample_file) as excel_file:
+                    df = excel_file.read(header=0, nrows=HEADER_SNIFF_ROWS)
+            else:
+                df = excel_file.read(header=0, nrows=HEADER_SNIFF_ROWS)
 
             if _has_sesar_header(df):
                 header_row_index = 1
@@ -110,12 +145,22 @@ def validate_params(params):
     return sample_file
 
 
+def _read_excel(sample_file, header_row_index, excel_file=None):
+    if excel_file is None:
+        with ExcelReader(sample_file) as excel_file:
+            return excel_file.read(header=header_row_index)
+    return excel_file.read(header=header_row_index)
+
+
 def load_file(
     sample_file,
     header_row_index,
-    date_columns
+    date_columns,
+    excel_file=None
 ):
-    """"""
+    """
+    excel_file - ExcelReader of sample_file from open_excel_file (optional)
+    """
     if sample_file.endswith('.tsv'):
         # df = pd.read_csv(sample_file, sep="\t", parse_dates=date_columns, header=header_row_index)
         df = pd.read_csv(sample_file, sep="\t", header=header_row_index, skip_blank_lines=False)
@@ -123,7 +168,7 @@ def load_file(
         # df = pd.read_csv(sample_file, parse_dates=date_columns, header=header_row_index)
         df = pd.read_csv(sample_file, header=header_row_index, skip_blank_lines=False)
     elif sample_file.endswith('.xls') or sample_file.endswith('.xlsx'):
-        df = pd.read_excel(sample_file, header=header_row_index, skip_blank_lines=False)
+        df = _read_excel(sample_file, header_row_index, excel_file)
     else:
         raise ValueError(f"File {os.path.basename(sample_file)} is not in "
                          f"an accepted file format, accepted file formats "
@@ -138,6 +183,81 @@ def load_file(
     return df
 
 
+def _row_hashes(df):
+    """
+    hash every row of df. Numeric columns are hashed as floats, so that equal rows
+    hash the same whether their chunk was parsed with an integer or a float column.
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col]):
+            df[col] = df[col].astype(float)
+    return pd.util.hash_pandas_object(df, index=False)
+
+
+def _merge_chunk_dtypes(chunks):
+    """
+    Find the dtype pandas would infer for each column if the file was read at once,
+    from the dtypes inferred for each of its chunks.
+    """
+    chunk_dtypes = {}
+    for df in chunks:
+        for col, dtype in df.dtypes.items():
+            chunk_dtypes.setdefault(col, set()).add(dtype)
+    dtypes = {}
+    for col, col_dtypes in chunk_dtypes.items():
+        if len(col_dtypes) == 1:
+            dtype = col_dtypes.pop()
+        elif all(pd.api.types.is_numeric_dtype(d) and not pd.api.types.is_bool_dtype(d)
+                 for d in col_dtypes):
+            dtype = float
+        else:
+            dtype = object
+        dtypes[col] = str if dtype == object else dtype
+    return dtypes
+
+
+def load_file_chunks(
+    sample_file,
+    header_row_index,
+    date_columns,
+    chunk_size,
+    excel_file=None
+):
+    """
+    Same as `load_file`, but yields the file `chunk_size` rows at a time. Rows
+    identical to an earlier row anywhere in the file are dropped by comparing row
+    hashes. '.csv' and '.tsv' files are read twice, first to find the column types
+    of the whole file so that every chunk is parsed the same way. '.xls' and '.xlsx'
+    files can't be read in chunks, they are loaded whole and then split.
+    """
+    if sample_file.endswith('.tsv') or sample_file.endswith('.csv'):
+        sep = "\t" if sample_file.endswith('.tsv') else ","
+        read_params = dict(sep=sep, header=header_row_index, skip_blank_lines=False,
+                           chunksize=chunk_size)
+        dtypes = _merge_chunk_dtypes(pd.read_csv(sample_file, **read_params))
+        reader = pd.read_csv(sample_file, dtype=dtypes, **read_params)
+    elif sample_file.endswith('.xls') or sample_file.endswith('.xlsx'):
+        df = _read_excel(sample_file, header_row_index, excel_file)
+        reader = (df.iloc[i: i + chunk_size] for i in range(0, len(df), chunk_size))
+    else:
+        raise ValueError(f"File {os.path.basename(sample_file)} is not in "
+                         f"an accepted file format, accepted file formats "
+                         f"are '.xls' '.csv' '.tsv' or '.xlsx'")
+    seen_rows = set()
+    for df in reader:
+        # Remove empty rows and change index labels to row number
+        df = df.dropna(how='all')
+        df.index += header_row_index + 1
+
+        unique = []
+        for row_hash in _row_hashes(df).tolist():
+            unique.append(row_hash not in seen_rows)
+            seen_rows.add(row_hash)
+        if any(unique):
+            yield df[unique].copy()
+
+
 def _produce_samples(
     callback_url,
     df,
@@ -147,9 +267,23 @@ def _produce_samples(
     token,
     existing_samples,
     columns_to_input_names,
-    keep_existing_samples
+    keep_existing_samples,
+    fetch_chunk_size=SAMPLE_FETCH_CHUNK_SIZE,
+    fetch_workers=SAMPLE_FETCH_WORKERS,
+    field_transformer=None,
+    column_plan=None,
+    errors=None,
+    stage_timer=None
 ):
-    """"""
+    """
+        field_transformer - FieldTransformer to reuse the ontology lookups of
+                            earlier calls (optional)
+        column_plan       - ColumnPlan of the columns of df (optional)
+        errors            - SampleContentErrors the errors of the rows are added to,
+                            no further rows are checked once it is stopped (optional)
+        stage_timer       - StageTimer the ontology transforms are timed with (optional)
+    """
+    stage_timer = stage_timer or StageTimer()
     samples = []
     existing_sample_names = {sample['name']: sample for sample in existing_samples}
 
@@ -160,10 +294,31 @@ def _produce_samples(
             f'Existing fields ({df.columns})'
         )
 
+    if field_transformer is None:
+        field_transformer = FieldTransformer(callback_url, term_cache=ontology_cache)
+    builder = SampleBuilder(df, column_groups, column_unit_regex, column_plan)
+
+    # prefetch the latest version of all samples that the rows may refer to
+    prefetch_ids = []
+    for idx in range(len(df.index)):
+        name, kbase_sample_id = builder.value('name', idx), builder.value('kbase_sample_id', idx)
+        if kbase_sample_id:
+            prefetch_ids.append(str(kbase_sample_id))
+        elif name and str(name) in existing_sample_names:
+            prefetch_ids.append(existing_sample_names[str(name)]['id'])
+    prefetched_samples = prefetch_samples(prefetch_ids, sample_url, token,
+                                          chunk_size=fetch_chunk_size,
+                                          max_workers=fetch_workers)
+
+    def _get_latest_sample(sample_info):
+        if sample_info['id'] in prefetched_samples:
+            return prefetched_samples[sample_info['id']]
+        return get_sample(sample_info, sample_url, token)
+
     def _get_existing_sample(name, kbase_sample_id):
         prev_sample = None
         if kbase_sample_id:
-            prev_sample = get_sample({"id": kbase_sample_id}, sample_url, token)
+            prev_sample = _get_latest_sample({"id": kbase_sample_id})
 
             if name in existing_sample_names and prev_sample['name'] == name:
                 # now we check if the sample 'id' and 'name' are the same
@@ -184,75 +339,61 @@ def _produce_samples(
             existing_sample = copy.deepcopy(existing_sample_names[name])
             # remove version of samples from sample set in order to get the latest version of sample
             existing_sample.pop('version', None)
-            prev_sample = get_sample(existing_sample, sample_url, token)
+            prev_sample = _get_latest_sample(existing_sample)
 
         return prev_sample
 
-    field_transformer = FieldTransformer(callback_url)
-
-    cols = list(set(df.columns) - set(REQUIRED_COLS))
+    cols = builder.cols
+    onto_cols = [col for col in cols if col in SAMP_ONTO_CONFIG]
+    # look up all ontology terms up front, only the values that could not be
+    # resolved are still transformed (and reported) row by row.
+    if onto_cols:
+        with stage_timer.stage('ontology_transforms'):
+            resolved_columns = field_transformer.resolve_columns(
+                {col: [builder.value(col, idx) for idx in range(len(df.index))]
+                 for col in onto_cols}
+            )
+        for col, values in resolved_columns.items():
+            builder.set_column(col, values)
     imported_sample_names = list()
-    for row_num, row in df.iterrows():
+    # the row by row transforms add up to a single entry of the stage
+    transform_seconds = 0.0
+    for idx, row_num in enumerate(df.index):
+        if errors is not None and errors.stopped:
+            break
         try:
             # only required field is 'name'
-            if not row.get('name'):
+            name = builder.value('name', idx)
+            if not name:
                 raise SampleContentWarning(
-                    f"Bad sample name \"{row.get('name')}\". Cell content evaluates as false",
+                    f"Bad sample name \"{name}\". Cell content evaluates as false",
                     key='name',
-                    sample_name=row.get('name')
+                    sample_name=name
                 )
-            name = str(row.pop('name'))
-            if 'name' in cols:
-                cols.pop(cols.index('name'))
+            name = str(name)
 
             # check if a 'kbase_sample_id' column is specified
             kbase_sample_id = None
-            if row.get('kbase_sample_id'):
-                kbase_sample_id = str(row.pop('kbase_sample_id'))
-                if 'kbase_sample_id' in cols:
-                    cols.pop(cols.index('kbase_sample_id'))
-            if row.get('parent_id'):
-                parent = str(row.pop('parent_id'))
-                if 'parent_id' in cols:
-                    cols.pop(cols.index('parent_id'))
+            if builder.value('kbase_sample_id', idx):
+                kbase_sample_id = str(builder.value('kbase_sample_id', idx))
 
             # tranformations for data in row.
-            row = field_transformer.field_transformations(row, cols)
-
-            controlled_metadata, controlled_cols = generate_controlled_metadata(
-                row,
-                column_groups
-            )
-            # remove controlled columns from cols.
-            user_metadata = generate_user_metadata(
-                row,
-                list(set(cols) - set(controlled_cols)),
-                column_groups,
-                column_unit_regex
-            )
-            source_meta = generate_source_meta(
-                row,
-                controlled_metadata.keys(),
-                columns_to_input_names
-            )
-
-            sample = {
-                'node_tree': [{
-                    "id": name,
-                    "parent": None,
-                    "type": "BioReplicate",
-                    "meta_controlled": controlled_metadata,
-                    "meta_user": user_metadata,
-                    'source_meta': source_meta
-                }],
-                'name': name,
-            }
+            if onto_cols:
+                row = {col: builder.value(col, idx) for col in onto_cols}
+                start = time.perf_counter()
+                row = field_transformer.field_transformations(row, onto_cols, errors)
+                transform_seconds += time.perf_counter() - start
+                for col in onto_cols:
+                    builder.set_value(col, idx, row[col])
+
+            sample = builder.build(idx, name, columns_to_input_names)
             imported_sample_names.append(name)
 
             # get existing sample (if exists)
             prev_sample = _get_existing_sample(name, kbase_sample_id)
 
-            if compare_samples(sample, prev_sample):
+            fingerprint = sample_fingerprint(sample)
+            if compare_samples(sample, prev_sample, fingerprint):
                 if sample.get('name') not in existing_sample_names:
                     existing_sample_names[sample['name']] = prev_sample
                 continue
@@ -262,14 +403,17 @@ def _produce_samples(
             samples.append({
                 'sample': sample,
                 'prev_sample': prev_sample,
+                'fingerprint': fingerprint,
                 'name': name,
-                'write': row.get('write'),
-                'read': row.get('read'),
-                'admin': row.get('admin')
+                'write': builder.value('write', idx),
+                'read': builder.value('read', idx),
+                'admin': builder.value('admin', idx)
             })
         except SampleContentWarning as e:
             e.row = row_num
-            warnings.warn(e)
+            report_error(e, errors)
+    if onto_cols:
+        stage_timer.add('ontology_transforms', transform_seconds)
 
     if not keep_existing_samples:
         # remove samples in the existing_samples (input sample_set) but not in the input file
@@ -284,32 +428,89 @@ def _produce_samples(
             ckeys = set(n['meta_controlled'].keys())
             user_keys |= (ukeys - ckeys)
     for key in user_keys:
-        warnings.warn(SampleContentWarning(
+        report_error(SampleContentWarning(
             f"\"{key}\" is a user-defined column. It is of unknown type, will not be automatically validated, and may not be interoperable with other samples during analysis.",
             key=key,
             severity='warning'
-        ))
+        ), errors)
 
     # add the missing samples from existing_sample_names
     return samples, [existing_sample_names[key] for key in existing_sample_names]
 
 
-def _save_samples(samples, acls, sample_url, token, propagate_links):
-    """"""
-    saved_samples = []
-    for data in samples:
-        sample = data['sample']
-        prev_sample = data['prev_sample']
-        name = data['name']
+def _prevalidate(samples, sample_url, token, max_errors=None, errors=None):
+    """
+    validate samples before saving them, the errors are raised as
+    SampleContentWarnings of the sample, node and key they were found for.
+    The controlled metadata is checked locally first, only the samples without
+    local errors are then validated with SampleService, so no error is found twice.
+    Checks that only SampleService does, like the ontology ancestors, are not
+    reported for the samples that failed locally.
+        max_errors - stop validating once this many errors were found (optional)
+        errors     - SampleContentErrors the errors are added to, at most as many errors
+                     are added as are left until it is stopped (optional)
+    """
+    if errors is not None and errors.max_errors:
+        remaining = max(errors.max_errors - errors.error_count, 1)
+        max_errors = min(max_errors, remaining) if max_errors else remaining
+    samples = [s['sample'] for s in samples]
+    error_detail = metadata_validator.validate_samples(samples)
+    failed = {e['sample_name'] for e in error_detail}
+    passed = [sample for sample in samples if sample['name'] not in failed]
+    if passed and (not max_errors or len(error_detail) < max_errors):
+        service_errors = validate_samples(
+            passed, sample_url, token,
+            max_errors=max_errors - len(error_detail) if max_errors else None)
+        positions = {sample['name']: idx for idx, sample in enumerate(samples)}
+        error_detail = sorted(error_detail + service_errors,
+                              key=lambda e: positions.get(e.get('sample_name'), len(samples)))
+    if max_errors:
+        error_detail = error_detail[:max_errors]
+    for e in error_detail:
+        report_error(SampleContentWarning(
+            e.get('message'),
+            sample_name=e.get('sample_name'),
+            node=e.get('node'),
+            key=e.get('key'),
+            subkey=e.get('subkey')
+        ), errors)
+
+
+def _raise_failures(samples, failures):
+    """
+    raise the errors of failed sample writes, a single failure is raised as is.
+    """
+    if len(failures) == 1:
+        raise failures[0][1]
+    messages = [f"{samples[idx]['name']}: {err}" for idx, err in failures]
+    raise RuntimeError(f"Failed to save {len(failures)} samples:\n" + "\n".join(messages))
 
-        sample_id, sample_ver = save_sample(sample, sample_url, token,
-                                            previous_version=prev_sample,
-                                            propagate_links=propagate_links)
 
+def _save_samples(samples, acls, sample_url, token, propagate_links,
+                  max_workers=SAMPLE_SAVE_WORKERS, fail_fast=True):
+    """
+    Save samples and update their access control lists, up to `max_workers`
+    samples are written concurrently. Access control lists are updated in bulk
+    afterwards. The saved samples are returned in input order.
+        fail_fast - stop at the first failure. Otherwise every sample is attempted
+                    and all failures are raised together.
+    """
+    saved, failures = save_samples(samples, sample_url, token, propagate_links,
+                                   max_tasks=max_workers, fail_fast=fail_fast)
+    if failures and fail_fast:
+        _raise_failures(samples, failures)
+
+    saved_samples = []
+    acl_updates = []
+    sample_indices = {}
+    for idx, (data, ret) in enumerate(zip(samples, saved)):
+        if ret is None:
+            continue
+        sample_id, sample_ver = ret
         if sample_id:
             saved_samples.append({
                 "id": sample_id,
-                "name": name,
+                "name": data['name'],
                 "version": sample_ver
             })
             # check input for any reason to update access control list
@@ -322,11 +523,18 @@ def _save_samples(samples, acls, sample_url, token, propagate_links):
                 acls["write"] += [w for w in writer]
                 acls["admin"] += [a for a in admin]
             if len(acls["read"]) > 0 or len(acls['write']) > 0 or len(acls['admin']) > 0:
-                _ = update_acls(sample_url, sample_id, acls, token)
+                acl_updates.append((sample_id, copy.deepcopy(acls)))
+                sample_indices[sample_id] = idx
+
+    _, acl_failures = propagate_acls(sample_url, acl_updates, token)
+    failures += [(sample_indices[sample_id], err) for sample_id, err in acl_failures]
+    if failures:
+        failures.sort(key=lambda f: f[0])
+        _raise_failures(samples, failures[:1] if fail_fast else failures)
     return saved_samples
 
 
-def format_input_file(df, params, columns_to_input_names, aliases):
+def format_input_file(df, params, columns_to_input_names, aliases, errors=None):
     # change columns to upload format
     columns_to_input_names = {}
 
@@ -336,13 +544,13 @@ def format_input_file(df, params, columns_to_input_names, aliases):
         if renamed not in columns_to_input_names:
             columns_to_input_names[renamed] = col_name
         else:
-            warnings.warn(SampleContentWarning(
+            report_error(SampleContentWarning(
                 (f"Duplicate column \"{renamed}\". \"{col_name}\" would overwrite a different column \"{columns_to_input_names[renamed]}\". "
                 "Rename your columns to be unique alphanumericaly, ignoring whitespace and case."),
                 key=col_name,
                 column = col_idx,
                 severity='error'
-            ))
+            ), errors)
 
     df = df.rename(columns={columns_to_input_names[col]: col for col in columns_to_input_names})
     df.replace({n: None for n in NOOP_VALS}, inplace=True)
@@ -411,6 +619,64 @@ def format_input_file(df, params, columns_to_input_names, aliases):
     return df, columns_to_input_names
 
 
+def _locate_errors(errors, df, columns_to_input_names, column_groups):
+    """
+    Calculate missing location information (row, column, key, sample name) of
+    SampleContentWarnings from the formatted input dataframe.
+    """
+    err_col_keys = {}
+    err_key_indices = {}
+    for col_idx, col_name in enumerate(df.columns):
+        err_col_keys[col_idx] = col_name
+        err_key_indices[col_name] = col_idx
+        if col_name in columns_to_input_names and columns_to_input_names[col_name] != col_name:
+            err_key_indices[columns_to_input_names[col_name]] = col_idx
+
+    # with duplicate sample names the last row of a name is used
+    sample_names = df['name'].tolist() if 'name' in df.columns else [None] * len(df)
+    err_row_sample_names = dict(zip(df.index, sample_names))
+    err_sample_name_indices = dict(zip(sample_names, df.index))
+
+    # (value column, subkey) -> column of the subkey, from the first group of the value column
+    err_group_columns = {}
+    for group in column_groups:
+        for subkey, col_name in group.items():
+            err_group_columns.setdefault((group.get('value'), subkey), col_name)
+
+    for e in errors:
+        if e.column is not None and e.key is None and e.column in err_col_keys:
+            e.key = err_col_keys[e.column]
+        if e.column is None and e.key is not None and e.key in err_key_indices:
+            e.column = err_key_indices[e.key]
+        if e.row is not None and e.sample_name is None and e.row in err_row_sample_names:
+            e.sample_name = err_row_sample_names[e.row]
+        if (e.row is None and e.sample_name is not None and
+                e.sample_name in err_sample_name_indices):
+            e.row = err_sample_name_indices[e.sample_name]
+        if e.subkey and (e.key, e.subkey) in err_group_columns:
+            e.column = err_key_indices.get(err_group_columns[(e.key, e.subkey)], e.column)
+        e.column_name = err_col_keys.get(e.column)
+
+
+def _has_unignored_errors(errors, params):
+    """
+    errors - list of SampleContentWarnings
+    """
+    severities = ['error'] if params.get('ignore_warnings', 1) else ['error', 'warning']
+    return any(e.severity in severities for e in errors)
+
+
+def _report_rows(df, errors, context_rows):
+    """
+    the rows of df with errors, and `context_rows` rows before and after each of them
+    """
+    rows = set()
+    for row in {e.row for e in errors if e.row is not None}:
+        rows.update(range(row - context_rows, row + context_rows + 1))
+    return df[df.index.isin(rows)]
+
+
+@sample_cache.scope()
 def import_samples_from_file(
     params,
     sample_url,
@@ -423,32 +689,61 @@ def import_samples_from_file(
     column_unit_regex,
     input_sample_set,
     header_row_index,
-    aliases
+    aliases,
+    save_workers=SAMPLE_SAVE_WORKERS,
+    save_fail_fast=True,
+    stage_timer=None
 ):
     """
     import samples from '.csv' or '.xls' files in SESAR  format
+    returns the sample set, whether there are unignored errors, the errors and the
+    rows of the file for the report. With params['report_context_rows'] only the rows
+    with errors and that many rows around them are returned. With params['max_errors']
+    the file is no longer checked once that many errors were found.
+        header_row_index - index of the header row, found from the file when None
+        save_workers     - number of samples saved concurrently
+        save_fail_fast   - stop saving at the first failure instead of reporting all of them
+        stage_timer      - StageTimer the stages of the import are timed with (optional)
     """
-    with SampleContentWarningContext() as errors:
-        # verify inputs
-        sample_file = validate_params(params)
-        df = load_file(sample_file, header_row_index, date_columns)
-
-        if 'sample_template' not in df:
-            df['sample_template'] = params['file_format'].upper()
-
-        df, columns_to_input_names = format_input_file(df, params, {}, aliases)
-        samples = []
-        if not errors.get(severity='error'):
-            acls = {
-                "read": [],
-                "write": [],
-                "admin": [],
-                "public_read": -1  # set to false (<0)
-            }
-            if params.get('share_within_workspace'):
-                # query workspace for user permissions.
-                acls = get_workspace_user_perms(workspace_url, params.get('workspace_id'), token, username, acls)
+    if params.get('chunk_size'):
+        return _import_samples_in_chunks(
+            params, sample_url, workspace_url, callback_url, username, token,
+            column_groups, date_columns, column_unit_regex, input_sample_set,
+            header_row_index, aliases, save_workers, save_fail_fast, stage_timer
+        )
 
+    stage_timer = stage_timer or StageTimer()
+    errors = SampleContentErrors(max_errors=params.get('max_errors'))
+    # verify inputs
+    sample_file = validate_params(params)
+    with stage_timer.stage('header_detection'):
+        excel_file = open_excel_file(sample_file)
+        if header_row_index is None:
+            header_row_index = find_header_row(sample_file, params['file_format'], excel_file)
+    with stage_timer.stage('load_file'):
+        df = load_file(sample_file, header_row_index, date_columns, excel_file)
+        if excel_file is not None:
+            excel_file.close()
+
+    if 'sample_template' not in df:
+        df['sample_template'] = params['file_format'].upper()
+
+    with stage_timer.stage('format_input_file'):
+        df, columns_to_input_names = format_input_file(df, params, {}, aliases, errors)
+    samples = []
+    if not errors.get(severity='error'):
+        acls = {
+            "read": [],
+            "write": [],
+            "admin": [],
+            "public_read": -1  # set to false (<0)
+        }
+        if params.get('share_within_workspace'):
+            # query workspace for user permissions.
+            acls = get_workspace_user_perms(workspace_url, params.get('workspace_id'), token,
+                                            username, acls)
+
+        with stage_timer.stage('produce_samples'):
             samples, existing_samples = _produce_samples(
                 callback_url,
                 df,
@@ -458,74 +753,207 @@ def import_samples_from_file(
                 token,
                 input_sample_set['samples'],
                 columns_to_input_names,
-                params.get('keep_existing_samples', False)
+                params.get('keep_existing_samples', False),
+                errors=errors,
+                stage_timer=stage_timer
             )
 
-        # check when no new sample is created and samples in the input file matches exactly the given input sample_set
-        if not samples and input_sample_set.get('samples') and len(input_sample_set.get('samples')) == len(existing_samples):
-            error_msg = "No sample is produced from the input file.\n"
-            error_msg += "The input sample set has identical information to the input file\n"
+    # check when no new sample is created and samples in the input file matches exactly
+    # the given input sample_set
+    if (not samples and input_sample_set.get('samples') and
+            len(input_sample_set.get('samples')) == len(existing_samples)):
+        error_msg = "No sample is produced from the input file.\n"
+        error_msg += "The input sample set has identical information to the input file\n"
+
+        raise ValueError(error_msg)
+
+    if params.get('prevalidate') and not errors.get(severity='error') and samples:
+        with stage_timer.stage('prevalidate'):
+            _prevalidate(samples, sample_url, token, params.get('prevalidate_max_errors'), errors)
 
-            raise ValueError(error_msg)
+    _locate_errors(errors, df, columns_to_input_names, column_groups)
+
+    has_unignored_errors = _has_unignored_errors(errors.get(), params)
+
+    if has_unignored_errors:
+        saved_samples = []
+    else:
+        with stage_timer.stage('save_samples'):
+            saved_samples = _save_samples(samples, acls, sample_url, token,
+                                          params.get('propagate_links', 0),
+                                          max_workers=save_workers,
+                                          fail_fast=save_fail_fast)
+        saved_samples += existing_samples
+
+    if params.get('report_context_rows') is not None:
+        df = _report_rows(df, errors.get(), int(params['report_context_rows']))
+
+    return {
+        "samples": saved_samples,
+        "description": params.get('description')
+    }, has_unignored_errors, errors.get(), df
+
+
+def _import_samples_in_chunks(
+    params,
+    sample_url,
+    workspace_url,
+    callback_url,
+    username,
+    token,
+    column_groups,
+    date_columns,
+    column_unit_regex,
+    input_sample_set,
+    header_row_index,
+    aliases,
+    save_workers,
+    save_fail_fast,
+    stage_timer=None
+):
+    """
+    Streaming version of `import_samples_from_file` for very large files. The file is
+    read params['chunk_size'] rows at a time and every chunk is formatted and validated
+    before the next one is read. Like the import of a whole file, the samples are only
+    saved once every chunk was validated without errors, so no samples are left saved
+    when the import fails. Once a chunk has errors the rest of the file is still
+    checked so that every error is reported, up to params['max_errors'] errors, but
+    no further samples are kept. Only the rows with errors, and
+    params['report_context_rows'] rows around them, are returned as sample data for
+    the report. The stages of every chunk add up in the stage_timer.
+    """
+    stage_timer = stage_timer or StageTimer()
+    sample_file = validate_params(params)
+    acls = {
+        "read": [],
+        "write": [],
+        "admin": [],
+        "public_read": -1  # set to false (<0)
+    }
+    if params.get('share_within_workspace'):
+        # query workspace for user permissions.
+        acls = get_workspace_user_perms(workspace_url, params.get('workspace_id'), token,
+                                        username, acls)
+
+    max_errors = params.get('max_errors')
+    all_errors = SampleContentErrors(max_errors=max_errors)
+    seen_errors = set()
+    error_rows = []
+    columns = None
+    context_rows = int(params.get('report_context_rows') or 0)
+    has_unignored_errors = False
+    existing_samples = input_sample_set['samples']
+    file_sample_names = set()
+    produced_samples = 0
+    # samples of the chunks validated so far, saved after the last chunk
+    valid_samples = []
+
+    with stage_timer.stage('header_detection'):
+        excel_file = open_excel_file(sample_file)
+        if header_row_index is None:
+            header_row_index = find_header_row(sample_file, params['file_format'], excel_file)
+    field_transformer = FieldTransformer(callback_url, term_cache=ontology_cache)
+    column_plan = None
+    chunks = load_file_chunks(sample_file, header_row_index, date_columns,
+                              int(params['chunk_size']), excel_file)
+    while True:
+        with stage_timer.stage('load_file'):
+            df = next(chunks, None)
+        if df is None:
+            break
+        # identical messages are only capped across all chunks
+        errors = SampleContentErrors(
+            max_identical=None,
+            max_errors=max_errors - all_errors.error_count if max_errors else None
+        )
+        if 'sample_template' not in df:
+            df['sample_template'] = params['file_format'].upper()
+
+        with stage_timer.stage('format_input_file'):
+            df, columns_to_input_names = format_input_file(df, params, {}, aliases, errors)
+        columns = df.columns
+        samples = []
+        if not errors.get(severity='error'):
+            # all chunks have the same columns, they are only classified once
+            if column_plan is None or column_plan.columns != list(df.columns):
+                column_plan = ColumnPlan(df.columns, column_groups, column_unit_regex)
+            # samples of the input sample set that are not in the file are only
+            # removed after the last chunk
+            with stage_timer.stage('produce_samples'):
+                samples, existing_samples = _produce_samples(
+                    callback_url,
+                    df,
+                    column_groups,
+                    column_unit_regex,
+                    sample_url,
+                    token,
+                    existing_samples,
+                    columns_to_input_names,
+                    True,
+                    field_transformer=field_transformer,
+                    column_plan=column_plan,
+                    errors=errors,
+                    stage_timer=stage_timer
+                )
+            file_sample_names.update(str(name) for name in df.get('name', []) if name)
+            produced_samples += len(samples)
 
         if params.get('prevalidate') and not errors.get(severity='error') and samples:
-            error_detail = validate_samples([s['sample'] for s in samples], sample_url, token)
-            for e in error_detail:
-                warnings.warn(SampleContentWarning(
-                        e.get('message'),
-                        sample_name=e.get('sample_name'),
-                        node=e.get('node'),
-                        key=e.get('key'),
-                        subkey=e.get('subkey')
-                    ))
-
-    # Calculate missing location information for SamplesContentError(s)
-    err_col_keys = {}
-    err_key_indices = {}
-    for col_idx, col_name in enumerate(df.columns):
-        err_col_keys[col_idx] = col_name
-        err_key_indices[col_name] = col_idx
-        if col_name in columns_to_input_names and columns_to_input_names[col_name] != col_name:
-            err_key_indices[columns_to_input_names[col_name]] = col_idx
+            with stage_timer.stage('prevalidate'):
+                _prevalidate(samples, sample_url, token, params.get('prevalidate_max_errors'),
+                             errors)
+
+        _locate_errors(errors, df, columns_to_input_names, column_groups)
+        # column level errors are raised again for every chunk
+        chunk_errors = []
+        for e in errors.get():
+            error_key = json.dumps(e.toJSONable(), sort_keys=True, default=str)
+            if error_key not in seen_errors:
+                seen_errors.add(error_key)
+                chunk_errors.append(e)
+                all_errors.add(e)
+        error_rows.append(_report_rows(df, chunk_errors, context_rows))
+
+        has_unignored_errors = has_unignored_errors or _has_unignored_errors(chunk_errors, params)
+        if has_unignored_errors:
+            valid_samples = []
+        else:
+            valid_samples += samples
+        if all_errors.stopped:
+            break
 
-    err_row_sample_names = {}
-    err_sample_name_indices = {}
-    for row_num, row in df.iterrows():
-        sample_name = row.get('name')
-        err_sample_name_indices[sample_name] = row_num
-        err_row_sample_names[row_num] = sample_name
+    if excel_file is not None:
+        excel_file.close()
 
-    for e in errors:
-        if e.column!=None and e.key==None and e.column in err_col_keys:
-            e.key = err_col_keys[e.column]
-        if e.column==None and e.key!=None and e.key in err_key_indices:
-            e.column = err_key_indices[e.key]
-        if e.row!=None and e.sample_name==None and e.row in err_row_sample_names:
-            e.sample_name = err_row_sample_names[e.row]
-        if e.row==None and e.sample_name!=None and e.sample_name in err_sample_name_indices:
-            e.row = err_sample_name_indices[e.sample_name]
-        if e.subkey:
-            for group in column_groups:
-                if e.subkey in group and e.key == group["value"]:
-                    e.column = err_key_indices[group[e.subkey]]
-                    break
-        e.column_name = err_col_keys.get(e.column)
+    if not params.get('keep_existing_samples', False):
+        # remove samples in the existing_samples (input sample_set) but not in the input file
+        existing_samples = [s for s in existing_samples if s['name'] in file_sample_names]
 
-    unignored_errs = errors.get(severity='error')
-    if not params.get('ignore_warnings', 1):
-        unignored_errs.extend(errors.get(severity='warning'))
-    has_unignored_errors = len(unignored_errs) > 0
+    # check when no new sample is created and samples in the input file matches exactly the
+    # given input sample_set
+    if (not produced_samples and input_sample_set.get('samples') and
+            len(input_sample_set.get('samples')) == len(existing_samples)):
+        error_msg = "No sample is produced from the input file.\n"
+        error_msg += "The input sample set has identical information to the input file\n"
+
+        raise ValueError(error_msg)
 
     if has_unignored_errors:
         saved_samples = []
     else:
-        saved_samples = _save_samples(samples, acls, sample_url, token,
-                                      params.get('propagate_links', 0))
+        with stage_timer.stage('save_samples'):
+            saved_samples = _save_samples(valid_samples, acls, sample_url, token,
+                                          params.get('propagate_links', 0),
+                                          max_workers=save_workers,
+                                          fail_fast=save_fail_fast)
         saved_samples += existing_samples
 
-    sample_data_json = df.to_json(orient='split', default_handler=str)
+    if error_rows:
+        sample_data = pd.concat(error_rows)
+    else:
+        sample_data = pd.DataFrame(columns=columns)
 
     return {
         "samples": saved_samples,
         "description": params.get('description')
-    }, has_unignored_errors, errors.get(), sample_data_json
+    }, has_unignored_errors, all_errors.get(), sample_data
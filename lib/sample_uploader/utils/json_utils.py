@@ -0,0 +1,76 @@
+import importlib
+import json
+import re
+
+# JSON encoders in order of preference, the first installed encoder is used.
+# ujson is a faster encoder, its output is the same as that of json. json is used
+# where ujson is not installed.
+JSON_ENCODERS = ['ujson', 'json']
+
+# ujson writes negative exponents with a single digit where json writes two, i.e. 1e-5 and 1e-05
+_SHORT_EXPONENT = re.compile(r'(?<=\d)e-\d(?!\d)')
+
+
+def _ujson_dumps(obj, default=None):
+    """
+    obj as json.dumps(obj, default=default) encodes it, or None if ujson can not
+    produce the same output.
+    """
+    import ujson
+    try:
+        out = ujson.dumps(obj, ensure_ascii=True, escape_forward_slashes=False,
+                          separators=(', ', ': '), default=default)
+    except (TypeError, ValueError, OverflowError, RecursionError):
+        # i.e. bytes, or objects json fails on as well, json raises the error
+        return None
+    if 'e-' in out and _SHORT_EXPONENT.search(out):
+        return None
+    # DEL is the only ASCII character json escapes and ujson does not, it only occurs in strings
+    return out.replace('\x7f', '\\u007f')
+
+
+def _json_dumps(obj, default=None):
+    return json.dumps(obj, default=default)
+
+
+# encoder -> (module, encode function returning None when the encoder does not apply)
+JSON_ENCODER_FUNCS = {
+    'ujson': ('ujson', _ujson_dumps),
+    'json': ('json', _json_dumps),
+}
+
+
+def find_json_encoder(encoders=JSON_ENCODERS):
+    """
+    return the first of encoders that is installed
+    """
+    for encoder in encoders:
+        try:
+            importlib.import_module(JSON_ENCODER_FUNCS[encoder][0])
+        except ImportError:
+            continue
+        return encoder
+    raise ValueError(f"None of the JSON encoders {encoders} is installed")
+
+
+JSON_ENCODER = find_json_encoder()
+
+
+def dumps(obj, default=None, encoder=None):
+    """
+    Serialize obj to a JSON string, byte for byte the same as json.dumps(obj, default=default),
+    with the fastest installed encoder. Payloads the encoder can not write the same way
+    are written by json. Decimals and objects with a 'toDict' or '__json__' method are
+    encoded by ujson itself instead of with `default`, they must not be part of obj.
+        obj     - object to serialize
+        default - function that returns a serializable version of objects that can
+                  not be serialized otherwise, as for json.dumps
+        encoder - one of JSON_ENCODERS, by default JSON_ENCODER
+    """
+    encoder = encoder or JSON_ENCODER
+    if encoder not in JSON_ENCODER_FUNCS:
+        raise ValueError(f"Unknown JSON encoder {encoder}, encoders are {JSON_ENCODERS}")
+    out = JSON_ENCODER_FUNCS[encoder][1](obj, default)
+    if out is None:
+        out = _json_dumps(obj, default)
+    return out
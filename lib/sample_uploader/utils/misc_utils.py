@@ -1,6 +1,8 @@
+import asyncio
 import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from installed_clients.WorkspaceClient import Workspace
 from jinja2 import Environment, PackageLoader, select_autoescape
@@ -10,6 +12,14 @@ env = Environment(
     loader=PackageLoader('sample_uploader','utils/templates'),
     autoescape=select_autoescape(['html'])
 )
+# static files of the error report, copied into every report
+ERROR_UI_STATIC = '/kb/module/data/error_ui_static'
+# the DataTables bundle of the error report, loaded from the DataTables CDN instead of
+# being copied into and uploaded with every report
+ERROR_UI_DATATABLES = ('https://cdn.datatables.net/v/dt/jq-3.3.1/jszip-2.5.0/dt-1.10.24/'
+                       'b-1.7.0/b-html5-1.7.0/kt-2.6.1/r-2.2.7/sc-2.0.3/sl-1.3.3/')
+# number of sample rows per data file of the error report, the report loads them when shown
+ERROR_UI_PAGE_SIZE = 1000
 
 def get_workspace_user_perms(workspace_url, workspace_id, token, owner, acls):
     """
@@ -35,28 +45,131 @@ def get_workspace_user_perms(workspace_url, workspace_id, token, owner, acls):
     return acls
 
 
-def error_ui(errors, sample_data_json, failed, scratch):
+def map_concurrently(func, items, max_workers, fail_fast=True):
+    """
+    Call `func` on every item, with up to `max_workers` calls in flight.
+        func        - function of one argument
+        items       - list of arguments
+        max_workers - maximum number of concurrent calls, 1 calls `func` serially
+        fail_fast   - once a call fails, no further calls are started
+    returns (results, failures)
+        results  - list of return values in the order of `items`, None for failed calls
+        failures - list of (index, exception) tuples, ordered by index
+    """
+    results = [None] * len(items)
+    failures = []
+    if max_workers <= 1:
+        for idx, item in enumerate(items):
+            try:
+                results[idx] = func(item)
+            except Exception as err:
+                failures.append((idx, err))
+                if fail_fast:
+                    break
+        return results, failures
+
+    pending = iter(enumerate(items))
+    in_flight = {}
+    stop = False
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            while not stop and len(in_flight) < max_workers:
+                next_item = next(pending, None)
+                if next_item is None:
+                    break
+                idx, item = next_item
+                in_flight[executor.submit(func, item)] = idx
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = in_flight.pop(future)
+                try:
+                    results[idx] = future.result()
+                except Exception as err:
+                    failures.append((idx, err))
+                    stop = stop or fail_fast
+    failures.sort(key=lambda f: f[0])
+    return results, failures
+
+
+async def map_concurrently_async(func, items, max_tasks, fail_fast=True):
+    """
+    asyncio version of `map_concurrently`, all calls run in the current event loop.
+        func      - coroutine function of one argument
+        items     - list of arguments
+        max_tasks - maximum number of concurrent calls
+        fail_fast - once a call fails, no further calls are started
+    returns (results, failures) as `map_concurrently`
+    """
+    results = [None] * len(items)
+    failures = []
+    semaphore = asyncio.Semaphore(max(1, max_tasks))
+
+    async def _call(idx, item):
+        async with semaphore:
+            if failures and fail_fast:
+                return
+            try:
+                results[idx] = await func(item)
+            except Exception as err:
+                failures.append((idx, err))
+
+    await asyncio.gather(*[_call(idx, item) for idx, item in enumerate(items)])
+    failures.sort(key=lambda f: f[0])
+    return results, failures
+
+
+def write_sample_pages(sample_data, site_path, page_size=ERROR_UI_PAGE_SIZE):
+    """
+    Write the rows of the DataFrame sample_data to JSON files of `page_size` rows in
+    site_path/data, each in the 'split' format of DataFrame.to_json.
+    returns the manifest of the files, with the 'columns', number of 'rows',
+    'page_size' and the paths of the 'pages' relative to site_path
+    """
+    data_path = os.path.join(site_path, 'data')
+    os.makedirs(data_path)
+    pages = []
+    for start in range(0, len(sample_data), page_size):
+        page = os.path.join('data', 'samples_{}.json'.format(len(pages)))
+        sample_data.iloc[start:start + page_size].to_json(
+            os.path.join(site_path, page), orient='split', default_handler=str)
+        pages.append(page)
+    return {
+        'columns': [str(c) for c in sample_data.columns],
+        'rows': len(sample_data),
+        'page_size': page_size,
+        'pages': pages
+    }
+
+
+def error_ui(errors, sample_data, failed, scratch, asset_path=ERROR_UI_STATIC,
+             page_size=ERROR_UI_PAGE_SIZE, datatables_url=ERROR_UI_DATATABLES):
     """
     TODO: make this better/change it all
     errors: list of errors
+    sample_data: DataFrame of the sample rows shown in the report
     scratch: kbase scratch space
+    asset_path: static files of the report
+    page_size: number of sample rows per data file, only the pages shown are loaded
+    datatables_url: directory of datatables.min.js and datatables.min.css
     """
     template = env.get_template('index.html')
     site_path = os.path.join(scratch, str(uuid.uuid4()), 'report_site')
     html_path = os.path.join(site_path, 'index.html')
-    asset_path = '/kb/module/data/error_ui_static'
     shutil.copytree(
         asset_path,
         os.path.join(site_path, 'static')
     )
+    sample_pages = write_sample_pages(sample_data, site_path, page_size)
 
     error_data = [e.toJSONable() for e in errors]
 
-    rendered_html = template.render(
-        error_data=error_data,
-        sample_data_json=sample_data_json,
-        failed=failed
-    )
     with open(html_path, 'w') as f:
-        f.write(rendered_html)
+        f.writelines(template.generate(
+            error_data=error_data,
+            sample_pages=sample_pages,
+            failed=failed,
+            datatables_url=datatables_url
+        ))
     return site_path
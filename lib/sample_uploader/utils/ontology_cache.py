@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+
+# bounds for the process wide cache of ontology lookups
+ONTOLOGY_CACHE_MAX_ENTRIES = 50000
+# seconds an ontology lookup is reused for, terms are rarely renamed or added
+ONTOLOGY_CACHE_TTL = 60 * 60
+
+
+class OntologyTermCache:
+    """
+    Thread-safe LRU cache for the results of OntologyAPI term lookups, keyed by
+    (namespace, normalized term name). Entries expire `ttl` seconds after they
+    were added, so that changes to the ontology are eventually picked up. Lookups
+    that found no term or several terms are cached as well. Cached values are
+    shared and must not be modified.
+    """
+    def __init__(self, max_entries=ONTOLOGY_CACHE_MAX_ENTRIES, ttl=ONTOLOGY_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        return the cached value for key or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['expires'] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry['value']
+
+    def put(self, key, value):
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = {
+                'value': value,
+                'expires': time.monotonic() + self.ttl
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+# shared by all imports in the server process
+ontology_cache = OntologyTermCache()
@@ -0,0 +1,228 @@
+import pandas as pd
+
+from sample_uploader.utils.mappings import SAMP_SERV_CONFIG
+from sample_uploader.utils.sample_utils import _find_missing_fields, find_column_units
+
+# columns with a special meaning for the sample, these never become metadata.
+RESERVED_COLS = ['name', 'kbase_sample_id', 'parent_id']
+
+
+def _to_float(val):
+    # try to assign value as a float if possible
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return val
+
+
+def _to_floats(values):
+    """
+    values of a column as floats where possible, the other values are kept as is.
+    Most numeric cells are found with one pd.to_numeric call for the whole column,
+    the cells it rejects are tried with float(), which also accepts e.g. '1_000'
+    and non-ASCII digits.
+        values - pd.Series
+    """
+    if pd.api.types.is_datetime64_any_dtype(values) or pd.api.types.is_timedelta64_dtype(values):
+        return values.tolist()
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(float).tolist()
+    numeric = pd.to_numeric(values, errors='coerce').notnull().tolist()
+    return [float(val) if is_numeric else _to_float(val)
+            for val, is_numeric in zip(values.tolist(), numeric)]
+
+
+class ColumnPlan:
+    """
+    Classification of the columns of an input file, built once per import.
+
+    Records which columns are controlled metadata, the group each controlled
+    column belongs to, the user metadata groups, the units captured from the
+    column names, the default fields of the validators and which controlled
+    columns are string typed. Building samples then needs no further lookups
+    in SAMP_SERV_CONFIG or the groups.
+    """
+    def __init__(self, columns, groups, unit_rules):
+        """
+        columns    - columns of the input pandas.DataFrame, after 'format_input_file'
+        groups     - list of dicts - each dict is a grouping where key = "metadata field name"
+                     (i.e. "value", or "units") and value = input file column name
+        unit_rules - list of regexes that capture the units associated with all fields.
+        """
+        self.columns = list(columns)
+        self.cols = [col for col in self.columns if col not in RESERVED_COLS]
+
+        # controlled columns, with their (first) matching group
+        group_values = {}
+        for idx, group in enumerate(groups):
+            group_values.setdefault(str(group['value']).strip().lower(), idx)
+        self.controlled_cols = []
+        self.controlled_groups = {}
+        self.default_fields = {}
+        self.string_cols = set()
+        for col in self.cols:
+            ss_validator = SAMP_SERV_CONFIG['validators'].get(col, None)
+            if not ss_validator:
+                continue
+            self.controlled_cols.append(col)
+            idx = group_values.get(str(col).strip().lower())
+            if idx is not None:
+                self.controlled_groups[col] = groups[idx]
+            # fields besides 'value' the validators require, with their default values
+            self.default_fields[col] = _find_missing_fields({'value': None}, ss_validator)
+            if ss_validator.get('key_metadata', {}).get('type') == 'string':
+                self.string_cols.add(col)
+
+        # user metadata groups, only those with a 'value' column in the file
+        self.user_groups = [g for g in groups if g['value'] in self.cols]
+
+        # units captured from the column names, first matching rule wins.
+        self.col_units = {}
+        for col in self.cols:
+            units = find_column_units(col, tuple(unit_rules or []))
+            if units:
+                self.col_units[col] = units
+
+
+class SampleBuilder:
+    """
+    Column-wise builder for samples from an input pandas.DataFrame.
+
+    Every column is classified (controlled, grouped, user) and converted
+    (null mask, numeric coercion, units) once for the whole file. Building the
+    'node_tree' of a sample is then only dict assembly from the precomputed
+    column arrays.
+    """
+    def __init__(self, df, groups, unit_rules, plan=None):
+        """
+        df         - input pandas.DataFrame, after 'format_input_file'
+        groups     - list of dicts - each dict is a grouping where key = "metadata field name"
+                     (i.e. "value", or "units") and value = input file column name
+        unit_rules - list of regexes that capture the units associated with all fields.
+        plan       - ColumnPlan of earlier parts of the same file (optional), it is
+                     only used if the columns of df are the same.
+        """
+        if plan is None or plan.columns != list(df.columns):
+            plan = ColumnPlan(df.columns, groups, unit_rules)
+        self.plan = plan
+        self.cols = plan.cols
+        self.controlled_cols = plan.controlled_cols
+
+        self._raw = {}
+        self._null = {}
+        self._num = {}
+        for col in df.columns:
+            values = df[col].tolist()
+            self._raw[col] = values
+            self._null[col] = df[col].isnull().tolist()
+            if col in self.cols:
+                self._num[col] = _to_floats(df[col])
+
+    def value(self, col, idx):
+        """raw value of column `col` at positional row `idx`, None if column missing."""
+        if col not in self._raw:
+            return None
+        return self._raw[col][idx]
+
+    def set_value(self, col, idx, val):
+        """replace the value of a cell, i.e. after a field transformation."""
+        self._raw[col][idx] = val
+        self._null[col][idx] = pd.isnull(val)
+        if col in self._num:
+            self._num[col][idx] = _to_float(val)
+
+    def set_column(self, col, values):
+        """replace all values of column `col`, i.e. after a column wide transformation."""
+        values = pd.Series(list(values), dtype=object)
+        self._raw[col] = values.tolist()
+        self._null[col] = values.isnull().tolist()
+        if col in self._num:
+            self._num[col] = _to_floats(values)
+
+    def _grouped_data(self, group, idx):
+        mtd = {}
+        used_cols = set([])
+        for val in group:
+            # if starts with 'str:', not a column
+            if group[val].startswith('str:'):
+                mtd[val] = group[val][4:]
+            # default behaviour expects a column as the value
+            elif group[val] in self._num and not self._null[group[val]][idx]:
+                mtd[val] = self._num[group[val]][idx]
+                used_cols.add(group[val])
+        return mtd, used_cols
+
+    def controlled_metadata(self, idx):
+        metadata = {}
+        used_cols = set([])
+        for col in self.controlled_cols:
+            # we don't store empty values
+            if self._null[col][idx]:
+                continue
+            mtd = {"value": self._num[col][idx]}
+            # checking if there is a "grouping" for the metadata field `col`
+            # "grouping" = two or more columns compose into one metadata field
+            group = self.plan.controlled_groups.get(col)
+            if group is not None:
+                mtd, grouped_used_cols = self._grouped_data(group, idx)
+                used_cols.update(grouped_used_cols)
+
+            for field, default in self.plan.default_fields[col].items():
+                if field not in mtd:
+                    mtd[field] = default
+
+            if col in self.plan.string_cols:
+                mtd['value'] = str(mtd['value'])
+
+            metadata[col] = mtd
+            used_cols.add(col)
+
+        return metadata, used_cols
+
+    def user_metadata(self, idx, controlled_cols):
+        metadata = {}
+        used_cols = set(controlled_cols)
+        # first we iterate through the groups
+        for group in self.plan.user_groups:
+            if group['value'] in controlled_cols or self._null[group['value']][idx]:
+                continue
+            mtd, grouped_used_cols = self._grouped_data(group, idx)
+            used_cols.update(grouped_used_cols)
+            metadata[group['value']] = mtd
+
+        for col in self.cols:
+            if col in used_cols or self._null[col][idx]:
+                continue
+            metadata[col] = {"value": self._num[col][idx]}
+            if col in self.plan.col_units:
+                metadata[col]["units"] = self.plan.col_units[col]
+
+        return metadata
+
+    def source_meta(self, idx, contr_meta_keys, columns_to_input_names):
+        return [{
+            'key': col,
+            'skey': columns_to_input_names.get(col),
+            'svalue': {
+                "value": self._raw[col][idx]
+            }
+        } for col in contr_meta_keys]
+
+    def build(self, idx, name, columns_to_input_names):
+        """
+        assemble the sample at positional row `idx`
+        """
+        controlled_metadata, controlled_cols = self.controlled_metadata(idx)
+        user_metadata = self.user_metadata(idx, controlled_cols)
+        source_meta = self.source_meta(idx, controlled_metadata.keys(), columns_to_input_names)
+        return {
+            'node_tree': [{
+                "id": name,
+                "parent": None,
+                "type": "BioReplicate",
+                "meta_controlled": controlled_metadata,
+                "meta_user": user_metadata,
+                'source_meta': source_meta
+            }],
+            'name': name,
+        }
@@ -0,0 +1,150 @@
+import contextvars
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+# bounds for the sample cache of a method call
+SAMPLE_CACHE_MAX_ENTRIES = 20000
+SAMPLE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class SampleCache:
+    """
+    Thread-safe LRU cache for sample documents keyed by (sample id, version).
+
+    A saved version of a sample never changes, so it can be reused by every code
+    path of a method call. Lookups without a version ("latest") must never be
+    answered from here. Entries are bounded both by count and by their size in
+    bytes (the size of their JSON representation). The cache does not know who
+    may read a sample, it must only be shared by requests with the same token.
+    """
+    def __init__(self, max_entries=SAMPLE_CACHE_MAX_ENTRIES, max_bytes=SAMPLE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, sample_id, version):
+        """
+        return a copy of the cached sample or None.
+        """
+        if not version:
+            return None
+        key = (sample_id, int(version))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            sample = entry['sample']
+        return copy.deepcopy(sample)
+
+    def put(self, sample, nbytes):
+        """
+        sample - sample as returned by SampleService, with 'id' and 'version'
+        nbytes - approximate size of the sample, i.e. the length of its JSON
+        """
+        if not sample.get('id') or not sample.get('version'):
+            return
+        if nbytes > self.max_bytes:
+            return
+        key = (sample['id'], int(sample['version']))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = {
+                'sample': copy.deepcopy(sample),
+                'nbytes': nbytes
+            }
+            self._bytes += nbytes
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted['nbytes']
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+# the SampleCache of the current call, see CallSampleCache
+_call_cache = contextvars.ContextVar('sample_uploader_sample_cache', default=None)
+
+
+class CallSampleCache:
+    """
+    The SampleCache of the current method call. All requests of a call use the
+    token of its user, so a sample one of them fetched may be reused by the others.
+    The cache is dropped at the end of the call, no tokens are kept and a sample
+    is not served to a later call whose user may no longer read it.
+
+    Samples are only cached within `scope()`, which can be entered with `with` or
+    used as a decorator. Nested scopes share the cache of the outermost one. The
+    cache is seen by the asyncio tasks of the call, threads of the call only see it
+    when they run in a copy of its context, see `contextvars.copy_context`.
+
+        @sample_cache.scope()
+        def sample_set_to_output(sample_set, sample_url, token, output_file, output_file_format):
+    """
+    def __init__(self, max_entries=SAMPLE_CACHE_MAX_ENTRIES, max_bytes=SAMPLE_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @contextmanager
+    def scope(self):
+        if _call_cache.get() is not None:
+            yield
+            return
+        cache = SampleCache(self.max_entries, self.max_bytes)
+        reset_token = _call_cache.set(cache)
+        try:
+            yield
+        finally:
+            _call_cache.reset(reset_token)
+            logging.info('sample cache: {}'.format(cache.stats()))
+
+    def get(self, sample_id, version):
+        """
+        return a copy of the sample cached by the current call or None.
+        """
+        cache = _call_cache.get()
+        return None if cache is None else cache.get(sample_id, version)
+
+    def put(self, sample, nbytes):
+        cache = _call_cache.get()
+        if cache is not None:
+            cache.put(sample, nbytes)
+
+    def stats(self):
+        """
+        the stats of the cache of the current call, None outside of a call
+        """
+        cache = _call_cache.get()
+        return None if cache is None else cache.stats()
+
+
+# the cache of the current call, for all code paths of the server process
+sample_cache = CallSampleCache()
@@ -1,25 +1,38 @@
-import requests
 import uuid
 import json
+import contextvars
+import functools
+import hashlib
+import numbers
 import os
 import re
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-from sample_uploader.utils.mappings import SAMP_SERV_CONFIG
-from sample_uploader.utils.parsing_utils import (
-    parse_grouped_data,
-    check_value_in_list,
-    handle_groups_metadata
-)
+from sample_uploader.utils.sample_cache import sample_cache
+from sample_uploader.utils.http_session import http_session
+from sample_uploader.utils.json_utils import dumps as json_dumps
+from sample_uploader.utils.stage_timer import service_calls
 from installed_clients.DataFileUtilClient import DataFileUtil
 from installed_clients.WorkspaceClient import Workspace as workspaceService
 from installed_clients.SampleServiceClient import SampleService
 
+# number of samples per 'get_samples' request and number of requests in flight
+SAMPLE_FETCH_CHUNK_SIZE = 1000
+SAMPLE_FETCH_WORKERS = 4
+# number of samples per 'update_samples_acls' request
+SAMPLE_ACL_CHUNK_SIZE = 1000
+# limits of a 'validate_samples' request, in number of samples and bytes, and requests in flight
+SAMPLE_VALIDATE_CHUNK_SIZE = 1000
+SAMPLE_VALIDATE_MAX_BYTES = 16 * 1024 * 1024
+SAMPLE_VALIDATE_WORKERS = 4
+
 
 def _handle_response(resp):
     """
     resp - response object from request to SampleService
     """
+    service_calls.add('SampleService')
     if not resp.ok:
         try:
             resp_data = json.loads(resp.text)
@@ -110,108 +123,102 @@ def update_acls(sample_url, sample_id, acl_updates, token):
         "version": "1.1"
     }
 
-    resp = requests.post(url=sample_url, data=json.dumps(replace_payload), headers=headers)
+    resp = http_session.post(url=sample_url, data=json_dumps(replace_payload), headers=headers)
     _ = _handle_response(resp)
     return resp.status_code
 
 
-def generate_source_meta(row, contr_meta_keys, columns_to_input_names):
+def update_samples_acls(sample_url, sample_ids, acl_updates, token):
     """
+    Query sample service to update the access control lists of many samples at once.
+        sample_url  - url of sample service
+        sample_ids  - list of sample ids as given by sample service
+        acl_updates - same as for `update_acls`
     """
-    source_meta = []
-    # for col, val in row.iteritems():
-    for col in contr_meta_keys:
-        val = row.get(col)
-        source_meta.append({
-            'key': col,
-            'skey': columns_to_input_names.get(col),
-            'svalue': {
-                "value": val
-            }
-        })
-    return source_meta
-
-
-def generate_user_metadata(row, cols, groups, unit_rules):
-    """
-    row        - row from input pandas.DataFrame object to convert to metadata
-    cols       - columns of input pandas.DataFrame to conver to metadata
-    groups     - list of dictionaries to group in same metadata field
-    unit_rules - list of regexes that capture the units associated with all fields.
-                 the first entry is used before the second which is used before the third and so on..
-                 NOTE: empty list is valid input and results in no unit fields captured from regex.
-    """
-    # first we iterate through the groups
-    metadata, used_cols = handle_groups_metadata(row, cols, groups)
-    cols = list(set(cols) - used_cols)
-
-    for col in cols:
-        # col = col.lower( )
-        if not pd.isnull(row[col]):
-            # if there are column unit rules
-            units = None
-            if unit_rules:
-                for unit_rule in unit_rules:
-                    result = re.search(unit_rule, col)
-                    if result:
-                        # we assume the regex has capturing parantheses.
-                        match = result.group(1)
-                        units = match
-                        # use only first match.
-                        break
-            # try to assing value as a float if possible
-            try:
-                val = float(row[col])
-            except (ValueError, TypeError):
-                val = row[col]
-            metadata[col] = {"value": val}
-            if units:
-                metadata[col]["units"] = units
-
-    return metadata
-
-
-def generate_controlled_metadata(row, groups):
-    """
-    row - row from input pandas.DataFrame object to convert to metadata
-    groups - list of dicts - each dict is a grouping where key = "metadata field name" (i.e. "value
-    ", or "units") and value = input file column name
-    """
-    metadata = {}
-    used_cols = set([])
-    # use the shared fields
-    for col, val in row.iteritems():
-        ss_validator = SAMP_SERV_CONFIG['validators'].get(col, None)
-        # check if `col` is controlled metadata
-        if ss_validator:
-            # check if value associated with `col`, we don't store empty values
-            if not pd.isnull(row[col]):
-                idx = check_value_in_list(col, [g['value'] for g in groups], return_idx=True)
-                try:
-                    val = float(row[col])
-                except (ValueError, TypeError):
-                    val = row[col]
-                mtd = {"value": val}
-                # checking if there is a "grouping" for the metadata field `col`
-                # "grouping" = two or more columns compose into one metadata field
-                idx = check_value_in_list(col, [g['value'] for g in groups], return_idx=True)
-                if idx is not None:
-                    mtd, grouped_used_cols = parse_grouped_data(row, groups[idx])
-                    used_cols.update(grouped_used_cols)
+    headers = {"Authorization": token}
 
-                # verify against validator
-                missing_fields = _find_missing_fields(mtd, ss_validator)
-                for field, default in missing_fields.items():
-                    mtd[field] = default
+    UpdateSamplesACLsParams = {
+        "ids": sample_ids,
+        "admin": acl_updates.get("admin", []),
+        "write": acl_updates.get("write", []),
+        "read": acl_updates.get("read", []),
+        "remove": acl_updates.get("remove", []),
+        "at_least": False
+    }
+    payload = {
+        "method": "SampleService.update_samples_acls",
+        "id": str(uuid.uuid4()),
+        "params": [UpdateSamplesACLsParams],
+        "version": "1.1"
+    }
 
-                col_type = ss_validator.get('key_metadata', {}).get('type')
-                if col_type == 'string':
-                    mtd['value'] = str(mtd['value'])
+    resp = http_session.post(url=sample_url, data=json_dumps(payload), headers=headers)
+    _ = _handle_response(resp)
+    return resp.status_code
 
-                metadata[col] = mtd
-                used_cols.add(col)
 
-    return metadata, used_cols
+def propagate_acls(sample_url, acl_updates, token,
+                   chunk_size=SAMPLE_ACL_CHUNK_SIZE, max_workers=SAMPLE_FETCH_WORKERS):
+    """
+    Apply access control list updates to many samples with bulk 'update_samples_acls'
+    requests. Samples that share the same update are sent together, `chunk_size`
+    samples per request and up to `max_workers` requests in flight. When a request
+    fails, its samples are updated one by one to find the samples at fault.
+        sample_url  - url of sample service
+        acl_updates - list of (sample id, acl update) tuples, acl update as for `update_acls`
+    returns (statuses, failures)
+        statuses - status codes of the successful requests
+        failures - list of (sample id, exception) tuples in input order
+    """
+    groups = {}
+    for sample_id, acls in acl_updates:
+        key = tuple(tuple(acls.get(k, [])) for k in ('admin', 'write', 'read', 'remove'))
+        groups.setdefault(key, (acls, []))[1].append(sample_id)
+    chunks = [
+        (acls, sample_ids[i: i + chunk_size])
+        for acls, sample_ids in groups.values()
+        for i in range(0, len(sample_ids), chunk_size)
+    ]
+
+    def _update_chunk(chunk):
+        acls, sample_ids = chunk
+        try:
+            return [update_samples_acls(sample_url, sample_ids, acls, token)], []
+        except Exception as err:
+            print(f'failed to update ACLs of {len(sample_ids)} samples, '
+                  f'retrying one by one: {err}')
+        statuses, failures = [], []
+        for sample_id in sample_ids:
+            try:
+                statuses.append(update_acls(sample_url, sample_id, acls, token))
+            except Exception as err:
+                failures.append((sample_id, err))
+        return statuses, failures
+
+    statuses, failures = [], []
+    if not chunks:
+        return statuses, failures
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        for chunk_statuses, chunk_failures in executor.map(_update_chunk, chunks):
+            statuses += chunk_statuses
+            failures += chunk_failures
+    order = {sample_id: idx for idx, (sample_id, _) in enumerate(acl_updates)}
+    failures.sort(key=lambda f: order[f[0]])
+    return statuses, failures
+
+
+@functools.lru_cache(maxsize=4096)
+def find_column_units(col, unit_rules):
+    """
+    return the units captured from a column name by the first matching regex, or None.
+        unit_rules - tuple of regexes with a capturing group for the units
+    """
+    for unit_rule in unit_rules:
+        result = re.search(unit_rule, col)
+        if result:
+            # we assume the regex has capturing parantheses.
+            return result.group(1)
+    return None
 
 
 def _find_missing_fields(mtd, ss_validator):
@@ -225,34 +232,50 @@ def _find_missing_fields(mtd, ss_validator):
     return missing_fields
 
 
-def compare_samples(s1, s2):
+def _canonical_value(value):
+    """
+    comparable form of a metadata value, numbers that are equal compare equal
+    whether they are ints or floats.
+    """
+    if isinstance(value, dict):
+        return {str(k): _canonical_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(v) for v in value]
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return int(value) if value.is_integer() else value
+    return str(value)
+
+
+def sample_fingerprint(sample):
+    """
+    return a hash of the content of a sample that compare_samples compares,
+    the 'name' and 'node_tree' without the 'source_meta' field of the nodes.
+    """
+    content = {
+        'name': sample['name'],
+        'node_tree': [{k: v for k, v in node.items() if k != 'source_meta'}
+                      for node in sample['node_tree']]
+    }
+    canonical = json.dumps(_canonical_value(content), sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def compare_samples(s1, s2, s1_fingerprint=None, s2_fingerprint=None):
     """
     return True if samples are the same,
         does not compare source_meta field
     s1, s2 - samples with the following fields:
         'node_tree', 'name'
+    s1_fingerprint, s2_fingerprint - sample_fingerprint of s1 and s2 if already known
     """
-
     if s1 is None or s2 is None:
         return False
-    else:
-        print('start comparing samples: {} vs {}'.format(s1['name'], s2['name']))
-
-        def remove_field(node, field):
-            if field in node:
-                node.pop(field)
-            return node
-        # don't compare 'source_meta' field
-        s1_nt = [remove_field(n, 'source_meta') for n in s1['node_tree']]
-        s2_nt = [remove_field(n, 'source_meta') for n in s2['node_tree']]
-
-        # TODO: worth scrutiny
-        comp = s1['name'] == s2['name'] and s1_nt == s2_nt
-        if comp:
-            print('compared samples are the same')
-        else:
-            print('compared samples are different')
-        return comp
+    return (s1_fingerprint or sample_fingerprint(s1)) == (s2_fingerprint or sample_fingerprint(s2))
 
 
 def get_sample(sample_info, sample_url, token):
@@ -260,7 +283,11 @@ def get_sample(sample_info, sample_url, token):
     sample_info - dict containing 'id' and 'version' of a sample
     sample_url - SampleService Url
     token      - Authorization token
+    Versioned lookups are served from the sample cache of the call when possible.
     """
+    sample = sample_cache.get(sample_info['id'], sample_info.get('version'))
+    if sample is not None:
+        return sample
     headers = {
         "Authorization": token,
         "Content-Type": "application/json"
@@ -281,18 +308,88 @@ def get_sample(sample_info, sample_url, token):
     # print('url', sample_url)
     # print('payload', json.dumps(payload))    
     # print('-'*80)
-    resp = requests.post(url=sample_url, headers=headers, data=json.dumps(payload))
+    resp = http_session.post(url=sample_url, headers=headers, data=json_dumps(payload))
     resp_json = _handle_response(resp)
     sample = resp_json['result'][0]
+    sample_cache.put(sample, len(resp.content))
     return sample
 
 
-def save_sample(sample, sample_url, token, previous_version=None, propagate_links=0):
+def get_samples(sample_infos, sample_url, token):
+    """ Get many samples from SampleService in a single request
+    sample_infos - list of dicts containing 'id' and optionally 'version' of a sample
+    sample_url - SampleService Url
+    token      - Authorization token
+    """
+    headers = {
+        "Authorization": token,
+        "Content-Type": "application/json"
+    }
+    samples = []
+    for sample_info in sample_infos:
+        sample_params = {"id": sample_info['id']}
+        if sample_info.get('version'):
+            sample_params['version'] = sample_info['version']
+        samples.append(sample_params)
+    payload = {
+        "method": "SampleService.get_samples",
+        "id": str(uuid.uuid4()),
+        "params": [{"samples": samples}],
+        "version": "1.1"
+    }
+    resp = http_session.post(url=sample_url, headers=headers, data=json_dumps(payload))
+    resp_json = _handle_response(resp)
+    samples = resp_json['result'][0]
+    for sample in samples:
+        sample_cache.put(sample, len(resp.content) // len(samples))
+    return samples
+
+
+def prefetch_samples(sample_ids, sample_url, token,
+                     chunk_size=SAMPLE_FETCH_CHUNK_SIZE, max_workers=SAMPLE_FETCH_WORKERS):
+    """
+    Fetch the latest version of many samples with 'get_samples', `chunk_size` samples
+    per request and up to `max_workers` requests in flight.
+    sample_ids - iterable of sample ids
+    sample_url - SampleService Url
+    token      - Authorization token
+    returns a dict mapping sample id to sample. Samples of a failed request are left
+    out, so callers fall back on `get_sample` and get the error for the sample at fault.
+    """
+    sample_ids = list(dict.fromkeys(sample_ids))
+    if not sample_ids:
+        return {}
+    chunks = [
+        [{"id": sample_id} for sample_id in sample_ids[i: i + chunk_size]]
+        for i in range(0, len(sample_ids), chunk_size)
+    ]
+
+    def _fetch_chunk(chunk):
+        try:
+            return get_samples(chunk, sample_url, token)
+        except Exception as err:
+            print(f'failed to prefetch {len(chunk)} samples: {err}')
+            return []
+
+    samples = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        # the fetched samples are added to the sample cache of the call
+        futures = [executor.submit(contextvars.copy_context().run, _fetch_chunk, chunk)
+                   for chunk in chunks]
+        for future in futures:
+            for sample in future.result():
+                samples[sample['id']] = sample
+    return samples
+
+
+def save_sample(sample, sample_url, token, previous_version=None, propagate_links=0,
+                fingerprint=None):
     """
     sample     - completed sample as per
     sample_url - url to sample service
     token      - workspace token for Authorization
     previous_version - data of previous version of sample
+    fingerprint - sample_fingerprint of sample if already known
     """
     print('start saving sample')
     headers = {
@@ -301,7 +398,7 @@ def save_sample(sample, sample_url, token, previous_version=None, propagate_link
     }
     if previous_version:
         prev_sample = get_sample({"id": previous_version["id"]}, sample_url, token)
-        if compare_samples(sample, prev_sample):
+        if compare_samples(sample, prev_sample, fingerprint):
             return None, None
         sample['id'] = previous_version['id']
         params = {
@@ -324,7 +421,8 @@ def save_sample(sample, sample_url, token, previous_version=None, propagate_link
     # print('url', sample_url)
     # print('payload', json.dumps(payload))    
     # print('-'*80)
-    resp = requests.post(url=sample_url, headers=headers, data=json.dumps(payload, default=str))
+    resp = http_session.post(url=sample_url, headers=headers,
+                             data=json_dumps(payload, default=str))
     resp_json = _handle_response(resp)
     sample_id = resp_json['result'][0]['id']
     sample_ver = resp_json['result'][0]['version']
@@ -345,34 +443,76 @@ def save_sample(sample, sample_url, token, previous_version=None, propagate_link
     return sample_id, sample_ver
 
 
-def validate_samples(samples, sample_url, token):
+def _rpc_payload(method, params_json):
     """
-    samples    - list of Sample
-    sample_url - url to sample service
-    token      - workspace token for Authorization
+    JSON-RPC request of `method`, with the already serialized list of its params
+    """
+    return ('{"method": ' + json.dumps(method) + ', "id": ' + json.dumps(str(uuid.uuid4())) +
+            ', "params": ' + params_json + ', "version": "1.1"}')
+
+
+def _validate_chunk(sample_jsons, sample_url, token):
+    """
+    send one 'validate_samples' request for samples that are already serialized
     """
     headers = {
         "Authorization": token,
         "Content-Type": "application/json"
     }
-    params = {
-        "samples": samples
-    }
-    payload = {
-        "method": "SampleService.validate_samples",
-        "id": str(uuid.uuid4()),
-        "params": [params],
-        "version": "1.1"
-    }
-    # print('-'*80)
-    # print('validate samples')
-    # print('url', sample_url)
-    # print('payload', json.dumps(payload))    
-    # print('-'*80)
-    resp = requests.post(url=sample_url, headers=headers, data=json.dumps(payload, default=str))
+    payload = _rpc_payload("SampleService.validate_samples",
+                           '[{"samples": [' + ', '.join(sample_jsons) + ']}]')
+    resp = http_session.post(url=sample_url, headers=headers, data=payload)
     resp_json = _handle_response(resp)
-    errors = resp_json['result'][0]['errors']
-    return errors
+    return resp_json['result'][0]['errors']
+
+
+def validate_samples(samples, sample_url, token, chunk_size=SAMPLE_VALIDATE_CHUNK_SIZE,
+                     max_bytes=SAMPLE_VALIDATE_MAX_BYTES, max_workers=SAMPLE_VALIDATE_WORKERS,
+                     max_errors=None):
+    """
+    samples    - list of Sample
+    sample_url - url to sample service
+    token      - workspace token for Authorization
+    chunk_size - maximum number of samples per request
+    max_bytes  - maximum size of the samples of a request, a larger sample is sent alone
+    max_workers - number of requests in flight
+    max_errors - stop sending requests once this many errors were found (optional)
+    returns the errors in the order of the samples, at most max_errors
+    """
+    chunks = []
+    chunk, chunk_bytes = [], 0
+    for sample in samples:
+        sample_json = json_dumps(sample, default=str)
+        if chunk and (len(chunk) >= chunk_size or chunk_bytes + len(sample_json) > max_bytes):
+            chunks.append(chunk)
+            chunk, chunk_bytes = [], 0
+        chunk.append(sample_json)
+        chunk_bytes += len(sample_json)
+    if chunk:
+        chunks.append(chunk)
+
+    chunk_errors = {}
+    num_errors = 0
+    pending = iter(enumerate(chunks))
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as executor:
+        in_flight = {}
+        while True:
+            while len(in_flight) < max_workers and (max_errors is None or num_errors < max_errors):
+                try:
+                    idx, chunk = next(pending)
+                except StopIteration:
+                    break
+                in_flight[executor.submit(_validate_chunk, chunk, sample_url, token)] = idx
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = in_flight.pop(future)
+                # errors of SampleService are raised as they are
+                chunk_errors[idx] = future.result()
+                num_errors += len(chunk_errors[idx])
+    errors = [e for idx in sorted(chunk_errors) for e in chunk_errors[idx]]
+    return errors if max_errors is None else errors[:max_errors]
 
 
 def get_data_links_from_ss(sample_set_ref, sample_url, token):
@@ -396,7 +536,8 @@ def get_data_links_from_ss(sample_set_ref, sample_url, token):
         "version": "1.1"
     }
 
-    resp = requests.post(url=sample_url, headers=headers, data=json.dumps(payload, default=str))
+    resp = http_session.post(url=sample_url, headers=headers,
+                             data=json_dumps(payload, default=str))
     resp_json = _handle_response(resp)
 
     links = resp_json['result'][0].get('links')
@@ -489,17 +630,3 @@ def build_links(input_staging_file_path, callback_url, workspace_url, workspace_
         links.append({'sample_name': [sample_name], 'obj_ref': obj_ref})
 
     return links
-
-
-def expire_data_link(obj_refs, sample_url, token):
-    ss = SampleService(sample_url, token=token)
-    expired_link_count = 0
-    for upa in obj_refs:
-        links = get_data_links_from_ss(upa, sample_url, token)
-        for link in links:
-            upa, dataid = link.get('upa'), link.get('dataid')
-            print('start expiring link {}-{}'.format(upa, dataid))
-            ss.expire_data_link({'upa': upa, 'dataid': dataid})
-            expired_link_count += 1
-
-    return expired_link_count
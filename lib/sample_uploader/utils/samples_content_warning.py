@@ -1,5 +1,10 @@
+import threading
 import warnings
 
+# number of errors with the same message and severity that are kept, the rest are only counted
+MAX_IDENTICAL_ERRORS = 100
+
+
 class SampleContentWarning(Warning):
     """
     Exception (Warning) type for managing errors which arrise at a certain position in 
@@ -46,32 +51,121 @@ class SampleContentWarning(Warning):
             'severity': self.severity
         }
 
-class SampleContentWarningContext:
+
+class SampleContentErrors:
+    """
+    Collects the `SampleContentWarning`s of an import. Errors are added with `add`,
+    which may be called from many threads at once, and can be accessed using the
+    `get` method.
+    Only the first `max_identical` errors with the same message and severity are
+    kept, a single warning reports how many more there were. Once `max_errors`
+    errors of severity 'error' were added `stopped` is set, so that the import
+    can stop checking the rest of the file.
+    """
+    def __init__(self, max_identical=MAX_IDENTICAL_ERRORS, max_errors=None):
+        """
+        :param max_identical: number of errors kept per message and severity, int or None for all
+        :param max_errors: number of errors of severity 'error' that stop the import, int or None
+        """
+        self.max_identical = max_identical
+        self.max_errors = max_errors
+        self._lock = threading.Lock()
+        self._targeted = []
+        self._counts = {}
+        self._suppressed = {}
+        self._num_errors = 0
+
+    @property
+    def error_count(self):
+        """
+        number of errors of severity 'error' that were added, including those not kept
+        """
+        return self._num_errors
+
+    @property
+    def stopped(self):
+        return bool(self.max_errors) and self._num_errors >= self.max_errors
+
+    def add(self, error):
+        """
+        :param error: SampleContentWarning
+        """
+        if error.severity not in ("error", "warning"):
+            raise ValueError(f'Invalid severity for SampleContentWarning: {error.severity}')
+        message_key = (error.message, error.severity)
+        with self._lock:
+            if error.severity == 'error':
+                self._num_errors += 1
+            count = self._counts.get(message_key, 0) + 1
+            self._counts[message_key] = count
+            if self.max_identical is None or count <= self.max_identical:
+                self._targeted.append(error)
+            elif message_key not in self._suppressed:
+                self._suppressed[message_key] = SampleContentWarning(
+                    error.message, severity=error.severity)
+
+    def get(self, severity=None):
+        with self._lock:
+            errors = list(self._targeted)
+            for (message, sev), summary in self._suppressed.items():
+                more = self._counts[(message, sev)] - self.max_identical
+                summary.message = f'{message} ({more} more {sev}s with this message are not shown)'
+                errors.append(summary)
+        if severity is not None:
+            return [e for e in errors if e.severity == severity]
+        return errors
+
+    def __iter__(self):
+        return iter(self.get())
+
+    def __len__(self):
+        with self._lock:
+            return len(self._targeted) + len(self._suppressed)
+
+    def __getitem__(self, index):
+        return self.get()[index]
+
+
+def report_error(error, errors=None):
+    """
+    add error to the SampleContentErrors errors, without a collector the error is
+    passed to `warnings.warn` for a `SampleContentWarningContext` to capture.
+    """
+    if errors is None:
+        warnings.warn(error)
+    else:
+        errors.add(error)
+
+
+class SampleContentWarningContext(SampleContentErrors):
     """
     Context manager to capture `SampleContentWarning`s which are raised as
     warnings using `warnings.warn`. Use a `with as` block to capture warnings.
     Warnings can then be accessed using the `get` method.
+    The warnings filters are global state of the interpreter, code running in
+    other threads should `add` its errors to the collector instead.
     """
-    def __init__(self):
-        self._severities = ("error","warning")
+    def __init__(self, max_identical=None, max_errors=None):
+        super().__init__(max_identical, max_errors)
         self._warning_catcher = warnings.catch_warnings(record=True)
         self._caught = []
-        self._targeted = []
         self._other_warnings = []
 
+    def add(self, error):
+        self._processCaptured()
+        super().add(error)
+
     def get(self, severity=None):
         self._processCaptured()
-        if severity is not None:
-            return list(filter(lambda e: e.severity == severity, self._targeted))
-        else:
-            return list(self._targeted)
+        return super().get(severity)
 
     def _processCaptured(self):
-        while self._caught:
-            w = self._caught.pop()
+        caught = self._caught[:]
+        del self._caught[:len(caught)]
+        for w in caught:
             if  isinstance(w.message, SampleContentWarning) \
-                    and w.message.severity in self._severities:
-                self._targeted.append(w.message)
+                    and w.message.severity in ("error", "warning"):
+                super().add(w.message)
             else:
                 self._other_warnings.append(w)
 
@@ -90,6 +184,3 @@ class SampleContentWarningContext:
                     w.category,
                     w.filename,
                     w.lineno)
-
-    def __getitem__(self, index):
-        return self._targeted[index]
@@ -0,0 +1,113 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+
+class ServiceCalls:
+    """
+    Thread-safe count of the requests the server process sent to other services,
+    by service name, i.e. 'SampleService' or 'Workspace'.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def add(self, service, count=1):
+        with self._lock:
+            self._counts[service] = self._counts.get(service, 0) + count
+
+    def counts(self):
+        """
+        returns a copy of the counts by service
+        """
+        with self._lock:
+            return dict(self._counts)
+
+
+# counted by the SampleService helpers and the generated clients in the server process
+service_calls = ServiceCalls()
+
+
+class StageTimer:
+    """
+    Wall time and number of service calls of the stages of a method. A stage can be
+    entered several times, i.e. once per chunk of a file, its times and calls add up.
+    Stages can be nested, the time of a stage includes the stages within it. Calls
+    are counted for the whole process, so calls of other methods running at the same
+    time are included.
+
+        timer = StageTimer()
+        with timer.stage('load_file'):
+            df = load_file(sample_file, header_row_index, date_columns)
+    """
+    def __init__(self, calls=service_calls):
+        """
+        calls - ServiceCalls the service calls of the stages are counted from
+        """
+        self.calls = calls
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        with self._lock:
+            stage = self._stages.setdefault(name, {'seconds': 0.0, 'count': 0, 'calls': {}})
+        calls_before = self.calls.counts()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            calls_after = self.calls.counts()
+            with self._lock:
+                stage['seconds'] += seconds
+                stage['count'] += 1
+                for service, count in calls_after.items():
+                    count -= calls_before.get(service, 0)
+                    if count:
+                        stage['calls'][service] = stage['calls'].get(service, 0) + count
+
+    def add(self, name, seconds, count=1):
+        """
+        add time the caller measured to a stage, for code that runs too often to enter
+        `stage` every time, i.e. once per row. No service calls are counted for it.
+        """
+        with self._lock:
+            stage = self._stages.setdefault(name, {'seconds': 0.0, 'count': 0, 'calls': {}})
+            stage['seconds'] += seconds
+            stage['count'] += count
+
+    def toJSONable(self):
+        """
+        list of the stages in the order they were first entered, with the 'stage' name,
+        the wall time in 'seconds', the 'count' of times the stage was entered and the
+        number of 'calls' by service
+        """
+        with self._lock:
+            return [{
+                'stage': name,
+                'seconds': round(stage['seconds'], 3),
+                'count': stage['count'],
+                'calls': dict(stage['calls'])
+            } for name, stage in self._stages.items()]
+
+    def summary(self):
+        """
+        one line of text per stage
+        """
+        lines = []
+        for stage in self.toJSONable():
+            line = '{}: {:.3f} s'.format(stage['stage'], stage['seconds'])
+            if stage['calls']:
+                line += ', ' + ', '.join('{} {} calls'.format(count, service)
+                                         for service, count in sorted(stage['calls'].items()))
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def log(self, method, logger=logging):
+        """
+        log the stages of `method` as one JSON record
+        """
+        logger.info(json.dumps({'method': method, 'stages': self.toJSONable()}))
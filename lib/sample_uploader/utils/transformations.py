@@ -1,29 +1,114 @@
 from installed_clients.OntologyAPIClient import OntologyAPI
-from sample_uploader.utils.samples_content_warning import SampleContentWarning
+from sample_uploader.utils.samples_content_warning import SampleContentWarning, report_error
 from sample_uploader.utils.mappings import SAMP_ONTO_CONFIG
+from sample_uploader.utils.misc_utils import map_concurrently
+import threading
 import time
-import warnings
 import pandas as pd
 
 
 _ID_MAP = {
     "envo_ontology": "ENVO:"
 }
+# number of concurrent OntologyAPI lookups when resolving whole columns
+ONTOLOGY_LOOKUP_WORKERS = 8
 
 def _get_timestamp():
     return int(time.time() * 1000)
 
 
 class FieldTransformer:
-    def __init__(self, callback_url):
+    def __init__(self, callback_url, term_cache=None):
+        """
+        callback_url - url of the OntologyAPI
+        term_cache   - OntologyTermCache shared between imports (optional)
+        """
         self.onto_api = OntologyAPI(callback_url)
+        self.term_cache = term_cache
+        # lookups of this import by (namespace, normalized name)
+        self._terms = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
 
-    def _ontology_field_transforms(self, row, cols):
+    def _get_terms(self, query_ontology, onto_val):
+        """
+        return the params and results of the OntologyAPI query for the term name
+        onto_val. Every name is only queried once, also when no term was found.
+        """
+        key = (query_ontology, onto_val)
+        with self._lock:
+            terms = self._terms.get(key)
+        if terms is None and self.term_cache is not None:
+            terms = self.term_cache.get(key)
+        if terms is None:
+            params = {
+                'name': onto_val,
+                # 'ancestor_term': ,
+                'ts': _get_timestamp(),
+                'ns': query_ontology
+            }
+            ret = self.onto_api.get_term_by_name(params)
+            terms = (params, ret['results'])
+            with self._lock:
+                self.lookups += 1
+            if self.term_cache is not None:
+                self.term_cache.put(key, terms)
+        with self._lock:
+            self._terms[key] = terms
+        return terms
+
+    def resolve_columns(self, columns, max_workers=ONTOLOGY_LOOKUP_WORKERS):
+        '''
+        Resolve the term names of whole ontology columns before the rows are
+        transformed. The unique names of all columns are looked up concurrently.
+        params:
+            columns - dict of column name to list of cell values
+            max_workers - number of concurrent OntologyAPI lookups
+        returns dict of column name to list of cell values, where every name that
+        resolves to exactly one term with the same name is replaced by the term id.
+        The other values are left for `field_transformations` to report per row.
+        '''
+        names = {}
+        for key, values in columns.items():
+            query_ontology = SAMP_ONTO_CONFIG.get(key)[0].get('ontology')
+            id_prefix = _ID_MAP.get(query_ontology)
+            values = pd.Series(values, dtype=object)
+            # skip empty values and values already in 'id' form.
+            values = values[values.notnull() & values.astype(bool)].astype(str)
+            values = values[~values.str.startswith(id_prefix)]
+            names[key] = (query_ontology, id_prefix, values.str.lower().str.strip())
+
+        queries = list({(query_ontology, name)
+                        for query_ontology, _, col_names in names.values()
+                        for name in col_names.unique()})
+        results, failures = map_concurrently(lambda query: self._get_terms(*query),
+                                             queries, max_workers)
+        if failures:
+            raise failures[0][1]
+        term_ids = {}
+        for (query_ontology, name), (_, terms) in zip(queries, results):
+            if len(terms) != 1 or str(terms[0].get('name', '')).lower().strip() != name:
+                continue
+            id_ = terms[0].get('id')
+            if id_ and id_.startswith(_ID_MAP.get(query_ontology)):
+                term_ids[(query_ontology, name)] = id_
+
+        resolved_columns = {}
+        for key, (query_ontology, id_prefix, col_names) in names.items():
+            values = pd.Series(columns[key], dtype=object)
+            col_ids = col_names.map({name: id_ for (ns, name), id_ in term_ids.items()
+                                     if ns == query_ontology}).dropna()
+            values[col_ids.index] = col_ids
+            resolved_columns[key] = values.tolist()
+        return resolved_columns
+
+    def _ontology_field_transforms(self, row, cols, errors=None):
         '''
         Transformations related to fields that are validated against an ontology.
         params:
             row - pd.Series, 1 row of a pd.DataFrame.
             cols - all metadata columns of the input DataFrame/Row
+            errors - SampleContentErrors the warnings are added to (optional)
         '''
         # find which ontology_cols are in the row.
         onto_cols = set(cols).intersection(set([k.lower() for k in SAMP_ONTO_CONFIG.keys()]))
@@ -40,24 +125,22 @@ class FieldTransformer:
             # lower-case and remove white space.
             onto_val = onto_val.lower().strip()
             # check if in appropriate ontology.
-            params = {
-                'name': onto_val,
-                # 'ancestor_term': ,
-                'ts': _get_timestamp(),
-                'ns': query_ontology
-            }
-            ret = self.onto_api.get_term_by_name(params)
+            params, results = self._get_terms(query_ontology, onto_val)
             # ensure there is only 1 result
-            if len(ret['results']) != 1:
-                raise SampleContentWarning(f"Couldn't resolve ontology term. Received {len(ret['results'])} "
-                                         f"results from query with params {params} in OntologyAPI, "
-                                         f"Expected 1 result.", key=key)
-            item = ret['results'][0]
+            if len(results) != 1:
+                raise SampleContentWarning(
+                    f"Couldn't resolve ontology term. Received {len(results)} "
+                    f"results from query with params {params} in OntologyAPI, "
+                    f"Expected 1 result.", key=key)
+            item = results[0]
             # assert the name is the same as query name
             ret_name = str(item.get('name', '')).lower().strip()
             if ret_name != onto_val:
-                warnings.warn(SampleContentWarning(f'name="{ret_name}" in Ontology {query_ontology} '
-                                         f'does not match provided {onto_val}', key=key, sample_name=row.get("name")))
+                report_error(SampleContentWarning(
+                    f'name="{ret_name}" in Ontology {query_ontology} '
+                    f'does not match provided {onto_val}',
+                    key=key, sample_name=row.get("name")
+                ), errors)
             # get the term id.
             id_ = item.get('id')
             # make sure 'id' is in correct format.
@@ -68,13 +151,15 @@ class FieldTransformer:
             row[key] = id_
         return row
 
-    def field_transformations(self, row, cols):
+    def field_transformations(self, row, cols, errors=None):
         '''
         central function for performing any tranformations for fields
         in the input DataFrame Row.
         params:
             row - pd.Series, 1 row of a pd.DataFrame.
             cols - all metadata columns of the input DataFrame/Row
+            errors - SampleContentErrors the warnings are added to, by default
+                     they are passed to `warnings.warn` (optional)
         '''
-        row = self._ontology_field_transforms(row, cols)
+        row = self._ontology_field_transforms(row, cols, errors)
         return row
@@ -7,8 +7,13 @@ value conforms to some convention. All functions should have an option to accept
 
 Functions should error on incorrect input.
 """
+import operator
+
 import pandas as pd
 
+# the names mappings.py gets with `from .verifiers import *`
+__all__ = ['is_string', 'controlled_vocab', 'is_date', 'is_numeric', 'verifiers']
+
 
 def is_string(df_col, params):
     if params.get('max-len'):
@@ -60,3 +65,201 @@ verifiers = {
     "number": is_numeric
 }
 
+
+def _keys_param(params):
+    keys = params.get('keys', params.get('key'))
+    if keys is None:
+        return None
+    return [keys] if isinstance(keys, str) else list(keys)
+
+
+def _present_fields(fields, keys):
+    """the fields of the metadata the validator applies to, all fields when keys is None"""
+    if keys is None:
+        return list(fields.items())
+    return [(key, fields[key]) for key in keys if key in fields]
+
+
+def _check_required(fields, params):
+    failures = []
+    if params.get('required'):
+        for key in _keys_param(params) or []:
+            missing = fields[key].isnull() if key in fields else True
+            failures.append((missing, key, f"Required key {key} is missing"))
+    return failures
+
+
+def _check_string(fields, params):
+    failures = _check_required(fields, params)
+    max_len = params.get('max-len')
+    for key, values in _present_fields(fields, _keys_param(params)):
+        is_str = values.map(lambda val: isinstance(val, str))
+        failures.append((values.notnull() & ~is_str, key,
+                         f"Metadata value at key {key} is not a string"))
+        if max_len:
+            too_long = is_str & (values.where(is_str, '').str.len() > max_len)
+            failures.append((too_long, key, f"Metadata value at key {key} is longer "
+                                            f"than max length of {max_len}"))
+    return failures
+
+
+def _check_enum(fields, params):
+    allowed = set(params.get('allowed-values', []))
+    failures = []
+    for key, values in _present_fields(fields, _keys_param(params)):
+        failures.append((values.notnull() & ~values.isin(allowed), key,
+                         f"Metadata value at key {key} is not in the allowed list of values"))
+    return failures
+
+
+def _number_range(params):
+    lower, upper = params.get('gte', params.get('gt')), params.get('lte', params.get('lt'))
+    return "{}{}, {}{}".format(
+        '[' if params.get('gte') is not None else '(',
+        '-inf' if lower is None else lower,
+        'inf' if upper is None else upper,
+        ']' if params.get('lte') is not None else ')'
+    )
+
+
+def _check_number(fields, params):
+    failures = _check_required(fields, params)
+    for key, values in _present_fields(fields, _keys_param(params)):
+        is_number = values.map(
+            lambda val: isinstance(val, (int, float)) and not isinstance(val, bool))
+        failures.append((values.notnull() & ~is_number, key,
+                         f"Metadata value at key {key} is not an accepted number type"))
+        numbers = pd.to_numeric(values.where(is_number), errors='coerce')
+        if params.get('type') == 'int':
+            failures.append((numbers.notnull() & (numbers % 1 != 0), key,
+                             f"Metadata value at key {key} is not an integer"))
+        out_of_range = pd.Series(False, index=values.index)
+        for bound, fails in _NUMBER_BOUNDS:
+            if params.get(bound) is not None:
+                out_of_range |= fails(numbers, params[bound])
+        failures.append((out_of_range, key, f"Metadata value at key {key} is not within "
+                                            f"the range {_number_range(params)}"))
+    return failures
+
+
+# bound parameters of the 'number' validator and the comparison of values that fail them
+_NUMBER_BOUNDS = [
+    ('gt', operator.le),
+    ('gte', operator.lt),
+    ('lt', operator.ge),
+    ('lte', operator.gt)
+]
+
+
+def _check_units(fields, params):
+    key = params.get('key', 'units')
+    required_units = params.get('units')
+    if key not in fields or not required_units:
+        return []
+    if not _UNIT_REGISTRY:
+        import pint
+        _UNIT_REGISTRY.append(pint.UnitRegistry())
+    ureg = _UNIT_REGISTRY[0]
+    values = fields[key]
+    failures = []
+    for units in values.dropna().unique():
+        try:
+            required = ureg.parse_expression(str(required_units))
+            if ureg.parse_expression(str(units)).is_compatible_with(required):
+                continue
+            message = (f"Units at key {key}, '{units}', are not equivalent to "
+                       f"required units, '{required_units}'")
+        except Exception as err:
+            message = f"unable to parse units '{units}' at key {key}: {err}"
+        failures.append((values == units, key, message))
+    return failures
+
+
+# the pint.UnitRegistry, pint is imported and the registry created on first use
+# as that takes a while
+_UNIT_REGISTRY = []
+
+# SampleService builtin validators that are checked locally
+metadata_checks = {
+    "string": _check_string,
+    "enum": _check_enum,
+    "number": _check_number,
+    "units": _check_units
+}
+
+
+class MetadataValidator:
+    """
+    Local version of the SampleService validators of the controlled metadata keys,
+    compiled from SAMP_SERV_CONFIG['validators']. The checks run on the values of a
+    key of all samples at once, and report errors like SampleService does.
+    Validators that need other services, like 'ontology_has_ancestor', are left
+    to SampleService.
+    """
+    def __init__(self, validators_config):
+        """
+        validators_config - SAMP_SERV_CONFIG['validators']
+        """
+        self.checks = {}
+        for key, config in validators_config.items():
+            checks = []
+            for validator in config.get('validators') or []:
+                check = metadata_checks.get(validator.get('callable_builder'))
+                if check is not None:
+                    checks.append((check, validator.get('parameters') or {}))
+            if checks:
+                self.checks[key] = checks
+
+    def validate(self, key, fields):
+        """
+        key    - controlled metadata key
+        fields - dict of metadata field (i.e. 'value', 'units') to pd.Series of the
+                 values of all samples with the key, all with the same index.
+                 Missing values are null.
+        returns list of (index, subkey, message), with the index labels of the samples
+        that failed the check.
+        """
+        errors = []
+        if not fields:
+            return errors
+        # all fields have the index of the samples, 'value' may be missing
+        index = next(iter(fields.values())).index
+        for check, params in self.checks.get(key, []):
+            for failed, subkey, message in check(fields, params):
+                if failed is True:
+                    errors.append((index.tolist(), subkey, message))
+                elif failed.any():
+                    errors.append((failed[failed].index.tolist(), subkey, message))
+        return errors
+
+    def validate_samples(self, samples):
+        """
+        samples - list of Sample
+        returns the errors in the format of SampleService.validate_samples
+        """
+        key_values = {}
+        for idx, sample in enumerate(samples):
+            for node_idx, node in enumerate(sample['node_tree']):
+                for key, metadata in node.get('meta_controlled', {}).items():
+                    if key in self.checks:
+                        key_values.setdefault(key, []).append(((idx, node_idx), metadata))
+        errors = []
+        for key, values in key_values.items():
+            index = pd.MultiIndex.from_tuples([position for position, _ in values])
+            field_names = {field for _, metadata in values for field in metadata}
+            fields = {field: pd.Series([metadata.get(field) for _, metadata in values],
+                                       index=index, dtype=object)
+                      for field in field_names}
+            for positions, subkey, message in self.validate(key, fields):
+                for idx, node_idx in positions:
+                    errors.append({
+                        'message': f'Validation failed: "{message}"',
+                        'dev_message': message,
+                        'sample_name': samples[idx]['name'],
+                        'node': samples[idx]['node_tree'][node_idx]['id'],
+                        'key': key,
+                        'subkey': subkey,
+                        'position': (idx, node_idx)
+                    })
+        errors.sort(key=lambda e: e.pop('position'))
+        return errors
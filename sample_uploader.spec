@@ -31,6 +31,10 @@ module sample_uploader {
         int ignore_warnings;
         int keep_existing_samples;
         int propagate_links;
+        int chunk_size;
+        int prevalidate_max_errors;
+        int report_context_rows;
+        int max_errors;
     } ImportSampleInputs;
 
     typedef structure {
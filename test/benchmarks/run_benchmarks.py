@@ -0,0 +1,280 @@
+"""
+End-to-end benchmarks of importing, linking and exporting samples, against local
+stand-in services, with synthetic files of every supported file format.
+
+    python test/benchmarks/run_benchmarks.py --output results.json
+    python test/benchmarks/run_benchmarks.py --rows 1000 --compare results.json
+
+Every case runs in a new process with new stand-in services, so its peak memory is
+its own. The results file has the throughput, the time per path and per stage of
+the import, the service calls and the peak memory of each case, with the versions
+they were measured with.
+"""
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(os.path.dirname(BENCHMARK_DIR))
+for path in [BENCHMARK_DIR, os.path.join(REPO_DIR, 'lib')]:
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from stand_in_services import start_stand_in_services  # noqa: E402
+from synthetic_files import FILE_FORMATS, ONTOLOGY_USAGE, write_sample_file  # noqa: E402
+
+BENCHMARK_ROWS = [1000, 10000, 100000]
+# functions of the module that are timed as a whole
+BENCHMARK_PATHS = ['import_samples_from_file', 'create_data_links', 'expire_data_link',
+                   'sample_set_to_output']
+# file_format -> (number of additional user columns, ontology usage) of its files
+BENCHMARK_SHAPES = {
+    'sesar': (10, 'names'),
+    'enigma': (2, 'ids'),
+    'kbase': (40, 'none'),
+}
+# ratio of the times of two runs above which a path is reported as slower
+REGRESSION_RATIO = 1.2
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _call(url, method, params):
+    import requests
+    resp = requests.post(url, data=json.dumps({
+        'method': method, 'params': params, 'version': '1.1', 'id': '0'
+    }))
+    resp.raise_for_status()
+    return resp.json()['result'][0]
+
+
+def run_case(case, url, scratch):
+    """
+    Import the file of `case`, link the samples to a sample set object, expire the
+    links and export the sample set, with the services at `url`.
+    returns the results of the case
+    """
+    from sample_uploader.utils.async_sample_service import create_data_links, expire_data_link
+    from sample_uploader.utils.client_hooks import install_client_hooks
+    from sample_uploader.utils.exporter import sample_set_to_output
+    from sample_uploader.utils.importer import import_samples_from_file
+    from sample_uploader.utils.mappings import ENIGMA_mappings, SESAR_mappings, aliases
+    from sample_uploader.utils.stage_timer import StageTimer
+
+    # as the server does at startup
+    install_client_hooks()
+    mappings = {'enigma': ENIGMA_mappings, 'sesar': SESAR_mappings,
+                'kbase': {}}[case['file_format']]
+    params = {
+        'sample_file': case['sample_file'],
+        'file_format': case['file_format'],
+        'name_field': case['name_field'],
+        'workspace_name': 'benchmark',
+        'prevalidate': 1,
+        # every user column is reported as a warning
+        'ignore_warnings': 1,
+        'chunk_size': case['chunk_size'],
+    }
+    baseline_rss_mb = _peak_rss_mb()
+    timer = StageTimer()
+    # the module prints a line per saved sample and link
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        with timer.stage('import_samples_from_file'):
+            sample_set, has_errors, errors, _ = import_samples_from_file(
+                params, url, url, url, 'benchmark', 'token',
+                mappings.get('groups', []), mappings.get('date_columns', []),
+                mappings.get('column_unit_regex', []), {'samples': []}, None,
+                aliases.get(case['file_format'], {}), stage_timer=timer
+            )
+        if has_errors:
+            raise RuntimeError('Import of {} failed: {}'.format(case['sample_file'], [
+                (e.key, e.message) for e in errors if e.severity == 'error'][:5]))
+        upa = '1/1/1'
+        with timer.stage('create_data_links'):
+            create_data_links(upa, sample_set['samples'], url, 'token')
+        with timer.stage('expire_data_link'):
+            expire_data_link([upa], url, 'token')
+        # SESAR is the only export format
+        with timer.stage('sample_set_to_output'):
+            sample_set_to_output(sample_set, url, 'token',
+                                 os.path.join(scratch, 'export.csv'), 'sesar')
+    stages = timer.toJSONable()
+    return {
+        'paths': {stage['stage']: stage['seconds'] for stage in stages
+                  if stage['stage'] in BENCHMARK_PATHS},
+        'stages': [stage for stage in stages if stage['stage'] not in BENCHMARK_PATHS],
+        'baseline_rss_mb': baseline_rss_mb,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def _run_in_new_process(case, scratch):
+    process, url = start_stand_in_services()
+    try:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as executor:
+            result = executor.submit(run_case, case, url, scratch).result()
+        calls = _call(url, 'StandIn.calls', [])
+        calls.pop('StandIn.calls', None)
+        result['service_calls'] = calls
+    finally:
+        process.terminate()
+        process.join()
+    return result
+
+
+def _versions():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, check=True,
+                                stdout=subprocess.PIPE, universal_newlines=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    import pandas as pd
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def _median_result(runs, rows):
+    """
+    the median times of the paths and stages of the runs of a case of `rows` rows,
+    and the largest peak memory
+    """
+    def median(values):
+        return sorted(values)[len(values) // 2]
+
+    result = dict(runs[0])
+    result['paths'] = {}
+    for path in runs[0]['paths']:
+        seconds = median([run['paths'][path] for run in runs])
+        result['paths'][path] = {'seconds': seconds,
+                                 'rows_per_second': round(rows / max(seconds, 0.001), 1)}
+    result['stages'] = [dict(stage, seconds=median([
+        s['seconds'] for run in runs for s in run['stages'] if s['stage'] == stage['stage']
+    ])) for stage in runs[0]['stages']]
+    result['peak_rss_mb'] = max(run['peak_rss_mb'] for run in runs)
+    if len(runs) > 1:
+        result['runs'] = runs
+    return result
+
+
+def run_benchmarks(rows, file_formats, width=None, ontology=None, chunk_size=None,
+                   repeat=1, scratch=None):
+    """
+    Run every combination of `rows` and `file_formats`.
+        width, ontology - shape of all files, by default as in BENCHMARK_SHAPES
+        chunk_size      - import the files in chunks of that many rows (optional)
+        repeat          - number of runs of each case, the median times are reported
+        scratch         - directory of the files, a temporary directory by default
+    returns the results as written to the results file
+    """
+    results = {
+        'created': datetime.datetime.utcnow().isoformat() + 'Z',
+        'versions': _versions(),
+        'chunk_size': chunk_size,
+        'repeat': repeat,
+        'cases': []
+    }
+    with tempfile.TemporaryDirectory(dir=scratch) as tmp_dir:
+        for file_format in file_formats:
+            default_width, default_ontology = BENCHMARK_SHAPES[file_format]
+            for nrows in rows:
+                case = {
+                    'file_format': file_format,
+                    'rows': nrows,
+                    'width': default_width if width is None else width,
+                    'ontology': ontology or default_ontology,
+                    'chunk_size': chunk_size,
+                }
+                case['sample_file'], case['name_field'] = write_sample_file(
+                    os.path.join(tmp_dir, '{}_{}'.format(file_format, nrows)), file_format,
+                    nrows, case['width'], case['ontology'])
+                case['file_bytes'] = os.path.getsize(case['sample_file'])
+                print('{file_format}: {rows} rows, {width} user columns, ontology {ontology}'
+                      .format(**case), flush=True)
+                result = _median_result([_run_in_new_process(case, tmp_dir)
+                                         for _ in range(repeat)], nrows)
+                os.remove(case['sample_file'])
+                del case['sample_file']
+                case.update(result)
+                for path, timing in result['paths'].items():
+                    print('    {}: {:.3f} s, {:.1f} rows/s'.format(
+                        path, timing['seconds'], timing['rows_per_second']))
+                print('    peak memory: {} MB'.format(result['peak_rss_mb']), flush=True)
+                results['cases'].append(case)
+    return results
+
+
+def compare(old, new, ratio=REGRESSION_RATIO):
+    """
+    Lines comparing the cases of the results `new` with those of `old`, paths that
+    take more than `ratio` times as long as before are marked.
+    """
+    def key(case):
+        return case['file_format'], case['rows'], case['width'], case['ontology']
+
+    old_cases = {key(case): case for case in old['cases']}
+    lines = ['{} -> {}'.format(old['versions']['commit'], new['versions']['commit'])]
+    for case in new['cases']:
+        old_case = old_cases.get(key(case))
+        if old_case is None:
+            continue
+        lines.append('{}: {} rows, {} user columns, ontology {}'.format(*key(case)))
+        for path, timing in case['paths'].items():
+            old_timing = old_case['paths'].get(path)
+            if not old_timing:
+                continue
+            change = timing['seconds'] / max(old_timing['seconds'], 0.001)
+            lines.append('    {}: {:.3f} s -> {:.3f} s ({:.2f}x){}'.format(
+                path, old_timing['seconds'], timing['seconds'], change,
+                '  SLOWER' if change > ratio else ''))
+        lines.append('    peak memory: {} MB -> {} MB'.format(
+            old_case['peak_rss_mb'], case['peak_rss_mb']))
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('--rows', type=int, nargs='+', default=BENCHMARK_ROWS,
+                        help='numbers of rows of the files')
+    parser.add_argument('--formats', nargs='+', choices=list(FILE_FORMATS),
+                        default=list(FILE_FORMATS), help='file formats')
+    parser.add_argument('--width', type=int,
+                        help='number of additional user columns of all files')
+    parser.add_argument('--ontology', choices=ONTOLOGY_USAGE,
+                        help='ontology column values of all files')
+    parser.add_argument('--chunk-size', type=int, help='import the files in chunks of rows')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='number of runs of each case, the median times are reported')
+    parser.add_argument('--scratch', help='directory for the synthetic files')
+    parser.add_argument('--output', default='benchmark_results.json', help='results file')
+    parser.add_argument('--compare', help='results file of an earlier run to compare with')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.rows, args.formats, args.width, args.ontology,
+                             args.chunk_size, args.repeat, args.scratch)
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print('results written to {}'.format(args.output))
+    if args.compare:
+        with open(args.compare) as f:
+            print('\n'.join(compare(json.load(f), results)))
+
+
+if __name__ == '__main__':
+    main()
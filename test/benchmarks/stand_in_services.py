@@ -0,0 +1,166 @@
+import json
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import get_context
+
+
+class StandInServices:
+    """
+    In memory stand-in for the SampleService methods used by the module and for the
+    OntologyAPI, as the SDK callback server runs it. Samples are saved without
+    validation, ontology term names resolve to one ENVO term of the same name.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.links = {}
+        self.jobs = {}
+        # number of requests by method
+        self.calls = {}
+        self.methods = {
+            'SampleService.get_sample': self.get_sample,
+            'SampleService.get_samples': self.get_samples,
+            'SampleService.create_sample': self.create_sample,
+            'SampleService.validate_samples': self.validate_samples,
+            'SampleService.update_sample_acls': self.update_acls,
+            'SampleService.update_samples_acls': self.update_acls,
+            'SampleService.create_data_link': self.create_data_link,
+            'SampleService.get_data_links_from_data': self.get_data_links_from_data,
+            'SampleService.expire_data_link': self.expire_data_link,
+            'SampleService.propagate_data_links': self.propagate_data_links,
+            'OntologyAPI._get_term_by_name_submit': self.get_term_by_name_submit,
+            'OntologyAPI._check_job': self.check_job,
+            'StandIn.calls': self.get_calls,
+        }
+
+    def call(self, method, params):
+        """
+        returns the 'result' of `method`
+        """
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+        if method not in self.methods:
+            raise ValueError(f"Unknown method {method}")
+        return self.methods[method](*params)
+
+    def _sample(self, sample_id, version=None):
+        with self._lock:
+            versions = self.samples.get(sample_id)
+        if not versions:
+            raise ValueError(f"Sample service error code 50010 No such sample: {sample_id}")
+        return versions[(version or len(versions)) - 1]
+
+    def get_sample(self, params):
+        return [self._sample(params['id'], params.get('version'))]
+
+    def get_samples(self, params):
+        return [[self._sample(s['id'], s.get('version')) for s in params['samples']]]
+
+    def create_sample(self, params):
+        sample = dict(params['sample'])
+        sample_id = sample.get('id') or str(uuid.uuid4())
+        with self._lock:
+            versions = self.samples.setdefault(sample_id, [])
+            sample.update(id=sample_id, version=len(versions) + 1, user='benchmark')
+            versions.append(sample)
+        return [{'id': sample_id, 'version': sample['version']}]
+
+    def validate_samples(self, params):
+        return [{'errors': []}]
+
+    def update_acls(self, params):
+        return []
+
+    def create_data_link(self, params):
+        link = {'upa': params['upa'], 'dataid': params.get('dataid'), 'id': params['id'],
+                'version': params['version'], 'node': params['node']}
+        with self._lock:
+            self.links.setdefault(params['upa'], {})[params.get('dataid')] = link
+        return [{'new_link': link}]
+
+    def get_data_links_from_data(self, params):
+        with self._lock:
+            links = list(self.links.get(params['upa'], {}).values())
+        return [{'links': links}]
+
+    def expire_data_link(self, params):
+        with self._lock:
+            self.links.get(params['upa'], {}).pop(params.get('dataid'), None)
+        return []
+
+    def propagate_data_links(self, params):
+        return [{'links': []}]
+
+    def get_term_by_name_submit(self, params):
+        name = params['name']
+        term_id = 'ENVO:{:08d}'.format(int(uuid.uuid5(uuid.NAMESPACE_OID, name)) % 10 ** 8)
+        job_id = str(uuid.uuid4())
+        with self._lock:
+            self.jobs[job_id] = {'results': [{'id': term_id, 'name': name}]}
+        return [job_id]
+
+    def check_job(self, job_id):
+        with self._lock:
+            result = self.jobs.pop(job_id)
+        return [{'finished': 1, 'result': [result]}]
+
+    def get_calls(self):
+        with self._lock:
+            return [dict(self.calls)]
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """
+    JSON-RPC 1.1 requests to the StandInServices of the server
+    """
+    protocol_version = 'HTTP/1.1'
+    # answers are written in two parts, headers and body
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        body = {'version': '1.1', 'id': payload.get('id')}
+        try:
+            body['result'] = self.server.services.call(payload['method'],
+                                                       payload.get('params', []))
+            status = 200
+        except Exception as err:
+            body['error'] = {'name': 'JSONRPCError', 'code': -32500, 'message': str(err)}
+            status = 500
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the clients open up to 64 connections at once
+    request_queue_size = 128
+
+
+def _serve(port_queue):
+    server = _StandInServer(('127.0.0.1', 0), _StandInHandler)
+    server.services = StandInServices()
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_stand_in_services():
+    """
+    Start the stand-in services in a new process, so they do not compete with the
+    benchmarked code for the interpreter. The same url serves the SampleService
+    and the callback server.
+    returns (process, url), terminate the process to stop the services
+    """
+    ctx = get_context('spawn')
+    port_queue = ctx.Queue()
+    process = ctx.Process(target=_serve, args=(port_queue,), daemon=True)
+    process.start()
+    return process, 'http://127.0.0.1:{}'.format(port_queue.get(timeout=60))
@@ -0,0 +1,93 @@
+import csv
+import random
+
+# values of the ontology columns, as ENVO term names that the importer looks up or as ids
+BIOME_TERMS = ['terrestrial biome', 'freshwater biome', 'marine biome', 'cropland biome',
+               'tundra biome', 'desert biome', 'mangrove biome', 'urban biome']
+FEATURE_TERMS = ['well', 'stream', 'soil', 'sediment', 'creek bank', 'pond', 'spring', 'lake']
+ONTOLOGY_USAGE = ['names', 'ids', 'none']
+
+
+def _term_id(term):
+    return 'ENVO:{:08d}'.format(sum(map(ord, term)))
+
+
+def _sesar_row(idx, rnd):
+    return {
+        'Sample Name': 'sesar_{}'.format(idx),
+        'Depth bgs': round(rnd.uniform(0, 100), 2),
+        'Country': rnd.choice(['Germany', 'USA', 'Canada']),
+        'material': rnd.choice(['Gas', 'Liquid', 'Rock', 'Soil']),
+        'elevation start': rnd.randint(0, 2000),
+        'elevation unit': rnd.choice(['m', 'cm', 'ft']),
+        'Latitude': round(rnd.uniform(-90, 90), 6),
+        'Longitude': round(rnd.uniform(-180, 180), 6),
+    }
+
+
+def _enigma_row(idx, rnd):
+    return {
+        'SampleID': 'enigma_{}'.format(idx),
+        'material': 'ENVO:00002982',
+        'Latitude': round(rnd.uniform(-90, 90), 6),
+        'Longitude': round(rnd.uniform(-180, 180), 6),
+    }
+
+
+def _kbase_row(idx, rnd):
+    return {
+        'name': 'kbase_{}'.format(idx),
+        'Location Description': rnd.choice(['Savannah River Site', 'Oak Ridge', 'Hanford']),
+        'Collection method': rnd.choice(['Coring', 'Grab', 'Pumping']),
+        'Purpose': 'U redox characterization',
+        'Latitude': round(rnd.uniform(-90, 90), 6),
+        'Longitude': round(rnd.uniform(-180, 180), 6),
+        'Navigation type': 'GPS',
+    }
+
+
+# file_format -> extension, separator, lines before the header, row function
+FILE_FORMATS = {
+    'sesar': ('.tsv', '\t', [['Object Type:', 'Individual Sample', 'User Code:', 'IEAWH']],
+              _sesar_row),
+    'enigma': ('.csv', ',', [], _enigma_row),
+    'kbase': ('.tsv', '\t', [], _kbase_row),
+}
+
+
+def write_sample_file(path, file_format, rows, width=0, ontology='names', seed=0):
+    """
+    Write a file of `rows` synthetic samples in `file_format`.
+        path      - path of the file without extension, the extension of the format is added
+        width     - number of additional user metadata columns
+        ontology  - values of the 'biome' and 'feature' columns, one of ONTOLOGY_USAGE:
+                    'names' of terms to look up, term 'ids' or 'none' for no such columns
+        seed      - seed of the random values
+    returns the path of the file and the name of the column with the sample names
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unknown file format {file_format}, formats are {list(FILE_FORMATS)}")
+    if ontology not in ONTOLOGY_USAGE:
+        raise ValueError(f"Unknown ontology usage {ontology}, options are {ONTOLOGY_USAGE}")
+    extension, sep, pre_header, make_row = FILE_FORMATS[file_format]
+    rnd = random.Random(seed)
+    path += extension
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, delimiter=sep)
+        writer.writerows(pre_header)
+        header = None
+        for idx in range(rows):
+            row = make_row(idx, rnd)
+            if ontology != 'none':
+                biome, feature = rnd.choice(BIOME_TERMS), rnd.choice(FEATURE_TERMS)
+                if ontology == 'ids':
+                    biome, feature = _term_id(biome), _term_id(feature)
+                row.update(biome=biome, feature=feature)
+            for col in range(width):
+                row['user field {}'.format(col)] = (rnd.randint(0, 1000) if col % 2
+                                                    else 'value {}'.format(rnd.randint(0, 50)))
+            if header is None:
+                header = list(row)
+                writer.writerow(header)
+            writer.writerow([row[col] for col in header])
+    return path, header[0] if header else None
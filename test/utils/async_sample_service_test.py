@@ -0,0 +1,199 @@
+import asyncio
+import inspect
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from sample_uploader.utils.async_sample_service import (
+    AsyncSampleService,
+    create_data_links,
+    expire_data_link,
+    link_objects,
+    save_samples
+)
+from sample_uploader.utils.sample_cache import sample_cache
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+class _FakeSampleService(BaseHTTPRequestHandler):
+    """
+    SampleService methods used by the tests, every request is recorded
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        method = payload['method'].split('.')[1]
+        params = payload['params'][0]
+        with server.lock:
+            server.calls.append((method, params))
+            server.active += 1
+            server.max_active = max(server.active, server.max_active)
+        time.sleep(0.01)
+        status, body = 200, {'version': '1.1', 'id': payload['id']}
+        if method == 'get_sample' and params['id'] in server.samples:
+            body['result'] = [server.samples[params['id']]]
+        elif method == 'create_sample':
+            body['result'] = [{'id': params['sample'].get('id', 'new-' + params['sample']['name']),
+                               'version': (params['prior_version'] or 0) + 1}]
+        elif method == 'create_data_link':
+            body['result'] = [{'new_link': params}]
+        elif method == 'get_data_links_from_data':
+            body['result'] = [{'links': server.links.get(params['upa'], [])}]
+        elif method == 'propagate_data_links':
+            body['result'] = [{'links': []}]
+        elif method == 'expire_data_link':
+            body['result'] = []
+        else:
+            status, body['error'] = 500, {'message': f'No sample with id {params.get("id")}'}
+        with server.lock:
+            server.active -= 1
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def sample_service():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FakeSampleService)
+    server.lock = threading.Lock()
+    server.calls = []
+    server.active = server.max_active = 0
+    server.samples = {}
+    server.links = {}
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _methods(server):
+    return [method for method, _ in server.calls]
+
+
+def test_AsyncSampleService(sample_service):
+
+    start_test()
+
+    sample_service.samples['a'] = {'id': 'a', 'name': 'a', 'version': 2, 'node_tree': []}
+
+    async def _get_samples():
+        async with AsyncSampleService(sample_service.url, 'token', max_requests=3) as ss:
+            samples = await asyncio.gather(*[ss.get_sample({'id': 'a', 'version': 2})
+                                             for _ in range(10)])
+            with pytest.raises(RuntimeError, match='No sample with id missing'):
+                await ss.get_sample({'id': 'missing'})
+            return samples, ss.calls
+
+    with sample_cache.scope():
+        samples, calls = asyncio.run(_get_samples())
+        # fetched samples are added to the sample cache of the call
+        assert sample_cache.get('a', 2) == sample_service.samples['a']
+    assert samples == [sample_service.samples['a']] * 10
+    assert calls == {'get_sample': 11}
+    # at most max_requests requests are in flight
+    assert 1 < sample_service.max_active <= 3
+
+
+def test_create_data_links(sample_service):
+
+    start_test()
+
+    samples = [{'id': 'id{}'.format(i), 'version': 1, 'node': 'name{}'.format(i)}
+               for i in range(20)]
+    samples[5]['node'] = None
+    sample_service.samples['id5'] = {'id': 'id5', 'version': 1, 'node_tree': [{'id': 'fetched'}]}
+
+    links = create_data_links('1/2/3', samples, sample_service.url, 'token', max_tasks=4)
+
+    # only the sample without a node is fetched
+    assert _methods(sample_service).count('get_sample') == 1
+    assert ([link['new_link']['dataid'] for link in links] ==
+            ['samples/{}'.format(i) for i in range(20)])
+    assert [link['new_link']['id'] for link in links] == [s['id'] for s in samples]
+    assert links[5]['new_link']['node'] == 'fetched'
+    assert links[6]['new_link']['node'] == 'name6'
+    assert 1 < sample_service.max_active <= 4
+
+    samples[7]['id'] = 'missing'
+    samples[7]['node'] = None
+    with pytest.raises(RuntimeError, match='No sample with id missing'):
+        create_data_links('1/2/3', samples, sample_service.url, 'token')
+
+
+def test_link_objects(sample_service):
+
+    start_test()
+
+    sample_service.samples['b'] = {'id': 'b', 'version': 2, 'node_tree': [{'id': 'node b'}]}
+    links = link_objects([
+        {'upa': '1/5/1', 'dataid': 'samples/3', 'id': 'a', 'version': 1, 'node': 'node a'},
+        {'upa': '1/6/1', 'dataid': 'samples/0', 'id': 'b', 'version': 2},
+    ], sample_service.url, 'token', max_tasks=2)
+    assert [link['new_link'] for link in links] == [
+        {'upa': '1/5/1', 'id': 'a', 'dataid': 'samples/3', 'version': 1, 'node': 'node a',
+         'update': 1},
+        {'upa': '1/6/1', 'id': 'b', 'dataid': 'samples/0', 'version': 2, 'node': 'node b',
+         'update': 1},
+    ]
+    # only the sample without a node is fetched
+    assert _methods(sample_service).count('get_sample') == 1
+
+
+def test_expire_data_link(sample_service):
+
+    start_test()
+
+    sample_service.links = {
+        '1/2/3': [{'upa': '1/2/3', 'dataid': 'samples/{}'.format(i)} for i in range(5)],
+        '1/3/1': [{'upa': '1/3/1', 'dataid': 'samples/0'}]
+    }
+    assert expire_data_link(['1/2/3', '1/3/1', '1/4/1'], sample_service.url, 'token') == 6
+    expired = sorted((p['upa'], p['dataid'])
+                     for m, p in sample_service.calls if m == 'expire_data_link')
+    assert expired == sorted((link['upa'], link['dataid'])
+                             for links in sample_service.links.values() for link in links)
+
+
+def test_save_samples(sample_service):
+
+    start_test()
+
+    def _sample(name, value):
+        return {'name': name,
+                'node_tree': [{'id': name, 'meta_controlled': {'depth': {'value': value}}}]}
+
+    sample_service.samples['old'] = dict(_sample('same', 1.0), id='old', version=3)
+    sample_service.samples['changed'] = dict(_sample('changed', 1.0), id='changed', version=1)
+    samples = [
+        {'sample': _sample('new', 1.0), 'prev_sample': None},
+        {'sample': _sample('same', 1.0), 'prev_sample': {'id': 'old', 'version': 3}},
+        {'sample': _sample('changed', 2.0), 'prev_sample': {'id': 'changed', 'version': 1}},
+    ]
+    results, failures = save_samples(samples, sample_service.url, 'token', propagate_links=1)
+    assert failures == []
+    # unchanged samples are not saved again
+    assert results == [('new-new', 1), (None, None), ('changed', 2)]
+    assert _methods(sample_service).count('create_sample') == 2
+    assert [p['id'] for m, p in sample_service.calls if m == 'propagate_data_links'] == ['changed']
+
+    results, failures = save_samples(
+        [{'sample': _sample('bad', 1.0), 'prev_sample': {'id': 'gone', 'version': 1}}],
+        sample_service.url, 'token', propagate_links=0)
+    assert results == [None]
+    assert [str(err) for _, err in failures] == ['No sample with id gone']
@@ -0,0 +1,37 @@
+import inspect
+import json
+from unittest.mock import Mock, patch
+
+from installed_clients.baseclient import BaseClient
+from sample_uploader.utils.client_hooks import install_client_hooks
+from sample_uploader.utils.stage_timer import service_calls
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def test_install_client_hooks():
+
+    start_test()
+
+    install_client_hooks()
+    # installing again does not count the calls twice
+    install_client_hooks()
+
+    def fake_post(url, data, **kwargs):
+        assert json.loads(data)['params'] == [{'ids': [1, 2], 'name': 'aé'}]
+        resp = Mock(status_code=200, ok=True)
+        resp.json.return_value = {'result': [{'ok': 1}]}
+        return resp
+
+    client = BaseClient('http://service', timeout=30)
+    calls = service_calls.counts().get('SampleService', 0)
+    with patch('sample_uploader.utils.client_hooks.http_session.post',
+               side_effect=fake_post) as post:
+        result = client.call_method('SampleService.get_sample',
+                                    [{'ids': {1, 2}, 'name': 'aé'}])
+    assert result == {'ok': 1}
+    assert post.call_count == 1
+    assert service_calls.counts()['SampleService'] == calls + 1
@@ -0,0 +1,83 @@
+import datetime
+import importlib
+import inspect
+import os
+
+import pandas as pd
+from openpyxl import Workbook
+
+from sample_uploader.utils.excel_reader import ExcelReader, EXCEL_READERS, find_excel_engine
+
+test_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def _engines(path):
+    engines = []
+    for engine, (module, extensions, _, _) in EXCEL_READERS.items():
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        if path.endswith(extensions):
+            engines.append(engine)
+    return engines
+
+
+def test_ExcelReader_matches_read_excel():
+
+    start_test()
+
+    for sample_file, header in [
+        (os.path.join(test_dir, 'data', 'fake_samples_ENIGMA.xlsx'), 1),
+        (os.path.join(test_dir, 'example_data', 'SESAR_Torn_biochem_SFA.xlsx'), 0),
+        (os.path.join(test_dir, 'example_data', 'ANLPW_JulySamples_IGSN_v2.xls'), 1),
+        (os.path.join(test_dir, 'example_data', 'moss_f50_metadata.xls'), 0),
+    ]:
+        expected = pd.read_excel(sample_file, header=header).dropna(how='all')
+        assert find_excel_engine(sample_file) in _engines(sample_file)
+        for engine in _engines(sample_file):
+            with ExcelReader(sample_file, engine) as reader:
+                pd.testing.assert_frame_equal(reader.read(header=header), expected,
+                                              check_index_type=False)
+                pd.testing.assert_frame_equal(reader.read(header=header, nrows=3),
+                                              pd.read_excel(sample_file, header=header, nrows=3),
+                                              check_index_type=False)
+
+
+def test_ExcelReader_blank_rows(tmp_path):
+
+    start_test()
+
+    sample_file = str(tmp_path / 'blank_rows.xlsx')
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append([])
+    sheet.append(['name', 'count', 'flag', 'date', 'comment'])
+    sheet.append(['s1', 1, True, datetime.datetime(2020, 1, 2), 'a'])
+    sheet.append([])
+    sheet.append(['s2', 2, False, datetime.datetime(2020, 1, 3), '#N/A'])
+    sheet.append(['s3', 3, True, None, None])
+    workbook.save(sample_file)
+
+    # blank rows are read like pd.read_excel reads them, as missing values, and
+    # the blank first row counts toward the header row
+    expected = pd.read_excel(sample_file, header=1).dropna(how='all')
+    for engine in _engines(sample_file):
+        with ExcelReader(sample_file, engine) as reader:
+            df = reader.read(header=1)
+        pd.testing.assert_frame_equal(df, expected, check_index_type=False)
+        assert df.index.tolist() == [0, 2, 3]
+        assert df['count'].tolist() == [1.0, 2.0, 3.0]
+        assert df['comment'].isna().tolist() == [False, True, True]
+        # the header row is found by its position in the sheet, also when it is blank
+        for header in (0, 2):
+            with ExcelReader(sample_file, engine) as reader:
+                df = reader.read(header=header)
+            pd.testing.assert_frame_equal(
+                df, pd.read_excel(sample_file, header=header).dropna(how='all'),
+                check_index_type=False)
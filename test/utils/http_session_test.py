@@ -0,0 +1,76 @@
+import inspect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from sample_uploader.utils.http_session import HTTPSessionPool
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        # the client port identifies the connection
+        self.server.client_ports.append(self.client_address[1])
+        body = b'{"result": []}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def _post_all(pool, url, num_requests):
+    for _ in range(num_requests):
+        resp = pool.post(url, data='{}')
+        assert resp.json() == {'result': []}
+
+
+def test_HTTPSessionPool():
+
+    start_test()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    server.client_ports = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}'
+    try:
+        pool = HTTPSessionPool(pool_maxsize=2)
+        # connections are kept alive and reused
+        _post_all(pool, url, 5)
+        assert len(server.client_ports) == 5
+        assert len(set(server.client_ports)) == 1
+
+        # every thread has its own session, but they share the pooled connections
+        sessions = []
+
+        def _worker():
+            sessions.append(pool.session())
+            _post_all(pool, url, 5)
+
+        threads = [threading.Thread(target=_worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(server.client_ports) == 15
+        assert sessions[0] is not sessions[1]
+        assert sessions[0].get_adapter(url) is sessions[1].get_adapter(url)
+        assert len(set(server.client_ports)) <= 3
+        pool.close()
+
+        server.client_ports.clear()
+        pool = HTTPSessionPool(keep_alive=False)
+        _post_all(pool, url, 3)
+        assert len(set(server.client_ports)) == 3
+    finally:
+        server.shutdown()
+        server.server_close()
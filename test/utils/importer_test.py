@@ -6,11 +6,21 @@ from configparser import ConfigParser
 from openpyxl import load_workbook
 import copy
 import shutil
+from unittest.mock import patch
 from sample_uploader.authclient import KBaseAuth as _KBaseAuth
 
-from sample_uploader.utils.importer import import_samples_from_file, find_header_row
+import pandas as pd
+from sample_uploader.utils.importer import (
+    import_samples_from_file,
+    find_header_row,
+    open_excel_file,
+    load_file,
+    load_file_chunks,
+    _prevalidate
+)
 from sample_uploader.utils.mappings import SESAR_mappings, ENIGMA_mappings, aliases
 from sample_uploader.utils.sample_utils import get_sample
+from sample_uploader.utils.samples_content_warning import SampleContentErrors
 
 
 class sample_uploaderTest(unittest.TestCase):
@@ -80,6 +90,14 @@ class sample_uploaderTest(unittest.TestCase):
         header_row = find_header_row(sample_file, 'SESAR')
         self.assertEqual(header_row, 0)
 
+        # an already opened workbook can be reused to load the samples
+        sample_file = os.path.join(self.test_dir, 'example_data', 'ANLPW_JulySamples_IGSN_v2.xls')
+        with open_excel_file(sample_file) as excel_file:
+            header_row = find_header_row(sample_file, 'SESAR', excel_file)
+            self.assertEqual(header_row, 1)
+            pd.testing.assert_frame_equal(load_file(sample_file, header_row, [], excel_file),
+                                          load_file(sample_file, header_row, []))
+
         # test sesar csv files
         sample_file = os.path.join(self.test_dir, 'example_data', 'isgn_sample_example.csv')
         header_row = find_header_row(sample_file, 'SESAR')
@@ -437,3 +455,65 @@ class sample_uploaderTest(unittest.TestCase):
                                             'overwrite a different column "some field". Rename ' +
                                             'your columns to be unique alphanumericaly, ' +
                                             'ignoring whitespace and case.')
+
+    def test_load_file_chunks(self):
+        for file_name, header_row_index in [('samples_all.tsv', 0),
+                                            ('NMDC_FICUS_db_v7_db___KBase.tsv', 0),
+                                            ('ANLPW_JulySamples_IGSN_v2-forKB.csv', 1)]:
+            sample_file = os.path.join(self.test_dir, 'example_data', file_name)
+            df = load_file(sample_file, header_row_index, [])
+            chunks = list(load_file_chunks(sample_file, header_row_index, [], 7))
+            self.assertTrue(all(len(chunk) <= 7 for chunk in chunks))
+            pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+        # duplicate rows are removed across chunks
+        sample_file = os.path.join(self.test_dir, 'data', 'fake_samples.tsv')
+        dup_file = os.path.join(self.test_dir, 'data', 'dup_fake_samples.tsv')
+        with open(sample_file) as f:
+            lines = [line.rstrip('\r\n') + '\n' for line in f]
+        with open(dup_file, 'w') as f:
+            f.writelines(lines + lines[2:])
+        df = load_file(dup_file, 1, [])
+        chunks = list(load_file_chunks(dup_file, 1, [], 2))
+        pd.testing.assert_frame_equal(pd.concat(chunks), df)
+        os.remove(dup_file)
+
+    def test_prevalidate(self):
+        samples = [{'sample': {
+            'name': name,
+            'node_tree': [{'id': name, 'meta_controlled': {'latitude': {'value': latitude}}}]
+        }} for name, latitude in [('s1', 100.0), ('s2', 10.0), ('s3', -100.0), ('s4', 20.0)]]
+        service_error = {
+            'message': 'Validation failed: "Metadata value at key value is not in the ontology"',
+            'dev_message': 'Metadata value at key value is not in the ontology',
+            'sample_name': 's4',
+            'node': 's4',
+            'key': 'latitude',
+            'subkey': 'value'
+        }
+        range_message = ('Validation failed: "Metadata value at key value is not within '
+                         'the range [-90.0, 90.0]"')
+        with patch('sample_uploader.utils.importer.validate_samples',
+                   return_value=[service_error]) as validate_samples:
+            errors = SampleContentErrors()
+            _prevalidate(samples, 'sample_url', 'token', errors=errors)
+            # the samples that failed locally are not sent to SampleService
+            sent = validate_samples.call_args[0][0]
+            self.assertEqual([sample['name'] for sample in sent], ['s2', 's4'])
+            self.assertEqual([(e.sample_name, e.key, e.message) for e in errors], [
+                ('s1', 'latitude', range_message),
+                ('s3', 'latitude', range_message),
+                ('s4', 'latitude', service_error['message'])
+            ])
+
+            # SampleService is only asked for the errors left until max_errors
+            errors = SampleContentErrors()
+            _prevalidate(samples, 'sample_url', 'token', max_errors=3, errors=errors)
+            self.assertEqual(validate_samples.call_args[1]['max_errors'], 1)
+            self.assertEqual(len(errors), 3)
+
+            validate_samples.reset_mock()
+            errors = SampleContentErrors()
+            _prevalidate(samples, 'sample_url', 'token', max_errors=1, errors=errors)
+            validate_samples.assert_not_called()
+            self.assertEqual([e.sample_name for e in errors], ['s1'])
@@ -0,0 +1,79 @@
+import datetime
+import importlib
+import inspect
+import json
+
+import numpy as np
+import pandas as pd
+
+from sample_uploader.utils.json_utils import (dumps, JSON_ENCODER_FUNCS, JSON_ENCODER,
+                                              find_json_encoder)
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def _encoders():
+    encoders = []
+    for encoder, (module, _) in JSON_ENCODER_FUNCS.items():
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            continue
+        encoders.append(encoder)
+    return encoders
+
+
+def test_dumps_matches_json():
+
+    start_test()
+
+    assert JSON_ENCODER == find_json_encoder()
+    assert JSON_ENCODER in _encoders()
+
+    sample = {
+        'name': 'sample/1 é \x7f   \U0001F600 "quoted"',
+        'node_tree': [{
+            'id': 'sample/1',
+            'parent': None,
+            'meta_controlled': {
+                'depth': {'value': 1.5, 'units': 'm'},
+                'count': {'value': 3},
+                'small': {'value': 1e-05},
+                'tiny': {'value': 2.5e-300},
+                'large': {'value': 1e+16},
+                'inf': {'value': float('inf')},
+                'nan': {'value': float('nan')},
+                'neg': {'value': -0.0},
+            },
+            'meta_user': {
+                'date': {'value': datetime.datetime(2020, 1, 2, 3, 4)},
+                'timestamp': {'value': pd.Timestamp('2020-01-02')},
+                'np_float': {'value': np.float64(2.25)},
+                'np_int': {'value': np.int64(7)},
+                'flag': {'value': True},
+                'text': {'value': 'value with 1e-5 in it'},
+                'big': {'value': 2 ** 70},
+                'bytes': {'value': b'raw'},
+            },
+            1: ('tuple', 2),
+        }]
+    }
+    for encoder in _encoders():
+        assert dumps(sample, default=str, encoder=encoder) == json.dumps(sample, default=str)
+        for value in [{}, [], 'x', 0.1, 1e-7, 123456789.125, [1, [2, {'a': None}]]]:
+            assert dumps(value, encoder=encoder) == json.dumps(value)
+        # errors are raised like by json.dumps
+        for value in [{'a': {1, 2}}, b'raw']:
+            try:
+                json.dumps(value)
+            except TypeError as err:
+                expected = str(err)
+            try:
+                dumps(value, encoder=encoder)
+            except TypeError as err:
+                assert str(err) == expected
+            else:
+                assert False, 'TypeError not raised'
@@ -0,0 +1,160 @@
+import asyncio
+import inspect
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+
+from sample_uploader.utils.misc_utils import (map_concurrently, map_concurrently_async, error_ui,
+                                              ERROR_UI_DATATABLES)
+
+test_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def test_map_concurrently_keeps_order():
+
+    start_test()
+
+    lock = threading.Lock()
+    active = [0, 0]  # current, max
+
+    def _square(x):
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01 * (x % 3))
+        with lock:
+            active[0] -= 1
+        return x * x
+
+    items = list(range(20))
+    for max_workers in (1, 4):
+        results, failures = map_concurrently(_square, items, max_workers)
+        assert results == [x * x for x in items]
+        assert failures == []
+    assert 1 < active[1] <= 4
+
+
+def _fail_on_odd(x):
+    if x % 2:
+        raise ValueError(str(x))
+    return x
+
+
+def test_map_concurrently_fail_fast():
+
+    start_test()
+
+    results, failures = map_concurrently(_fail_on_odd, list(range(10)), 1)
+    assert results == [0] + [None] * 9
+    assert [(idx, str(err)) for idx, err in failures] == [(1, '1')]
+
+    results, failures = map_concurrently(_fail_on_odd, list(range(100)), 2)
+    assert 1 <= len(failures) <= 2
+    assert results.count(None) > 50
+
+
+def test_map_concurrently_collect_failures():
+
+    start_test()
+
+    results, failures = map_concurrently(_fail_on_odd, list(range(10)), 3, fail_fast=False)
+    assert results == [0, None, 2, None, 4, None, 6, None, 8, None]
+    assert [idx for idx, _ in failures] == [1, 3, 5, 7, 9]
+    assert all(isinstance(err, ValueError) for _, err in failures)
+
+
+def test_map_concurrently_async():
+
+    start_test()
+
+    active = [0, 0]  # current, max
+
+    async def _square(x):
+        active[0] += 1
+        active[1] = max(active)
+        await asyncio.sleep(0.01 * (x % 3))
+        active[0] -= 1
+        return x * x
+
+    items = list(range(20))
+    results, failures = asyncio.run(map_concurrently_async(_square, items, 4))
+    assert results == [x * x for x in items]
+    assert failures == []
+    assert 1 < active[1] <= 4
+
+    async def _fail_on_odd_async(x):
+        await asyncio.sleep(0)
+        return _fail_on_odd(x)
+
+    results, failures = asyncio.run(map_concurrently_async(_fail_on_odd_async, list(range(10)), 1))
+    assert results == [0] + [None] * 9
+    assert [(idx, str(err)) for idx, err in failures] == [(1, '1')]
+
+    results, failures = asyncio.run(map_concurrently_async(_fail_on_odd_async, list(range(10)), 3,
+                                                           fail_fast=False))
+    assert results == [0, None, 2, None, 4, None, 6, None, 8, None]
+    assert [idx for idx, _ in failures] == [1, 3, 5, 7, 9]
+
+
+def test_error_ui(tmp_path):
+
+    start_test()
+
+    asset_path = os.path.join(test_dir, '..', 'data', 'error_ui_static')
+    scratch = str(tmp_path)
+    site_paths = [error_ui([], pd.DataFrame(columns=['name']), False, scratch,
+                           asset_path=asset_path) for _ in range(2)]
+    # every report has its own copy of the static files
+    assert site_paths[0] != site_paths[1]
+    for site_path in site_paths:
+        assert sorted(os.listdir(os.path.join(site_path, 'static'))) == [
+            'error_ui.css', 'error_ui.js']
+        for name in os.listdir(asset_path):
+            with open(os.path.join(asset_path, name), 'rb') as f:
+                with open(os.path.join(site_path, 'static', name), 'rb') as g:
+                    assert f.read() == g.read()
+        # the DataTables bundle is loaded from the CDN
+        with open(os.path.join(site_path, 'index.html')) as f:
+            html = f.read()
+        assert ERROR_UI_DATATABLES + 'datatables.min.js' in html
+        assert ERROR_UI_DATATABLES + 'datatables.min.css' in html
+        assert 'static/datatables' not in html
+
+
+def test_error_ui_pages(tmp_path):
+
+    start_test()
+
+    asset_path = os.path.join(test_dir, '..', 'data', 'error_ui_static')
+    df = pd.DataFrame({'name': ['s{}'.format(i) for i in range(25)], 'depth': range(25)},
+                      index=range(2, 27))
+    site_path = error_ui([], df, False, str(tmp_path), asset_path=asset_path, page_size=10)
+
+    # the rows are written to pages of page_size rows, not into the html
+    assert sorted(os.listdir(os.path.join(site_path, 'data'))) == [
+        'samples_0.json', 'samples_1.json', 'samples_2.json']
+    pages = []
+    for n in range(3):
+        with open(os.path.join(site_path, 'data', 'samples_{}.json'.format(n))) as f:
+            pages.append(json.load(f))
+    assert [p['index'] for p in pages] == [
+        list(range(2, 12)), list(range(12, 22)), list(range(22, 27))]
+    assert pages[2]['data'] == [['s{}'.format(i), i] for i in range(20, 25)]
+    with open(os.path.join(site_path, 'index.html')) as f:
+        html = f.read()
+    assert 's24' not in html
+    manifest = html.split('const sample_pages = ')[1].split(';')[0]
+    assert json.loads(manifest) == {
+        'columns': ['name', 'depth'],
+        'rows': 25,
+        'page_size': 10,
+        'pages': ['data/samples_0.json', 'data/samples_1.json', 'data/samples_2.json']
+    }
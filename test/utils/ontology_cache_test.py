@@ -0,0 +1,106 @@
+import time
+import warnings
+
+from sample_uploader.utils.ontology_cache import OntologyTermCache
+from sample_uploader.utils.samples_content_warning import SampleContentWarning
+from sample_uploader.utils.transformations import FieldTransformer
+
+
+class _FakeOntologyAPI:
+    def __init__(self, terms):
+        self.terms = terms
+        self.calls = []
+
+    def get_term_by_name(self, params):
+        self.calls.append(params['name'])
+        return {'results': self.terms.get(params['name'], [])}
+
+
+def test_OntologyTermCache_get_put():
+    cache = OntologyTermCache(max_entries=2)
+    key = ('envo_ontology', 'soil')
+    assert cache.get(key) is None
+    cache.put(key, ({'name': 'soil'}, []))
+    assert cache.get(key) == ({'name': 'soil'}, [])
+
+    cache.put(('envo_ontology', 'water'), 1)
+    cache.get(key)
+    cache.put(('envo_ontology', 'sand'), 2)
+    # the least recently used entry is evicted
+    assert cache.get(('envo_ontology', 'water')) is None
+    assert cache.stats() == {'entries': 2, 'hits': 2, 'misses': 2, 'evictions': 1}
+
+
+def test_OntologyTermCache_ttl():
+    cache = OntologyTermCache(ttl=0.05)
+    cache.put('key', 1)
+    assert cache.get('key') == 1
+    time.sleep(0.1)
+    assert cache.get('key') is None
+    assert cache.stats()['entries'] == 0
+
+    # a ttl of 0 disables the cache
+    cache = OntologyTermCache(ttl=0)
+    cache.put('key', 1)
+    assert cache.get('key') is None
+
+
+def test_FieldTransformer_lookups():
+    onto_api = _FakeOntologyAPI({
+        'soil': [{'id': 'ENVO:00001998', 'name': 'soil'}],
+    })
+    term_cache = OntologyTermCache()
+    transformer = FieldTransformer('http://localhost', term_cache=term_cache)
+    transformer.onto_api = onto_api
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for value in ['soil', ' Soil', 'SOIL', 'ENVO:00002041']:
+            row = transformer.field_transformations({'biome': value}, ['biome'])
+            assert row['biome'] == ('ENVO:00001998' if value != 'ENVO:00002041' else value)
+
+    # failed lookups raise the same warning every time
+    messages = []
+    for _ in range(3):
+        try:
+            transformer.field_transformations({'biome': 'dirt'}, ['biome'])
+        except SampleContentWarning as e:
+            messages.append(e.message)
+    assert len(messages) == 3 and len(set(messages)) == 1
+    assert onto_api.calls == ['soil', 'dirt']
+    assert transformer.lookups == 2
+
+    # the shared cache is used by later imports
+    transformer = FieldTransformer('http://localhost', term_cache=term_cache)
+    transformer.onto_api = onto_api
+    transformer.field_transformations({'biome': 'soil'}, ['biome'])
+    assert onto_api.calls == ['soil', 'dirt']
+
+
+def test_FieldTransformer_resolve_columns():
+    onto_api = _FakeOntologyAPI({
+        'soil': [{'id': 'ENVO:00001998', 'name': 'soil'}],
+        'sea': [{'id': 'ENVO:00000015', 'name': 'ocean'}],
+    })
+    transformer = FieldTransformer('http://localhost')
+    transformer.onto_api = onto_api
+
+    values = ['soil', 'Soil ', None, '', 'ENVO:00002041', 'sea', 'dirt', 'soil']
+    resolved = transformer.resolve_columns({'biome': values}, max_workers=4)
+    # only values that resolve cleanly are replaced
+    assert resolved == {'biome': ['ENVO:00001998', 'ENVO:00001998', None, '', 'ENVO:00002041',
+                                  'sea', 'dirt', 'ENVO:00001998']}
+    assert sorted(onto_api.calls) == ['dirt', 'sea', 'soil']
+
+    # the rest are reported per row without further lookups
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        row = transformer.field_transformations({'biome': 'sea'}, ['biome'])
+    assert row['biome'] == 'ENVO:00000015'
+    assert 'does not match provided sea' in caught[0].message.message
+    try:
+        transformer.field_transformations({'biome': 'dirt'}, ['biome'])
+        assert False, 'expected a SampleContentWarning'
+    except SampleContentWarning as e:
+        assert "Couldn't resolve ontology term" in e.message
+    assert len(onto_api.calls) == 3
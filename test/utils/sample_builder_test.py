@@ -0,0 +1,158 @@
+import inspect
+import pandas as pd
+
+from sample_uploader.utils.mappings import SESAR_groups
+from sample_uploader.utils.sample_builder import SampleBuilder, ColumnPlan, _to_floats
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def _sample_df():
+    return pd.DataFrame({
+        'name': ['s1', 's2', 's3'],
+        'latitude': [45.5, None, '12'],
+        'sesar:elevation_start': [100, 200, None],
+        'elevation_unit': ['cm', None, 'km'],
+        'sesar:size': [1, 'large', None],
+        'user_field': ['a', None, 3],
+        'sample_template': ['SESAR', 'SESAR', 'SESAR']
+    })
+
+
+def _source_meta(col, value):
+    return {'key': col, 'skey': col.upper(), 'svalue': {'value': value}}
+
+
+# a single group of 'sesar:elevation_start', SESAR_groups has several of them
+GROUPS = [{'value': 'sesar:elevation_start', 'units': 'elevation_unit'}]
+# nodes of _sample_df with GROUPS, as the row-wise builders made them before SampleBuilder
+# replaced them
+EXPECTED_NODES = [{
+    'id': 's1',
+    'parent': None,
+    'type': 'BioReplicate',
+    'meta_controlled': {
+        'latitude': {'value': 45.5},
+        'sesar:elevation_start': {'value': 100.0, 'units': 'cm'},
+        'sesar:size': {'value': '1.0'},
+        'sample_template': {'value': 'SESAR'}
+    },
+    'meta_user': {'user_field': {'value': 'a'}},
+    'source_meta': [
+        _source_meta('latitude', 45.5),
+        _source_meta('sesar:elevation_start', 100.0),
+        _source_meta('sesar:size', 1),
+        _source_meta('sample_template', 'SESAR')
+    ]
+}, {
+    'id': 's2',
+    'parent': None,
+    'type': 'BioReplicate',
+    'meta_controlled': {
+        'sesar:elevation_start': {'value': 200.0, 'units': 'm'},
+        'sesar:size': {'value': 'large'},
+        'sample_template': {'value': 'SESAR'}
+    },
+    'meta_user': {},
+    'source_meta': [
+        _source_meta('sesar:elevation_start', 200.0),
+        _source_meta('sesar:size', 'large'),
+        _source_meta('sample_template', 'SESAR')
+    ]
+}, {
+    'id': 's3',
+    'parent': None,
+    'type': 'BioReplicate',
+    'meta_controlled': {
+        'latitude': {'value': 12.0},
+        'sample_template': {'value': 'SESAR'}
+    },
+    'meta_user': {'elevation_unit': {'value': 'km'}, 'user_field': {'value': 3.0}},
+    'source_meta': [
+        _source_meta('latitude', '12'),
+        _source_meta('sample_template', 'SESAR')
+    ]
+}]
+
+
+def test_SampleBuilder_build():
+
+    start_test()
+
+    df = _sample_df()
+    columns_to_input_names = {col: col.upper() for col in df.columns}
+    builder = SampleBuilder(df, GROUPS, [])
+
+    assert 'name' not in builder.cols
+
+    for idx, name in enumerate(df['name']):
+        sample = builder.build(idx, name, columns_to_input_names)
+        assert sample['name'] == name
+        assert sample['node_tree'] == [EXPECTED_NODES[idx]]
+
+
+def test_SampleBuilder_set_value():
+
+    start_test()
+
+    df = _sample_df()
+    builder = SampleBuilder(df, SESAR_groups, [])
+
+    builder.set_value('user_field', 1, '7')
+    assert builder.value('user_field', 1) == '7'
+    assert builder.build(1, 's2', {})['node_tree'][0]['meta_user']['user_field'] == {'value': 7.0}
+
+    assert builder.value('missing_column', 0) is None
+
+
+def test_SampleBuilder_unit_rules():
+
+    start_test()
+
+    df = pd.DataFrame({'name': ['s1'], 'weight_(kg)': [3]})
+    builder = SampleBuilder(df, [], [r'\((\w+)\)'])
+
+    node = builder.build(0, 's1', {})['node_tree'][0]
+    assert node['meta_user']['weight_(kg)'] == {'value': 3.0, 'units': 'kg'}
+
+
+def test_ColumnPlan():
+
+    start_test()
+
+    df = _sample_df()
+    plan = ColumnPlan(df.columns, SESAR_groups, [r'_(unit)$'])
+
+    assert plan.controlled_cols == ['latitude', 'sesar:elevation_start', 'sesar:size',
+                                    'sample_template']
+    # the order of the groups of a column depends on the hash seed, the first one is used
+    elevation_group = next(g for g in SESAR_groups if g['value'] == 'sesar:elevation_start')
+    assert plan.controlled_groups['sesar:elevation_start'] is elevation_group
+    assert plan.col_units == {'elevation_unit': 'unit'}
+    assert 'sample_template' in plan.string_cols
+
+    # a plan is reused for parts of the same file, and rebuilt for other columns
+    assert SampleBuilder(df.iloc[1:], SESAR_groups, [], plan).plan is plan
+    other = SampleBuilder(df.drop(columns=['user_field']), SESAR_groups, [], plan)
+    assert other.plan is not plan
+    assert 'user_field' not in other.cols
+
+
+def test_to_floats():
+
+    start_test()
+
+    values = pd.Series(['1', ' 2.5 ', 'abc', None, 3, True, '1e3'], dtype=object)
+    assert _to_floats(values)[:3] == [1.0, 2.5, 'abc']
+    assert _to_floats(values)[4:] == [3.0, 1.0, 1000.0]
+    assert _to_floats(pd.Series([1, 2])) == [1.0, 2.0]
+    # pd.to_numeric rejects these, float() converts them
+    values = pd.Series(['1_000', '\u0661\u0662', '\uff13', ' 4 ', 'inf', 'x_1'], dtype=object)
+    assert _to_floats(values) == [1000.0, 12.0, 3.0, 4.0, float('inf'), 'x_1']
+    assert [float(val) for val in values[:5]] == _to_floats(values)[:5]
+    assert _to_floats(pd.Series(['nan']))[0] != _to_floats(pd.Series(['nan']))[0]
+    dates = pd.Series(pd.date_range('2020-01-01', periods=2))
+    assert _to_floats(dates) == dates.tolist()
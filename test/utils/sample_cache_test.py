@@ -0,0 +1,119 @@
+import asyncio
+import contextvars
+import threading
+
+from sample_uploader.utils.sample_cache import SampleCache, CallSampleCache
+
+
+def _sample(sample_id, version, value=1):
+    return {'id': sample_id, 'version': version, 'name': sample_id,
+            'node_tree': [{'id': sample_id, 'meta_user': {'a': {'value': value}}}]}
+
+
+def test_SampleCache_get_put():
+    cache = SampleCache()
+    assert cache.get('s1', 1) is None
+    cache.put(_sample('s1', 1), 100)
+
+    assert cache.get('s1', 1) == _sample('s1', 1)
+    # unversioned lookups are never served from the cache
+    assert cache.get('s1', None) is None
+    # other versions are not cached
+    assert cache.get('s1', 2) is None
+    # a sample that is put again is not counted twice
+    cache.put(_sample('s1', 1), 100)
+
+    assert cache.stats() == {'entries': 1, 'bytes': 100, 'hits': 1, 'misses': 2, 'evictions': 0}
+
+
+def test_SampleCache_returns_copies():
+    cache = SampleCache()
+    sample = _sample('s1', 1)
+    cache.put(sample, 100)
+    sample['node_tree'][0]['meta_user']['a']['value'] = 2
+
+    cached = cache.get('s1', 1)
+    assert cached['node_tree'][0]['meta_user']['a']['value'] == 1
+    cached['node_tree'].pop()
+    assert len(cache.get('s1', 1)['node_tree']) == 1
+
+
+def test_SampleCache_eviction():
+    cache = SampleCache(max_entries=2, max_bytes=250)
+    cache.put(_sample('s1', 1), 100)
+    cache.put(_sample('s2', 1), 100)
+    # refresh 's1', so 's2' is the least recently used
+    assert cache.get('s1', 1)
+    cache.put(_sample('s3', 1), 100)
+    assert cache.get('s2', 1) is None
+    assert cache.get('s1', 1)
+    assert cache.get('s3', 1)
+
+    # bounded by bytes
+    cache.put(_sample('s4', 1), 200)
+    assert cache.stats()['entries'] == 1
+    assert cache.stats()['bytes'] == 200
+    # too large to be cached at all
+    cache.put(_sample('s5', 1), 300)
+    assert cache.get('s5', 1) is None
+
+
+def test_CallSampleCache():
+    cache = CallSampleCache()
+    # nothing is cached outside of a call
+    cache.put(_sample('s1', 1), 100)
+    assert cache.get('s1', 1) is None
+    assert cache.stats() is None
+
+    @cache.scope()
+    def _call(sample_id):
+        cached = cache.get(sample_id, 1)
+        cache.put(_sample(sample_id, 1), 100)
+        return cached
+
+    # the samples of a call are not served to the next call
+    assert _call('s1') is None
+    assert _call('s1') is None
+
+    with cache.scope():
+        cache.put(_sample('s1', 1), 100)
+        # nested scopes share the cache of the call
+        assert _call('s1') == _sample('s1', 1)
+        assert cache.get('s1', 1) == _sample('s1', 1)
+
+        # asyncio tasks see the cache of the call
+        async def _get():
+            return cache.get('s1', 1)
+        assert asyncio.run(_get()) == _sample('s1', 1)
+
+        # threads see it when they run in a copy of the context of the call
+        found = []
+        threads = [
+            threading.Thread(target=lambda: found.append(cache.get('s1', 1))),
+            threading.Thread(target=contextvars.copy_context().run,
+                             args=(lambda: found.append(cache.get('s1', 1)),))
+        ]
+        for thread in threads:
+            thread.start()
+            thread.join()
+        assert found == [None, _sample('s1', 1)]
+        assert cache.stats()['entries'] == 1
+
+    # other calls running at the same time have their own cache
+    seen = []
+    entered, put_done = threading.Event(), threading.Event()
+
+    def _other_call():
+        with cache.scope():
+            entered.set()
+            put_done.wait()
+            seen.append(cache.get('s2', 1))
+
+    thread = threading.Thread(target=_other_call)
+    thread.start()
+    with cache.scope():
+        entered.wait()
+        cache.put(_sample('s2', 1), 100)
+        put_done.set()
+        thread.join()
+    assert seen == [None]
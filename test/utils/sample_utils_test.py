@@ -1,7 +1,10 @@
 import os
+import json
 import time
 import unittest
+import requests
 from configparser import ConfigParser
+from unittest.mock import patch, create_autospec
 
 from sample_uploader.sample_uploaderImpl import sample_uploader
 from sample_uploader.sample_uploaderServer import MethodContext
@@ -11,7 +14,12 @@ from installed_clients.SampleServiceClient import SampleService
 from installed_clients.FakeObjectsForTestsClient import FakeObjectsForTests
 from sample_uploader.utils.sample_utils import (
     get_data_links_from_ss,
-    expire_data_link)
+    prefetch_samples,
+    propagate_acls,
+    compare_samples,
+    sample_fingerprint,
+    validate_samples)
+from sample_uploader.utils.async_sample_service import expire_data_link
 
 
 class SampleUtilsTest(unittest.TestCase):
@@ -129,3 +137,130 @@ class SampleUtilsTest(unittest.TestCase):
 
         links_after = get_data_links_from_ss(test_obj, self.sample_url, self.ctx['token'])
         assert len(links_after) == 0
+
+
+def _get_samples_response(ids):
+    resp = create_autospec(requests.Response)
+    resp.ok = True
+    resp.json.return_value = {'result': [[{'id': i, 'name': i, 'version': 2} for i in ids]]}
+    return resp
+
+
+def test_prefetch_samples():
+    def fake_post(url, headers, data):
+        ids = [s['id'] for s in json.loads(data)['params'][0]['samples']]
+        if 'bad' in ids:
+            raise RuntimeError('No sample with id bad')
+        return _get_samples_response(ids)
+
+    with patch('sample_uploader.utils.sample_utils.http_session.post',
+               side_effect=fake_post) as post:
+        samples = prefetch_samples(['a', 'b', 'c', 'bad', 'a', 'd'], 'sample_url', 'token',
+                                   chunk_size=2, max_workers=2)
+    # duplicate ids are only fetched once
+    assert post.call_count == 3
+    # the chunk with the failing id is left out
+    assert sorted(samples) == ['a', 'b', 'd']
+    assert samples['a'] == {'id': 'a', 'name': 'a', 'version': 2}
+
+    assert prefetch_samples([], 'sample_url', 'token') == {}
+
+
+def test_propagate_acls():
+    calls = []
+
+    def fake_post(url, headers, data):
+        params = json.loads(data)['params'][0]
+        calls.append(params)
+        if 'bad' in params.get('ids', [params.get('id')]):
+            resp = create_autospec(requests.Response)
+            resp.ok = False
+            resp.text = json.dumps({'error': {'message': 'not allowed'}})
+            return resp
+        resp = create_autospec(requests.Response)
+        resp.ok = True
+        resp.status_code = 200
+        resp.json.return_value = {'result': []}
+        return resp
+
+    shared = {'read': ['r1'], 'write': [], 'admin': []}
+    acl_updates = [('a', shared), ('b', shared), ('c', dict(shared, admin=['a1'])),
+                   ('bad', shared), ('d', shared)]
+    with patch('sample_uploader.utils.sample_utils.http_session.post', side_effect=fake_post):
+        statuses, failures = propagate_acls('sample_url', acl_updates, 'token',
+                                            chunk_size=2, max_workers=1)
+    bulk = [c['ids'] for c in calls if 'ids' in c]
+    single = [c['id'] for c in calls if 'id' in c]
+    # samples with the same update share requests
+    assert bulk == [['a', 'b'], ['bad', 'd'], ['c']]
+    # a failed request is retried one sample at a time
+    assert single == ['bad', 'd']
+    assert [(sample_id, str(err)) for sample_id, err in failures] == [('bad', 'not allowed')]
+    assert statuses == [200, 200, 200]
+
+
+def test_compare_samples():
+    def _sample(value, source_value='1'):
+        return {'name': 's1', 'node_tree': [{
+            'id': 's1', 'parent': None, 'type': 'BioReplicate',
+            'meta_controlled': {'depth': {'value': value, 'units': 'm'}},
+            'meta_user': {},
+            'source_meta': [{'key': 'depth', 'skey': 'Depth', 'svalue': {'value': source_value}}]
+        }]}
+
+    s1 = _sample(1)
+    # numbers are normalized and source_meta is not compared
+    assert compare_samples(s1, _sample(1.0, source_value='1.0'))
+    assert not compare_samples(s1, _sample(1.5))
+    assert not compare_samples(s1, _sample('1'))
+    assert not compare_samples(s1, dict(_sample(1), name='s2'))
+    assert not compare_samples(s1, None)
+    # the samples are not modified
+    assert s1 == _sample(1)
+    # a known fingerprint is used as is
+    assert compare_samples(s1, _sample(2), sample_fingerprint(_sample(2)))
+    # key order does not matter
+    reordered = _sample(1)
+    reordered['node_tree'][0] = dict(reversed(list(reordered['node_tree'][0].items())))
+    assert sample_fingerprint(reordered) == sample_fingerprint(s1)
+
+
+def test_validate_samples():
+    requests_samples = []
+
+    def fake_post(url, headers, data):
+        payload = json.loads(data)
+        assert payload['method'] == 'SampleService.validate_samples'
+        assert payload['version'] == '1.1' and payload['id']
+        samples = payload['params'][0]['samples']
+        requests_samples.append([sample['name'] for sample in samples])
+        resp = create_autospec(requests.Response)
+        resp.ok = True
+        resp.status_code = 200
+        resp.json.return_value = {'result': [{'errors': [
+            {'message': 'bad value', 'sample_name': sample['name'], 'node': sample['name'],
+             'key': 'depth', 'subkey': 'value'}
+            for sample in samples if sample['name'].startswith('bad')
+        ]}]}
+        return resp
+
+    samples = [{'name': ('bad' if i % 4 == 0 else 's') + str(i), 'node_tree': []}
+               for i in range(10)]
+    samples[5]['node_tree'] = [{'meta_user': {'large': 'x' * 1000}}]
+    with patch('sample_uploader.utils.sample_utils.http_session.post', side_effect=fake_post):
+        errors = validate_samples(samples, 'sample_url', 'token', chunk_size=3,
+                                  max_bytes=500, max_workers=3)
+    # large samples are sent alone
+    assert sorted(requests_samples) == [['bad0', 's1', 's2'], ['s3', 'bad4'], ['s5'],
+                                        ['s6', 's7', 'bad8'], ['s9']]
+    # errors are returned in sample order
+    assert [(e['sample_name'], e['key'], e['subkey']) for e in errors] == [
+        ('bad0', 'depth', 'value'), ('bad4', 'depth', 'value'), ('bad8', 'depth', 'value')]
+
+    requests_samples.clear()
+    with patch('sample_uploader.utils.sample_utils.http_session.post', side_effect=fake_post):
+        errors = validate_samples(samples, 'sample_url', 'token', chunk_size=2,
+                                  max_workers=1, max_errors=1)
+    # no further requests are sent once the error limit is reached
+    assert requests_samples == [['bad0', 's1']]
+    assert [e['sample_name'] for e in errors] == ['bad0']
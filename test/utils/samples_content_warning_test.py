@@ -0,0 +1,73 @@
+import inspect
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from sample_uploader.utils.samples_content_warning import (
+    SampleContentErrors,
+    SampleContentWarning,
+    SampleContentWarningContext,
+    report_error
+)
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def test_SampleContentErrors_threads():
+
+    start_test()
+
+    errors = SampleContentErrors(max_identical=None)
+
+    def _add(idx):
+        severity = 'error' if idx % 2 else 'warning'
+        errors.add(SampleContentWarning('message {}'.format(idx), row=idx, severity=severity))
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_add, range(1000)))
+    assert len(errors) == 1000
+    assert sorted(e.row for e in errors.get()) == list(range(1000))
+    assert sorted(e.row for e in errors.get(severity='error')) == list(range(1, 1000, 2))
+    assert errors.error_count == 500
+    assert not errors.stopped
+
+
+def test_SampleContentErrors_limits():
+
+    start_test()
+
+    errors = SampleContentErrors(max_identical=3, max_errors=10)
+    for row in range(5):
+        errors.add(SampleContentWarning('same', row=row, severity='warning'))
+    for row in range(9):
+        errors.add(SampleContentWarning('bad value', key='depth', row=row))
+    assert not errors.stopped
+    errors.add(SampleContentWarning('other', row=9))
+    # warnings do not count towards max_errors
+    assert errors.error_count == 10
+    assert errors.stopped
+
+    assert [e.toJSONable()['message'] for e in errors.get(severity='warning')] == [
+        'same', 'same', 'same', 'same (2 more warnings with this message are not shown)']
+    assert [(e.message, e.row) for e in errors.get(severity='error')] == [
+        ('bad value', 0), ('bad value', 1), ('bad value', 2), ('other', 9),
+        ('bad value (6 more errors with this message are not shown)', None)]
+    assert len(errors) == 9
+
+
+def test_SampleContentWarningContext():
+
+    start_test()
+
+    with SampleContentWarningContext() as errors:
+        report_error(SampleContentWarning('warned', severity='warning'))
+        report_error(SampleContentWarning('added'), errors)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            warnings.warn('unrelated')
+        warnings.warn(SampleContentWarning('raised', row=1))
+    assert [e.message for e in errors.get()] == ['warned', 'added', 'raised']
+    assert [e.message for e in errors.get(severity='error')] == ['added', 'raised']
+    assert str(caught[0].message) == 'unrelated'
@@ -0,0 +1,81 @@
+import inspect
+import json
+import logging
+import time
+
+from sample_uploader.utils.stage_timer import ServiceCalls, StageTimer
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def test_StageTimer():
+
+    start_test()
+
+    calls = ServiceCalls()
+    timer = StageTimer(calls)
+    with timer.stage('load_file'):
+        time.sleep(0.02)
+    for _ in range(3):
+        with timer.stage('produce_samples'):
+            calls.add('SampleService', 2)
+            with timer.stage('ontology_transforms'):
+                calls.add('OntologyAPI')
+    try:
+        with timer.stage('save_samples'):
+            calls.add('SampleService')
+            raise RuntimeError('failed')
+    except RuntimeError:
+        pass
+
+    stages = timer.toJSONable()
+    assert [s['stage'] for s in stages] == [
+        'load_file', 'produce_samples', 'ontology_transforms', 'save_samples']
+    assert stages[0]['seconds'] >= 0.02
+    assert [s['count'] for s in stages] == [1, 3, 3, 1]
+    # nested stages are included in the calls of the outer stage
+    assert [s['calls'] for s in stages] == [
+        {},
+        {'SampleService': 6, 'OntologyAPI': 3},
+        {'OntologyAPI': 3},
+        {'SampleService': 1}
+    ]
+    assert calls.counts() == {'SampleService': 7, 'OntologyAPI': 3}
+    assert timer.summary().split('\n')[1].endswith('3 OntologyAPI calls, 6 SampleService calls')
+
+
+def test_StageTimer_add():
+
+    start_test()
+
+    calls = ServiceCalls()
+    timer = StageTimer(calls)
+    with timer.stage('ontology_transforms'):
+        calls.add('OntologyAPI')
+    # the time of rows measured by the caller, without counting their calls
+    calls.add('OntologyAPI')
+    timer.add('ontology_transforms', 0.25)
+    timer.add('build_samples', 0.5, count=0)
+
+    stages = timer.toJSONable()
+    assert [s['stage'] for s in stages] == ['ontology_transforms', 'build_samples']
+    assert stages[0]['seconds'] >= 0.25
+    assert [s['count'] for s in stages] == [2, 0]
+    assert [s['calls'] for s in stages] == [{'OntologyAPI': 1}, {}]
+
+
+def test_StageTimer_log(caplog):
+
+    start_test()
+
+    timer = StageTimer(ServiceCalls())
+    with timer.stage('error_ui'):
+        pass
+    with caplog.at_level(logging.INFO):
+        timer.log('import_samples')
+    record = json.loads(caplog.records[-1].getMessage())
+    assert record['method'] == 'import_samples'
+    assert record['stages'] == timer.toJSONable()
@@ -0,0 +1,117 @@
+import inspect
+import pandas as pd
+
+from sample_uploader.utils.verifiers import MetadataValidator
+
+VALIDATORS = {
+    'depth': {'validators': [
+        {'callable_builder': 'units', 'parameters': {'key': 'units', 'units': 'm'}},
+        {'callable_builder': 'number', 'parameters': {'keys': 'value', 'gte': 0, 'lt': 100}},
+    ]},
+    'count': {'validators': [
+        {'callable_builder': 'number', 'parameters': {'keys': ['value'], 'type': 'int'}},
+    ]},
+    'weight': {'validators': [
+        {'callable_builder': 'number', 'parameters': {'keys': 'value', 'required': True}},
+    ]},
+    'material': {'validators': [
+        {'callable_builder': 'enum', 'parameters': {'allowed-values': ['Soil', 'Rock']}},
+        {'callable_builder': 'string', 'parameters': {'max-len': 4}},
+    ]},
+    'biome': {'validators': [
+        {'callable_builder': 'ontology_has_ancestor', 'parameters': {'ontology': 'envo_ontology'}},
+    ]},
+}
+
+
+def start_test():
+    testname = inspect.stack()[1][3]
+    print('\n*** starting test: ' + testname + ' **')
+
+
+def _fields(**fields):
+    return {field: pd.Series(values, index=[0, 2, 3, 5], dtype=object)
+            for field, values in fields.items()}
+
+
+def test_MetadataValidator():
+
+    start_test()
+
+    validator = MetadataValidator(VALIDATORS)
+    # checks that need other services are left to SampleService
+    assert 'biome' not in validator.checks
+
+    errors = validator.validate('depth', _fields(value=[1.0, -1.0, 'deep', 100], units=['m'] * 4))
+    assert errors == [
+        ([3], 'value', 'Metadata value at key value is not an accepted number type'),
+        ([2, 5], 'value', 'Metadata value at key value is not within the range [0, 100)'),
+    ]
+
+    errors = validator.validate('depth', _fields(value=[1.0] * 4, units=['m', 'ft', 'kg', None]))
+    assert errors == [
+        ([3], 'units', "Units at key units, 'kg', are not equivalent to required units, 'm'"),
+    ]
+
+    errors = validator.validate('weight', _fields(value=[1.0, None, 2, 3]))
+    assert errors == [([2], 'value', 'Required key value is missing')]
+    # the samples are known from any field when 'value' is missing
+    errors = validator.validate('weight', _fields(units=['g'] * 4))
+    assert errors == [([0, 2, 3, 5], 'value', 'Required key value is missing')]
+
+    errors = validator.validate('count', _fields(value=[1.0, 2.5, None, True]))
+    assert errors == [
+        ([5], 'value', 'Metadata value at key value is not an accepted number type'),
+        ([2], 'value', 'Metadata value at key value is not an integer'),
+    ]
+
+    errors = validator.validate('material', _fields(value=['Soil', 'Rocks', 'Rock', 7]))
+    assert errors == [
+        ([2, 5], 'value', 'Metadata value at key value is not in the allowed list of values'),
+        ([5], 'value', 'Metadata value at key value is not a string'),
+        ([2], 'value', 'Metadata value at key value is longer than max length of 4'),
+    ]
+
+    assert validator.validate('other', _fields(value=[1, 2, 3, 4])) == []
+
+
+def test_MetadataValidator_validate_samples():
+
+    start_test()
+
+    validator = MetadataValidator(VALIDATORS)
+    samples = [{
+        'name': name,
+        'node_tree': [{'id': name, 'meta_controlled': meta_controlled}]
+    } for name, meta_controlled in [
+        ('s1', {'depth': {'value': 5.0, 'units': 'm'}, 'material': {'value': 'Soil'}}),
+        ('s2', {'count': {'value': 1.5}, 'biome': {'value': 'ENVO:00000446'}}),
+        ('s3', {'depth': {'value': 200.0, 'units': 'm'}, 'count': {'value': 3.0}}),
+    ]]
+    assert validator.validate_samples(samples) == [{
+        'message': 'Validation failed: "Metadata value at key value is not an integer"',
+        'dev_message': 'Metadata value at key value is not an integer',
+        'sample_name': 's2',
+        'node': 's2',
+        'key': 'count',
+        'subkey': 'value'
+    }, {
+        'message': 'Validation failed: '
+                   '"Metadata value at key value is not within the range [0, 100)"',
+        'dev_message': 'Metadata value at key value is not within the range [0, 100)',
+        'sample_name': 's3',
+        'node': 's3',
+        'key': 'depth',
+        'subkey': 'value'
+    }]
+
+
+def test_star_import():
+
+    start_test()
+
+    # mappings.py does `from .verifiers import *`, only the column verifiers are exported
+    from sample_uploader.utils import mappings
+    for name in ['pint', 'operator', 'MetadataValidator', 'metadata_checks']:
+        assert not hasattr(mappings, name)
+    assert mappings.is_numeric and mappings.verifiers